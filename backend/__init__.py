@@ -0,0 +1 @@
+# Shared backend helpers for the MarketLens dashboard and the scripts/ pipeline.
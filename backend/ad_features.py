@@ -0,0 +1,202 @@
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+# Raw ad columns that ad_campaign_analysis.py one-hot encodes with
+# pd.get_dummies(drop_first=True); everything else is passed through as a number
+CATEGORICAL = ["gender", "device_type", "ad_position", "browsing_history", "time_of_day"]
+
+# Same fill as clean_data.clean_ads_chunk
+DEFAULTS = {"time_of_day": "Unknown"}
+
+# Hashed layouts spread categories over this many columns by default
+HASH_FEATURES = 2 ** 18
+
+
+def _column_values(df, column):
+    values = df[column]
+    return values.fillna(DEFAULTS[column]) if column in DEFAULTS else values
+
+
+def _slot_index(values, lookup):
+    """Map every value to a column index (-1 = no column) via its distinct values.
+
+    ``lookup`` turns the array of distinct values into their column indices,
+    so per-value Python work is bounded by the cardinality, not the row count.
+    """
+    codes, uniques = pd.factorize(values)
+    table = np.append(np.asarray(lookup(np.asarray(uniques, dtype=object)), dtype="int64"), -1)
+    return table[codes]  # code -1 (missing) picks the trailing -1
+
+
+def _csr(n_rows, n_cols, parts):
+    """CSR straight from per-group (column index, value) arrays, one entry per row.
+
+    Every feature group contributes at most one value per row, so the groups
+    stack into fixed-width (rows x groups) arrays; a -1 index marks "no
+    value". Skipping the COO intermediate keeps the peak close to the result.
+    """
+    if not parts:
+        return sparse.csr_matrix((n_rows, n_cols), dtype="float32")
+    index_type = np.int32 if n_cols < 2 ** 31 else np.int64
+    idx = np.empty((n_rows, len(parts)), dtype=index_type)
+    vals = np.empty((n_rows, len(parts)), dtype="float32")
+    for j, (cols, values) in enumerate(parts):
+        idx[:, j] = cols
+        vals[:, j] = values
+    keep = idx >= 0
+    indptr = np.zeros(n_rows + 1, dtype=index_type)
+    np.cumsum(keep.sum(axis=1), out=indptr[1:])
+    # float32 is what the tree models train on, so fit() does not copy to convert
+    return sparse.csr_matrix((vals[keep], idx[keep], indptr), shape=(n_rows, n_cols))
+
+
+def _numeric_parts(df, numeric):
+    parts = []
+    for name, i in numeric:
+        values = df[name].to_numpy(dtype="float64")
+        parts.append((np.where(values != 0, i, -1), values))
+    return parts
+
+
+class OneHotLayout:
+    """Fixed encoder for the trained feature columns.
+
+    Built once from the model's feature list (e.g. ``gender_Male``,
+    ``device_type_Mobile``), so every call produces exactly that column
+    layout. Unseen or dropped-first categories encode as all zeros, which is
+    what get_dummies gives the baseline level.
+    """
+
+    def __init__(self, feature_columns, categorical=CATEGORICAL):
+        self.features = [str(f) for f in feature_columns]
+        self.numeric = []
+        self.slots = {}
+        for i, name in enumerate(self.features):
+            for column in categorical:
+                if name.startswith(column + "_"):
+                    self.slots.setdefault(column, {})[name[len(column) + 1:]] = i
+                    break
+            else:
+                self.numeric.append((name, i))
+
+    def encode(self, records):
+        """Dense float matrix for a list of raw impression dicts."""
+        X = np.zeros((len(records), len(self.features)))
+        for row, record in enumerate(records):
+            for name, i in self.numeric:
+                X[row, i] = float(record[name])
+            for column, slots in self.slots.items():
+                i = slots.get(record.get(column, DEFAULTS.get(column)))
+                if i is not None:
+                    X[row, i] = 1.0
+        return X
+
+    def _slots_for(self, df, column):
+        slots = self.slots[column]
+        return _slot_index(_column_values(df, column), lambda uniques: [slots.get(str(v), -1) for v in uniques])
+
+    def encode_frame(self, df):
+        """Vectorized dense ``encode`` for a raw frame."""
+        X = np.zeros((len(df), len(self.features)))
+        for name, i in self.numeric:
+            X[:, i] = df[name].to_numpy(dtype="float64")
+        for column in self.slots:
+            idx = self._slots_for(df, column)
+            hit = np.flatnonzero(idx >= 0)
+            X[hit, idx[hit]] = 1.0
+        return X
+
+    def encode_sparse(self, df):
+        """CSR matrix for a raw frame: at most one stored value per numeric and categorical column."""
+        # Numeric columns come first and dummies follow in column order, so
+        # the indices within each row are already sorted
+        parts = _numeric_parts(df, self.numeric)
+        for column in self.slots:
+            parts.append((self._slots_for(df, column), 1.0))
+        return _csr(len(df), len(self.features), parts)
+
+    def describe(self):
+        return self.features
+
+    def frame(self, X):
+        if sparse.issparse(X):
+            X = X.toarray()
+        df = pd.DataFrame(X, columns=self.features)
+        # Dummy columns back to bool, the dtype get_dummies writes
+        dummies = [self.features[i] for slots in self.slots.values() for i in slots.values()]
+        df[dummies] = df[dummies].astype(bool)
+        return df
+
+
+def build_layout(df, categorical=CATEGORICAL, drop_first=True):
+    """OneHotLayout learned from training rows, in pd.get_dummies column order.
+
+    Non-categorical columns come first, then each categorical column's levels
+    (sorted, or in category order for categorical dtype), minus the first.
+    """
+    numeric = [c for c in df.columns if c not in categorical]
+    dummies = []
+    for column in df.columns:
+        if column not in categorical:
+            continue
+        values = _column_values(df, column)
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            levels = list(values.cat.categories)
+        else:
+            levels = sorted(values.dropna().unique())
+        dummies += [f"{column}_{level}" for level in levels[1 if drop_first else 0:]]
+    return OneHotLayout(numeric + dummies, categorical)
+
+
+class HashedLayout:
+    """Hashing encoder for unbounded categories (user ids, placements, combos).
+
+    Numeric columns keep the first columns; every ``column=value`` token is
+    hashed into one of ``n_features`` further columns, so new levels need no
+    refit and memory does not grow with cardinality. Collisions are the price.
+    """
+
+    def __init__(self, n_features=HASH_FEATURES, numeric=("age",), categorical=CATEGORICAL):
+        self.n_features = n_features
+        self.categorical = list(categorical)
+        self.numeric = [(name, i) for i, name in enumerate(numeric)]
+        self.offset = len(self.numeric)
+
+    @property
+    def features(self):
+        return [name for name, _ in self.numeric] + [f"hash_{i}" for i in range(self.n_features)]
+
+    def describe(self):
+        # What the registry stores instead of 2**18 column names
+        return [name for name, _ in self.numeric] + [f"hash_0..{self.n_features - 1}"]
+
+    def _hash(self, column, values):
+        tokens = np.array([f"{column}={v}" for v in values], dtype=object)
+        return self.offset + (pd.util.hash_array(tokens) % np.uint64(self.n_features)).astype("int64")
+
+    def encode_sparse(self, df):
+        parts = _numeric_parts(df, self.numeric)
+        for column in self.categorical:
+            if column not in df.columns:
+                continue
+            idx = _slot_index(_column_values(df, column), lambda uniques, column=column: self._hash(column, uniques))
+            parts.append((idx, 1.0))
+        # Hashed columns are unordered and two tokens can land on the same
+        # one; sum_duplicates sorts each row and adds those up
+        X = _csr(len(df), self.offset + self.n_features, parts)
+        X.sum_duplicates()
+        return X
+
+    def encode(self, records):
+        """CSR matrix for a list of raw impression dicts."""
+        return self.encode_sparse(pd.DataFrame.from_records(records, columns=[n for n, _ in self.numeric] + self.categorical))
+
+
+def layout_from_meta(meta):
+    """Rebuild the encoder a registered ad model was trained with."""
+    n_hashed = meta.get("params", {}).get("hash_features")
+    if n_hashed:
+        numeric = [f for f in meta["features"] if not f.startswith("hash_")]
+        return HashedLayout(n_hashed, numeric)
+    return OneHotLayout(meta["features"])
@@ -0,0 +1,208 @@
+import os
+
+import pandas as pd
+
+# pyarrow is optional: without it every artifact is plain CSV, as before
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+PROCESSED_PATH = "data/processed"
+
+
+def artifact_paths(name, directory=PROCESSED_PATH):
+    base = os.path.join(directory, name)
+    return f"{base}.csv", f"{base}.parquet"
+
+
+def _arrow_safe(df):
+    # Columns mixing strings and numbers (e.g. Rotation's group header rows)
+    # can't become a single Arrow type, so store their values as text
+    df = df.copy()
+    for col in df.columns:
+        if df[col].dtype == object and pd.api.types.infer_dtype(df[col], skipna=True).startswith("mixed"):
+            df[col] = df[col].where(df[col].isna(), df[col].astype(str))
+    return df
+
+
+class ArtifactWriter:
+    """Stream DataFrame chunks into ``<name>.csv`` and ``<name>.parquet``.
+
+    Each chunk is appended as it arrives (one Parquet row group per chunk), so
+    memory use depends on the chunk size, not on the size of the dataset.
+    """
+
+    def __init__(self, name, directory=PROCESSED_PATH, write_csv=True, append=False):
+        os.makedirs(directory, exist_ok=True)
+        self.csv_path, self.parquet_path = artifact_paths(name, directory)
+        self.rows = 0
+        appending = append and os.path.exists(self.csv_path) and os.path.getsize(self.csv_path) > 0
+        # Size and times of the CSV being appended to, so a failed append can
+        # be rolled back (see __exit__)
+        self._csv_before = os.stat(self.csv_path) if appending and write_csv else None
+        mode = "a" if appending else "w"
+        self._csv = open(self.csv_path, mode, newline="", encoding="utf-8") if write_csv else None
+        self._header = not appending
+        self._parquet = None
+        self._schema = None
+        self._columnar = pq is not None
+        # Parquet is built under a temp name, so readers never see a half-written
+        # file and a stale copy never outlives a fresh CSV
+        self._parquet_tmp = self.parquet_path + ".tmp"
+        if appending and self._columnar:
+            self._carry_over_columnar()
+        elif os.path.exists(self.parquet_path):
+            os.remove(self.parquet_path)
+
+    def _carry_over_columnar(self):
+        # Parquet can't be appended in place: copy the existing row groups over
+        # as-is (no parsing or cleaning) and add the new chunks after them
+        if not os.path.exists(self.parquet_path):
+            # A Parquet file holding only the new rows would be incomplete
+            self._columnar = False
+            return
+        existing = pq.ParquetFile(self.parquet_path)
+        self._schema = existing.schema_arrow
+        self._parquet = pq.ParquetWriter(self._parquet_tmp, self._schema)
+        for i in range(existing.num_row_groups):
+            self._parquet.write_table(existing.read_row_group(i))
+
+    @property
+    def output_path(self):
+        return self.parquet_path if self._columnar else self.csv_path
+
+    def write(self, df, csv_text=None):
+        """Append ``df``; ``csv_text`` is its header-less CSV if already rendered."""
+        if self._csv is not None:
+            if csv_text is None:
+                df.to_csv(self._csv, header=self._header, index=False)
+            else:
+                if self._header:
+                    df.head(0).to_csv(self._csv, index=False)
+                self._csv.write(csv_text)
+        self._header = False
+        self.rows += len(df)
+        if self._columnar:
+            self._write_columnar(df)
+
+    def _write_columnar(self, df):
+        table = pa.Table.from_pandas(_arrow_safe(df), preserve_index=False)
+        if self._parquet is None:
+            self._schema = table.schema
+            self._parquet = pq.ParquetWriter(self._parquet_tmp, self._schema)
+        elif not table.schema.equals(self._schema, check_metadata=False):
+            try:
+                table = table.cast(self._schema)
+            except (pa.ArrowInvalid, pa.ArrowNotImplementedError) as e:
+                # A later chunk doesn't fit the types inferred from the first
+                # one; keep the CSV and drop the columnar copy
+                print(f"\u26A0\uFE0F Skipping Parquet for {self.parquet_path}: {e}")
+                self._abort_columnar()
+                return
+        self._parquet.write_table(table)
+
+    def _abort_columnar(self, keep_existing=False):
+        self._parquet.close()
+        os.remove(self._parquet_tmp)
+        if not keep_existing and os.path.exists(self.parquet_path):
+            os.remove(self.parquet_path)
+        self._parquet = None
+        self._columnar = False
+
+    def close(self):
+        if self._csv is not None:
+            self._csv.close()
+        if self._parquet is not None:
+            self._parquet.close()
+            os.replace(self._parquet_tmp, self.parquet_path)
+            self._parquet = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+            return
+        appending = self._csv_before is not None
+        if self._parquet is not None:
+            # When appending, the old Parquet still matches the old CSV
+            self._abort_columnar(keep_existing=appending)
+        self.close()
+        if appending:
+            # Cut the CSV back to what it held before this run and restore its
+            # mtime, so the next incremental run doesn't append the rows twice
+            # and the old Parquet copy isn't treated as stale
+            with open(self.csv_path, "r+b") as f:
+                f.truncate(self._csv_before.st_size)
+            os.utime(self.csv_path, ns=(self._csv_before.st_atime_ns, self._csv_before.st_mtime_ns))
+
+
+def save_artifact(df, name, directory=PROCESSED_PATH, index=False, write_csv=True):
+    """Write ``df`` as ``<name>.parquet`` (typed, columnar) and ``<name>.csv``.
+
+    With ``index=True`` the index is stored as a regular column in both files,
+    so CSV and Parquet readers see the same frame.
+    """
+    if index:
+        df = df.reset_index()
+    with ArtifactWriter(name, directory, write_csv=write_csv) as writer:
+        writer.write(df)
+    return writer.output_path
+
+
+def columnar_path(csv_path):
+    """Return the Parquet sibling of ``csv_path`` if it exists and is up to date."""
+    if pq is None:
+        return None
+    parquet_path = os.path.splitext(csv_path)[0] + ".parquet"
+    if not os.path.exists(parquet_path):
+        return None
+    if os.path.exists(csv_path) and os.path.getmtime(csv_path) > os.path.getmtime(parquet_path):
+        return None
+    return parquet_path
+
+
+def read_table(path, columns=None, memory_map=False, **csv_kwargs):
+    """Read a Parquet or CSV file, loading only ``columns`` when given.
+
+    ``memory_map`` maps the Parquet file instead of reading it into a buffer;
+    ``csv_kwargs`` only apply to the CSV path.
+    """
+    if path.endswith(".parquet"):
+        table = pq.read_table(path, columns=columns, memory_map=memory_map)
+        return table.to_pandas()
+    if columns is None:
+        return pd.read_csv(path, **csv_kwargs)
+    return pd.read_csv(path, usecols=columns, **csv_kwargs)[list(columns)]
+
+
+def resolve_artifact(path):
+    """Map a CSV path to the file that should actually be read."""
+    if path.endswith(".csv"):
+        return columnar_path(path) or path
+    return path
+
+
+def load_artifact(name, columns=None, memory_map=False, directory=PROCESSED_PATH, **csv_kwargs):
+    csv_path, _ = artifact_paths(name, directory)
+    return read_table(resolve_artifact(csv_path), columns=columns, memory_map=memory_map, **csv_kwargs)
+
+
+def iter_artifact(name, chunksize, columns=None, directory=PROCESSED_PATH, **csv_kwargs):
+    """Yield an artifact in frames of about ``chunksize`` rows.
+
+    Parquet is streamed batch by batch; the CSV fallback uses ``read_csv``
+    chunks, so neither path holds the whole file in memory.
+    """
+    csv_path, _ = artifact_paths(name, directory)
+    path = resolve_artifact(csv_path)
+    if path.endswith(".parquet"):
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunksize, columns=columns):
+            yield batch.to_pandas()
+        return
+    for chunk in pd.read_csv(path, chunksize=chunksize, usecols=columns, **csv_kwargs):
+        yield chunk if columns is None else chunk[list(columns)]
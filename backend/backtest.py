@@ -0,0 +1,128 @@
+import os
+import time
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+from statsmodels.tools.sm_exceptions import ConvergenceWarning
+from statsmodels.tsa.holtwinters import ExponentialSmoothing
+
+from backend.batch_forecast import forecast_matrix
+
+# Candidate model configurations; "hw_add_7" is what sales_forecasting.py uses
+CONFIGS = {
+    "hw_add_7": {"trend": "add", "seasonal": "add", "seasonal_periods": 7},
+    "hw_damped_7": {"trend": "add", "damped_trend": True, "seasonal": "add", "seasonal_periods": 7},
+    "hw_mul_7": {"trend": "add", "seasonal": "mul", "seasonal_periods": 7},
+    "holt": {"trend": "add"},
+    "ses": {},
+}
+
+
+def rolling_origins(n_obs, initial, horizon, step):
+    """Training-set sizes for each fold: every fold forecasts ``horizon`` unseen points."""
+    return list(range(initial, n_obs - horizon + 1, step))
+
+
+def error_metrics(actual, predicted):
+    actual = np.asarray(actual, dtype="float64")
+    predicted = np.asarray(predicted, dtype="float64")
+    error = actual - predicted
+    nonzero = actual != 0
+    mape = np.abs(error[nonzero] / actual[nonzero]).mean() * 100 if nonzero.any() else np.nan
+    return mape, np.sqrt(np.mean(error ** 2))
+
+
+def _run_fold(task):
+    config_name, metric, values, origin, horizon = task
+    train, test = values[:origin], values[origin:origin + horizon]
+    row = {"config": config_name, "metric": metric, "origin": origin}
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        # A fit whose optimizer didn't converge has unreliable parameters;
+        # raise it so the fold is recorded as failed rather than scored
+        warnings.simplefilter("error", ConvergenceWarning)
+        try:
+            start = time.perf_counter()
+            fit = ExponentialSmoothing(train, **CONFIGS[config_name]).fit()
+            fit_seconds = time.perf_counter() - start
+
+            start = time.perf_counter()
+            predicted = fit.forecast(horizon)
+            predict_seconds = time.perf_counter() - start
+        except (ValueError, np.linalg.LinAlgError, ConvergenceWarning) as e:
+            # e.g. multiplicative seasonality on a series with zeros/negatives,
+            # a singular system in the initialization, or no convergence
+            row.update({"mape": np.nan, "rmse": np.nan, "fit_seconds": np.nan,
+                        "predict_seconds": np.nan, "error": str(e)})
+            return row
+
+    mape, rmse = error_metrics(test, predicted)
+    row.update({"mape": mape, "rmse": rmse, "fit_seconds": fit_seconds,
+                "predict_seconds": predict_seconds, "error": None})
+    return row
+
+
+def summarize(folds):
+    """Average accuracy and compute cost per configuration, best MAPE first."""
+    summary = folds.groupby("config").agg(
+        folds=("origin", "size"),
+        scored=("mape", "count"),
+        mape=("mape", "mean"),
+        rmse=("rmse", "mean"),
+        fit_seconds=("fit_seconds", "mean"),
+        predict_seconds=("predict_seconds", "mean"),
+    )
+    summary.insert(1, "failed", summary.pop("folds") - summary["scored"])
+    return summary.sort_values("mape")
+
+
+def backtest(df, metrics, configs=None, initial=180, horizon=30, step=14, workers=None):
+    """Rolling-origin evaluation of every config on every metric column.
+
+    Folds run in a process pool. Returns (per-fold results, per-config summary).
+    """
+    configs = configs or list(CONFIGS)
+    tasks = []
+    for metric in metrics:
+        values = df[metric].to_numpy(dtype="float64")
+        for origin in rolling_origins(len(values), initial, horizon, step):
+            for config_name in configs:
+                tasks.append((config_name, metric, values, origin, horizon))
+
+    workers = workers or os.cpu_count()
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_run_fold, tasks, chunksize=max(1, len(tasks) // (workers * 4))))
+    else:
+        results = [_run_fold(task) for task in tasks]
+
+    folds = pd.DataFrame(results)
+    return folds, summarize(folds)
+
+
+def backtest_matrix(y, season, initial, horizon, step=1):
+    """Rolling-origin evaluation of the vectorized engine over a (series x period) matrix.
+
+    Every fold fits all series at once, so folds run serially here; the
+    per-fold work is already vectorized across series.
+    """
+    results = []
+    for origin in rolling_origins(y.shape[1], initial, horizon, step):
+        start = time.perf_counter()
+        predicted, _ = forecast_matrix(y[:, :origin], horizon, season)
+        elapsed = time.perf_counter() - start
+        mape, rmse = error_metrics(y[:, origin:origin + horizon], predicted)
+        results.append({
+            "config": "batch_hw",
+            "metric": "per_series",
+            "origin": origin,
+            "mape": mape,
+            "rmse": rmse,
+            "fit_seconds": elapsed,
+            "predict_seconds": 0.0,
+            "error": None,
+        })
+    folds = pd.DataFrame(results)
+    return folds, summarize(folds)
@@ -0,0 +1,129 @@
+import itertools
+import math
+import time
+
+import numpy as np
+import pandas as pd
+
+# Smoothing parameters tried for every series; each combination is one
+# vectorized pass over the whole (series x period) matrix
+ALPHAS = [0.1, 0.3, 0.5]
+BETAS = [0.0, 0.05, 0.2]
+GAMMAS = [0.0, 0.1, 0.3]
+
+# Season length (in periods) used for each data frequency
+SEASONS = {"D": 7, "W": 52, "M": 12}
+
+
+def build_matrix(df, key, value, date="Date", freq=None):
+    """Pivot long sales rows into a dense (series x period) float matrix.
+
+    Missing periods are filled with 0 (no sales). ``freq`` defaults to the
+    frequency inferred from the dates, e.g. "D" for daily exports or "MS" for
+    the monthly SELL_1 sample.
+    """
+    dates = pd.DatetimeIndex(df[date].dropna().unique()).sort_values()
+    freq = freq or pd.infer_freq(dates) or "D"
+    periods = pd.date_range(dates[0], dates[-1], freq=freq)
+    matrix = df.pivot_table(index=key, columns=date, values=value, aggfunc="sum", fill_value=0.0)
+    matrix = matrix.reindex(columns=periods, fill_value=0.0)
+    return matrix.to_numpy(dtype="float64"), matrix.index, periods
+
+
+# The recursions below work on time-major (period x series) arrays so each
+# step reads one contiguous row instead of a strided column
+
+
+def _initial_state(y, season):
+    n = y.shape[1]
+    if season:
+        level = y[:season].mean(axis=0)
+        trend = (y[season:2 * season].mean(axis=0) - level) / season
+        seasonal = y[:season] - level
+    else:
+        level = y[0].copy()
+        trend = y[1] - y[0] if y.shape[0] > 1 else np.zeros(n)
+        seasonal = np.zeros((1, n))
+    return level, trend, seasonal
+
+
+def _smooth(y, alpha, beta, gamma, season):
+    """Run additive Holt-Winters over every column of ``y`` for one parameter set."""
+    level, trend, seasonal = _initial_state(y, season)
+    sse = np.zeros(y.shape[1])
+    m = seasonal.shape[0]
+    for t in range(y.shape[0]):
+        s = seasonal[t % m]
+        error = y[t] - (level + trend + s)
+        sse += error * error
+        new_level = alpha * (y[t] - s) + (1 - alpha) * (level + trend)
+        if season:
+            seasonal[t % m] = gamma * (y[t] - level - trend) + (1 - gamma) * s
+        trend = beta * (new_level - level) + (1 - beta) * trend
+        level = new_level
+    return sse, level, trend, seasonal
+
+
+def forecast_matrix(y, horizon, season=7):
+    """Forecast ``horizon`` periods for every row of the (series x period) ``y``.
+
+    Each series keeps the (alpha, beta, gamma) from the grid with the lowest
+    in-sample one-step SSE. Seasonality is dropped when there are fewer than
+    two full seasons of history.
+    """
+    n, t = y.shape
+    if season and t < 2 * season:
+        season = 0
+    gammas = GAMMAS if season else [0.0]
+    y = np.ascontiguousarray(y.T)
+
+    best_sse = np.full(n, np.inf)
+    best_level = np.zeros(n)
+    best_trend = np.zeros(n)
+    best_seasonal = np.zeros((max(season, 1), n))
+    best_params = np.zeros((n, 3))
+
+    for alpha, beta, gamma in itertools.product(ALPHAS, BETAS, gammas):
+        sse, level, trend, seasonal = _smooth(y, alpha, beta, gamma, season)
+        better = sse < best_sse
+        best_sse[better] = sse[better]
+        best_level[better] = level[better]
+        best_trend[better] = trend[better]
+        best_seasonal[:, better] = seasonal[:, better]
+        best_params[better] = (alpha, beta, gamma)
+
+    steps = np.arange(1, horizon + 1)
+    forecast = best_level[:, None] + best_trend[:, None] * steps
+    if season:
+        forecast += best_seasonal[(t + steps - 1) % season].T
+    return forecast, best_params
+
+
+def default_season(periods):
+    return SEASONS.get(periods.freqstr[0], 0)
+
+
+def forecast_by(df, key, value="Pquantity", horizon_days=30, season=None, date="Date", freq=None):
+    """Forecast every ``key`` series in ``df`` in one vectorized pass.
+
+    The horizon covers ``horizon_days`` (30 daily steps, or one step for
+    monthly data). Returns the forecast in the ``sales_forecast.csv`` layout
+    (``Date`` + one column per series) and the timings of the pivot and fit.
+    """
+    start = time.perf_counter()
+    y, keys, periods = build_matrix(df, key, value, date, freq)
+    pivot_seconds = time.perf_counter() - start
+
+    step = periods[1] - periods[0] if len(periods) > 1 else pd.Timedelta(days=1)
+    horizon = max(1, math.ceil(pd.Timedelta(days=horizon_days) / step))
+    season = default_season(periods) if season is None else season
+
+    start = time.perf_counter()
+    forecast, _ = forecast_matrix(y, horizon, season)
+    fit_seconds = time.perf_counter() - start
+
+    dates = pd.date_range(periods[-1], periods=horizon + 1, freq=periods.freq)[1:]
+    result = pd.DataFrame(forecast.T, columns=[str(k) for k in keys])
+    result.insert(0, "Date", dates)
+    timings = {"series": len(keys), "periods": len(periods), "pivot_seconds": pivot_seconds, "fit_seconds": fit_seconds}
+    return result, timings
@@ -0,0 +1,135 @@
+import io
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from backend.artifact_store import resolve_artifact
+
+# -- Cache limits (override with env vars on bigger boxes) --
+MAX_ENTRIES = int(os.environ.get("MARKETLENS_CHART_ENTRIES", 128))
+MAX_BYTES = int(os.environ.get("MARKETLENS_CHART_MB", 64)) * 1024 * 1024
+
+# Same output as st.pyplot's defaults, so cached charts look identical
+SAVEFIG_KWARGS = {"format": "png", "dpi": 200, "bbox_inches": "tight"}
+
+
+def dataset_fingerprint(path):
+    """(file actually read, mtime, size) for ``path``; changes whenever the data does."""
+    resolved = os.path.abspath(resolve_artifact(path))
+    stat = os.stat(resolved)
+    return resolved, stat.st_mtime_ns, stat.st_size
+
+
+def render_png(fig):
+    import matplotlib.pyplot as plt
+
+    buffer = io.BytesIO()
+    fig.savefig(buffer, **SAVEFIG_KWARGS)
+    plt.close(fig)
+    return buffer.getvalue()
+
+
+class ChartCache:
+    """Process-wide LRU cache of rendered charts (PNG bytes).
+
+    Entries are keyed on (data fingerprint, chart spec): a chart is drawn once
+    per version of its data and every later view, from any session, gets the
+    stored image without touching matplotlib.
+    """
+
+    def __init__(self, max_entries=MAX_ENTRIES, max_bytes=MAX_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._rendering = {}
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.render_seconds = 0.0
+
+    def get(self, fingerprint, spec, draw):
+        """PNG bytes for ``spec`` over ``fingerprint``; ``draw()`` returns a Figure on a miss."""
+        key = (fingerprint, spec)
+        with self._lock:
+            png = self._lookup(key)
+            if png is not None:
+                return png
+            # Only one session renders a given chart; the others wait for it
+            render_lock = self._rendering.setdefault(key, threading.Lock())
+
+        with render_lock:
+            with self._lock:
+                png = self._lookup(key, count_miss=True)
+                if png is not None:
+                    return png
+
+            start = time.perf_counter()
+            png = render_png(draw())
+            elapsed = time.perf_counter() - start
+
+            with self._lock:
+                self._store(key, png)
+                self.render_seconds += elapsed
+                self._rendering.pop(key, None)
+        return png
+
+    def _lookup(self, key, count_miss=False):
+        png = self._entries.get(key)
+        if png is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return png
+        if count_miss:
+            self.misses += 1
+        return None
+
+    def _store(self, key, png):
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._bytes -= len(old)
+        self._entries[key] = png
+        self._bytes += len(png)
+        while len(self._entries) > 1 and (
+            len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+        ):
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= len(evicted)
+            self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "cached_mb": self._bytes / (1024 * 1024),
+                "render_seconds": self.render_seconds,
+            }
+
+
+# Shared by every Streamlit session running in this process
+_charts = ChartCache()
+
+
+def cached_chart(path, spec, draw):
+    """Rendered PNG of chart ``spec`` drawn from the dataset at ``path``."""
+    return _charts.get(dataset_fingerprint(path), spec, draw)
+
+
+def chart_stats():
+    return _charts.stats()
+
+
+def clear_charts():
+    _charts.clear()
@@ -0,0 +1,190 @@
+import json
+import os
+from collections import deque
+
+import numpy as np
+import pandas as pd
+
+# Rolling competitor metrics over the daily Mock Kaggle series. Every new day
+# is folded into running window sums (amortized O(1) per window; a price
+# change also averages the days before it, a scan of at most the longest
+# window). The state is at most one window of days plus a few sums and is
+# persisted as JSON, so a daily refresh only touches the rows that arrived
+# since the last run.
+
+STATE_PATH = "data/processed/competitor_metrics_state.json"
+WINDOWS = (7, 30)
+RESPONSE_DAYS = 7  # sales compared in the 7 days before vs. after a price change
+
+CHANGE_COLUMNS = ["Date", "old_price", "new_price", "price_change_pct", "avg_sales_before", "avg_sales_after",
+                  "sales_change_pct", "response_elasticity"]
+
+RENAME = {"data": "Date", "venda": "Sales", "estoque": "Stock", "preco": "Price"}
+
+
+class RollingMetrics:
+    """Calendar-day rolling sums of sales and stock-out days plus price-change responses.
+
+    Windows are by date, not by row, so a missing day simply doesn't count.
+    """
+
+    def __init__(self, windows=WINDOWS, response_days=RESPONSE_DAYS):
+        self.windows = tuple(windows)
+        self.response_days = response_days
+        # (day number, sales, stock-out flag) for the longest window
+        self.days = deque()
+        self.sales_sum = {w: 0.0 for w in self.windows}
+        self.stockout_sum = {w: 0 for w in self.windows}
+        # Per window, how many entries at the front of ``days`` have already
+        # been subtracted (shorter windows drop days before the deque does)
+        self.expired = {w: 0 for w in self.windows}
+        self.last_date = None
+        self.last_price = None
+        self.last_change = None
+        self.open_changes = []
+        # Finished price-change responses not yet handed out by update_frame
+        self.changes = []
+
+    def _day(self, date):
+        return int(pd.Timestamp(date).value // 86_400_000_000_000)
+
+    def _mean_before(self, day, span):
+        # Mean daily sales over the ``span`` days before ``day``. This scans
+        # the deque, which never holds more than the longest window of days;
+        # it only runs when the price changes
+        sales = [s for d, s, _ in self.days if day - span <= d < day]
+        return sum(sales) / len(sales) if sales else np.nan
+
+    def update(self, date, sales, stock, price):
+        """Fold in one day; return that day's metrics as a dict."""
+        day = self._day(date)
+        sales, stock, price = float(sales), float(stock), float(price)
+        stockout = int(stock <= 0)
+        longest = max(self.windows)
+
+        self.days.append((day, sales, stockout))
+        for w in self.windows:
+            self.sales_sum[w] += sales
+            self.stockout_sum[w] += stockout
+            # Subtract days that just left this window
+            while self.expired[w] < len(self.days) and self.days[self.expired[w]][0] <= day - w:
+                _, old_sales, old_stockout = self.days[self.expired[w]]
+                self.sales_sum[w] -= old_sales
+                self.stockout_sum[w] -= old_stockout
+                self.expired[w] += 1
+        while self.days and self.days[0][0] <= day - longest:
+            self.days.popleft()
+            for w in self.windows:
+                self.expired[w] -= 1
+
+        row = {"Date": pd.Timestamp(date), "Sales": sales, "Stock": stock, "Price": price}
+        for w in self.windows:
+            days_in_window = len(self.days) - self.expired[w]
+            row[f"sales_{w}d"] = self.sales_sum[w]
+            row[f"avg_sales_{w}d"] = self.sales_sum[w] / days_in_window
+            row[f"stockout_days_{w}d"] = self.stockout_sum[w]
+
+        # Price changes: open a response window and close the ones that are done
+        row["price_change_pct"] = 0.0
+        if self.last_price is not None and price != self.last_price:
+            row["price_change_pct"] = (price - self.last_price) / self.last_price * 100
+            self.open_changes.append({
+                "Date": str(pd.Timestamp(date).date()), "day": day,
+                "old_price": self.last_price, "new_price": price,
+                "sales_before": self._mean_before(day, self.response_days),
+                "post_sales": 0.0, "post_days": 0,
+            })
+            self.last_change = day
+        for change in self.open_changes:
+            change["post_sales"] += sales
+            change["post_days"] += 1
+        for change in self.open_changes:
+            if day - change["day"] >= self.response_days - 1:
+                self.changes.append(self._response(change))
+        self.open_changes = [c for c in self.open_changes if day - c["day"] < self.response_days - 1]
+
+        row["days_since_price_change"] = float(day - self.last_change) if self.last_change is not None else np.nan
+        self.last_price = price
+        self.last_date = str(pd.Timestamp(date).date())
+        return row
+
+    def _response(self, change):
+        after = change["post_sales"] / change["post_days"]
+        price_pct = (change["new_price"] - change["old_price"]) / change["old_price"] * 100
+        sales_pct = (after / change["sales_before"] - 1) * 100 if change["sales_before"] else np.nan
+        return {
+            "Date": change["Date"],
+            "old_price": change["old_price"],
+            "new_price": change["new_price"],
+            "price_change_pct": price_pct,
+            "avg_sales_before": change["sales_before"],
+            "avg_sales_after": after,
+            "sales_change_pct": sales_pct,
+            "response_elasticity": sales_pct / price_pct,
+        }
+
+    def update_frame(self, df):
+        """Fold in every row of ``df`` newer than the state.
+
+        Returns (daily metrics frame, price-change responses that finished,
+        number of rows skipped for being no newer than the state).
+        """
+        df = df.sort_values("Date")
+        if self.last_date is not None:
+            fresh = pd.to_datetime(df["Date"]) > pd.Timestamp(self.last_date)
+            late = int((~fresh).sum())
+            df = df[fresh]
+        else:
+            late = 0
+        rows = [self.update(*values) for values in df[["Date", "Sales", "Stock", "Price"]].itertuples(index=False)]
+        columns = ["Date", "Sales", "Stock", "Price"] + [
+            f"{stat}_{w}d" for w in self.windows for stat in ("sales", "avg_sales", "stockout_days")
+        ] + ["price_change_pct", "days_since_price_change"]
+        changes = pd.DataFrame(self.changes, columns=CHANGE_COLUMNS)
+        self.changes = []
+        return pd.DataFrame(rows, columns=columns), changes, late
+
+    def to_dict(self):
+        return {
+            "windows": list(self.windows),
+            "response_days": self.response_days,
+            "days": [list(d) for d in self.days],
+            "sales_sum": {str(w): v for w, v in self.sales_sum.items()},
+            "stockout_sum": {str(w): v for w, v in self.stockout_sum.items()},
+            "expired": {str(w): v for w, v in self.expired.items()},
+            "last_date": self.last_date,
+            "last_price": self.last_price,
+            "last_change": self.last_change,
+            "open_changes": self.open_changes,
+            "changes": self.changes,
+        }
+
+    @classmethod
+    def from_dict(cls, state):
+        metrics = cls(state["windows"], state["response_days"])
+        metrics.days = deque(tuple(d) for d in state["days"])
+        metrics.sales_sum = {int(w): v for w, v in state["sales_sum"].items()}
+        metrics.stockout_sum = {int(w): v for w, v in state["stockout_sum"].items()}
+        metrics.expired = {int(w): v for w, v in state["expired"].items()}
+        metrics.last_date = state["last_date"]
+        metrics.last_price = state["last_price"]
+        metrics.last_change = state["last_change"]
+        metrics.open_changes = state["open_changes"]
+        metrics.changes = state["changes"]
+        return metrics
+
+
+def load_state(path=STATE_PATH):
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        return RollingMetrics.from_dict(json.load(f))
+
+
+def save_state(metrics, path=STATE_PATH):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(metrics.to_dict(), f)
+    os.replace(tmp_path, path)
+    return path
@@ -0,0 +1,137 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from backend.artifact_store import read_table, resolve_artifact
+
+# -- Cache limits (override with env vars on bigger boxes) --
+MAX_ENTRIES = int(os.environ.get("MARKETLENS_CACHE_ENTRIES", 16))
+MAX_BYTES = int(os.environ.get("MARKETLENS_CACHE_MB", 512)) * 1024 * 1024
+
+
+def _file_signature(path):
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _kwargs_key(read_kwargs):
+    return tuple(sorted((k, repr(v)) for k, v in read_kwargs.items()))
+
+
+class DatasetCache:
+    """Process-wide LRU cache of parsed DataFrames.
+
+    Entries are keyed on (path, mtime, size, read options), so rewriting a file
+    from the pipeline invalidates the cached copy on the next lookup.
+    """
+
+    def __init__(self, max_entries=MAX_ENTRIES, max_bytes=MAX_BYTES, reader=read_table):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.reader = reader
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._loading = {}
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.load_seconds = 0.0
+        self.last_load = {}
+
+    def get(self, path, **read_kwargs):
+        path = os.path.abspath(path)
+        key = (path, _kwargs_key(read_kwargs))
+        signature = _file_signature(path)
+
+        with self._lock:
+            entry = self._lookup(key, signature)
+            if entry is not None:
+                return entry
+            # Only one session parses a given file; the others wait for it
+            load_lock = self._loading.setdefault(key, threading.Lock())
+
+        with load_lock:
+            with self._lock:
+                entry = self._lookup(key, signature, count_miss=True)
+                if entry is not None:
+                    return entry
+
+            start = time.perf_counter()
+            df = self.reader(path, **read_kwargs)
+            elapsed = time.perf_counter() - start
+            size = int(df.memory_usage(deep=True).sum())
+
+            with self._lock:
+                self._store(key, signature, df, size)
+                self.load_seconds += elapsed
+                self.last_load[path] = elapsed
+                self._loading.pop(key, None)
+        return df
+
+    def _lookup(self, key, signature, count_miss=False):
+        cached = self._entries.get(key)
+        if cached is not None and cached[0] == signature:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return cached[1]
+        if count_miss:
+            self.misses += 1
+        return None
+
+    def _store(self, key, signature, df, size):
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._bytes -= old[2]
+        self._entries[key] = (signature, df, size)
+        self._bytes += size
+        while len(self._entries) > 1 and (
+            len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+        ):
+            _, (_, _, evicted_size) = self._entries.popitem(last=False)
+            self._bytes -= evicted_size
+            self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "cached_mb": self._bytes / (1024 * 1024),
+                "load_seconds": self.load_seconds,
+                "last_load": dict(self.last_load),
+            }
+
+
+# Shared by every Streamlit session running in this process
+_cache = DatasetCache()
+
+
+def load_dataset(path, columns=None, **read_kwargs):
+    """Return the dataset at ``path``, re-reading it only when the file changed.
+
+    A fresh Parquet artifact next to the CSV is read instead of the CSV, and
+    only ``columns`` are loaded when given. The returned frame is shared
+    between sessions, so treat it as read-only.
+    """
+    if columns is not None:
+        read_kwargs["columns"] = list(columns)
+    return _cache.get(resolve_artifact(path), **read_kwargs)
+
+
+def cache_stats():
+    return _cache.stats()
+
+
+def clear_cache():
+    _cache.clear()
@@ -0,0 +1,114 @@
+import os
+
+import numpy as np
+
+# Data reduction before plotting: a chart never draws more than its point
+# budget, so render time stays flat however long the series gets. Lines keep
+# their shape with Largest-Triangle-Three-Buckets; scatters past the budget
+# become a 2-D density grid.
+
+# Points per chart; override one with e.g. MARKETLENS_POINTS_FORECAST_LINE=5000
+POINT_BUDGETS = {
+    "forecast_line": 2_000,
+    "price_sales_scatter": 5_000,
+    "sales_history_line": 2_000,
+}
+DENSITY_BINS = 120
+
+
+def point_budget(chart):
+    return int(os.environ.get(f"MARKETLENS_POINTS_{chart.upper()}", POINT_BUDGETS[chart]))
+
+
+def lttb_indices(x, y, n_out):
+    """Indices of the ``n_out`` points LTTB keeps from (``x``, ``y``).
+
+    The first and last points always stay. The rest are split into
+    ``n_out - 2`` equal buckets; from each, the point forming the largest
+    triangle with the previously kept point and the next bucket's mean wins.
+    Buckets are chosen one after another (each depends on the last pick) but
+    the search inside a bucket is vectorized.
+    """
+    x = np.asarray(x, dtype="float64")
+    y = np.asarray(y, dtype="float64")
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    # Mean of each bucket (plus the last point as the final "next bucket")
+    sums_x = np.add.reduceat(x[1:n - 1], edges[:-1] - 1)
+    sums_y = np.add.reduceat(y[1:n - 1], edges[:-1] - 1)
+    counts = np.diff(edges)
+    mean_x = np.append(sums_x / counts, x[-1])
+    mean_y = np.append(sums_y / counts, y[-1])
+
+    keep = np.empty(n_out, dtype=np.int64)
+    keep[0], keep[-1] = 0, n - 1
+    a = 0
+    for b in range(n_out - 2):
+        lo, hi = edges[b], edges[b + 1]
+        # Twice the triangle area; the constant factor doesn't change argmax
+        area = np.abs((x[a] - mean_x[b + 1]) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (mean_y[b + 1] - y[a]))
+        a = lo + int(np.argmax(area))
+        keep[b + 1] = a
+    return keep
+
+
+def lttb(x, y, n_out):
+    """(x, y) reduced to at most ``n_out`` points with LTTB."""
+    keep = lttb_indices(x, y, n_out)
+    return np.asarray(x)[keep], np.asarray(y)[keep]
+
+
+def _bin_index(values, bins):
+    # Equal-width bins over [min, max]; the max lands in the last bin
+    low, high = values.min(), values.max()
+    if high <= low:
+        high = low + 1.0
+    edges = np.linspace(low, high, bins + 1)
+    index = ((values - low) * (bins / (high - low))).astype(np.int64)
+    return np.minimum(index, bins - 1), edges
+
+
+def density_grid(x, y, bins=DENSITY_BINS):
+    """2-D histogram of the points: (counts, x edges, y edges).
+
+    Same counts as np.histogram2d with equal-width bins, but the bin of each
+    point is computed directly and counted with one bincount, instead of a
+    binary search per point.
+    """
+    x = np.asarray(x, dtype="float64")
+    y = np.asarray(y, dtype="float64")
+    ok = np.isfinite(x) & np.isfinite(y)
+    if not ok.all():
+        x, y = x[ok], y[ok]
+    if len(x) == 0:
+        return np.zeros((bins, bins)), np.linspace(0, 1, bins + 1), np.linspace(0, 1, bins + 1)
+    x_index, x_edges = _bin_index(x, bins)
+    y_index, y_edges = _bin_index(y, bins)
+    counts = np.bincount(x_index * bins + y_index, minlength=bins * bins).reshape(bins, bins)
+    return counts.astype("float64"), x_edges, y_edges
+
+
+def plot_line(ax, x, y, budget, **kwargs):
+    """``ax.plot`` of at most ``budget`` points (LTTB when over)."""
+    x, y = lttb(x, y, budget)
+    return ax.plot(x, y, **kwargs)
+
+
+def plot_scatter(ax, x, y, budget, bins=DENSITY_BINS, scatter=None):
+    """Scatter up to ``budget`` points; past that, a density grid of counts.
+
+    ``scatter()`` draws the points when under budget (default ``ax.scatter``).
+    The grid costs one pass over the data (``density_grid``: a bin index per
+    point and one np.bincount) and a fixed ``bins`` x ``bins`` draw, whatever
+    the number of points.
+    """
+    if len(x) <= budget:
+        return scatter() if scatter is not None else ax.scatter(x, y)
+    counts, x_edges, y_edges = density_grid(x, y, bins)
+    counts = np.ma.masked_equal(counts.T, 0)  # empty cells stay blank
+    mesh = ax.pcolormesh(x_edges, y_edges, counts, cmap="viridis")
+    ax.figure.colorbar(mesh, ax=ax, label=f"points per cell ({len(x):,} total)")
+    return mesh
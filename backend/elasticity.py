@@ -0,0 +1,116 @@
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+# Log-log price elasticity: log(quantity) = a + e * log(price), so e is the %
+# change in units sold for a 1% change in price. Every product is fitted in
+# one pass over grouped sums (np.bincount) instead of one regression each.
+
+MIN_OBS = 3
+# Prices must move by at least ~1% (std of log price); rounding-level moves
+# give absurd slopes like -3000
+MIN_PRICE_SPREAD = 0.01
+
+
+def _log_rows(df, price, quantity):
+    rows = df[(df[price] > 0) & (df[quantity] > 0)]
+    return rows, np.log(rows[price].to_numpy(dtype="float64")), np.log(rows[quantity].to_numpy(dtype="float64"))
+
+
+def _centered_sums(codes, x, y, n_groups):
+    # Two passes (means, then centred sums) so cheap products with tiny price
+    # moves don't lose their variance to cancellation
+    n = np.bincount(codes, minlength=n_groups).astype("float64")
+    mean_x = np.bincount(codes, x, n_groups) / n
+    mean_y = np.bincount(codes, y, n_groups) / n
+    dx, dy = x - mean_x[codes], y - mean_y[codes]
+    return {
+        "n": n, "mean_x": mean_x, "mean_y": mean_y,
+        "sxx": np.bincount(codes, dx * dx, n_groups),
+        "sxy": np.bincount(codes, dx * dy, n_groups),
+        "syy": np.bincount(codes, dy * dy, n_groups),
+    }
+
+
+def _estimate(sxx, sxy, syy, dof, level):
+    with np.errstate(divide="ignore", invalid="ignore"):
+        slope = sxy / sxx
+        sse = np.maximum(syy - slope * sxy, 0.0)
+        std_error = np.sqrt(sse / dof / sxx)
+        r2 = np.where(syy > 0, 1 - sse / syy, np.nan)
+    margin = stats.t.ppf(0.5 + level / 2, np.maximum(dof, 1)) * std_error
+    return pd.DataFrame({
+        "elasticity": slope,
+        "std_error": std_error,
+        "ci_low": slope - margin,
+        "ci_high": slope + margin,
+        "r2": r2,
+    })
+
+
+def product_elasticities(df, product="PKod", price="pce_sb", quantity="Pquantity", level=0.95, min_obs=MIN_OBS):
+    """Log-log elasticity with a ``level`` confidence interval for every product.
+
+    Products with fewer than ``min_obs`` priced sales, a price that barely
+    moved (``MIN_PRICE_SPREAD``) or an exact fit (e.g. two prices, repeated
+    sales identical) have no usable interval and are left out.
+    """
+    rows, x, y = _log_rows(df, price, quantity)
+    codes, keys = pd.factorize(rows[product], sort=True)
+    sums = _centered_sums(codes, x, y, len(keys))
+
+    table = _estimate(sums["sxx"], sums["sxy"], sums["syy"], sums["n"] - 2, level)
+    table.insert(0, product, keys)
+    table.insert(1, "n_obs", sums["n"].astype("int64"))
+    table["mean_price"] = np.exp(sums["mean_x"])
+    table["mean_quantity"] = np.exp(sums["mean_y"])
+    spread = np.sqrt(sums["sxx"] / sums["n"])
+    usable = (table["n_obs"] >= min_obs) & (spread >= MIN_PRICE_SPREAD) & (table["r2"] < 1 - 1e-9)
+    return table[usable].reset_index(drop=True)
+
+
+def group_elasticities(df, group="Pgroup", product="PKod", price="pce_sb", quantity="Pquantity", level=0.95,
+                       min_obs=MIN_OBS):
+    """One elasticity per group, pooled over its products' own price moves.
+
+    Each product keeps its own baseline (product fixed effects), so the
+    estimate comes only from price changes within a product, never from
+    cheap vs. expensive products in the same group. Built by summing the
+    per-product centred sums, so it costs nothing beyond the product pass.
+    """
+    rows, x, y = _log_rows(df, price, quantity)
+    codes, keys = pd.factorize(rows[product], sort=True)
+    sums = _centered_sums(codes, x, y, len(keys))
+    product_group = rows.groupby(codes, sort=True)[group].first().to_numpy()
+
+    group_codes, groups = pd.factorize(product_group, sort=True)
+    def total(values):
+        return np.bincount(group_codes, values, len(groups))
+
+    n_obs = total(sums["n"])
+    n_products = np.bincount(group_codes, minlength=len(groups))
+    # Each product's baseline uses up one degree of freedom
+    table = _estimate(total(sums["sxx"]), total(sums["sxy"]), total(sums["syy"]), n_obs - n_products - 1, level)
+    table.insert(0, group, groups)
+    table.insert(1, "n_obs", n_obs.astype("int64"))
+    table.insert(2, "n_products", n_products)
+    spread = np.sqrt(total(sums["sxx"]) / n_obs)
+    return table[(table["n_obs"] - table["n_products"] >= min_obs) & (spread >= MIN_PRICE_SPREAD)].reset_index(drop=True)
+
+
+def elasticity_table(df, product="PKod", group="Pgroup", price="pce_sb", quantity="Pquantity", level=0.95,
+                     min_obs=MIN_OBS):
+    """Product and group elasticities in one frame (``scope`` column tells them apart)."""
+    products = product_elasticities(df, product, price, quantity, level, min_obs)
+    names = df.drop_duplicates(product).set_index(product)[[group] + (["Pname"] if "Pname" in df.columns else [])]
+    products = products.join(names, on=product)
+    groups = group_elasticities(df, group, product, price, quantity, level, min_obs)
+
+    products.insert(0, "scope", "product")
+    groups.insert(0, "scope", "group")
+    table = pd.concat([groups, products], ignore_index=True)
+    first = ["scope", group, product] + (["Pname"] if "Pname" in df.columns else []) + ["n_obs", "n_products"]
+    table["n_products"] = table["n_products"].fillna(1).astype("int64")
+    if pd.api.types.is_integer_dtype(products[product]):
+        table[product] = table[product].astype("Int64")  # group rows have no product
+    return table[first + [c for c in table.columns if c not in first]]
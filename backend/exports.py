@@ -0,0 +1,117 @@
+import gzip
+import os
+import re
+import shutil
+import threading
+
+from backend.artifact_store import ArtifactWriter, columnar_path, iter_artifact, pq
+from backend.chart_cache import dataset_fingerprint
+
+# Download files for the dashboard's datasets. Each export is written once per
+# version of its dataset (named after the file's mtime/size), kept on disk and
+# served from there; nothing is serialized until someone actually downloads.
+
+EXPORT_DIR = os.environ.get("MARKETLENS_EXPORT_DIR", "data/exports")
+EXPORT_CHUNK = 100_000
+
+# format -> (file extension, MIME type)
+FORMATS = {
+    "csv": (".csv", "text/csv"),
+    "csv.gz": (".csv.gz", "application/gzip"),
+}
+if pq is not None:
+    FORMATS["parquet"] = (".parquet", "application/vnd.apache.parquet")
+
+_locks = {}
+_locks_guard = threading.Lock()
+
+
+def _slug(path):
+    return re.sub(r"\W", "_", os.path.splitext(os.path.normpath(path))[0])
+
+
+def _version(path):
+    _, mtime_ns, size = dataset_fingerprint(path)
+    return f"{mtime_ns}-{size}"
+
+
+def _chunks(path):
+    directory, filename = os.path.split(path)
+    name = os.path.splitext(filename)[0]
+    return iter_artifact(name, EXPORT_CHUNK, directory=directory or ".")
+
+
+def _write_csv(path, out):
+    # Stream the artifact out chunk by chunk; only the first one gets a header
+    header = True
+    for chunk in _chunks(path):
+        chunk.to_csv(out, header=header, index=False)
+        header = False
+
+
+def _build(path, fmt, target):
+    tmp = target + ".tmp"
+    if fmt == "csv":
+        with open(tmp, "w", newline="", encoding="utf-8") as out:
+            _write_csv(path, out)
+    elif fmt == "csv.gz":
+        with gzip.open(tmp, "wt", newline="", encoding="utf-8", compresslevel=6) as out:
+            if os.path.exists(path):
+                with open(path, encoding="utf-8") as source:
+                    shutil.copyfileobj(source, out, 1024 * 1024)
+            else:
+                _write_csv(path, out)
+    else:
+        # ArtifactWriter builds <name>.parquet.tmp and renames it when closed
+        name = os.path.basename(target)[:-len(".parquet")]
+        with ArtifactWriter(name, EXPORT_DIR, write_csv=False) as writer:
+            for chunk in _chunks(path):
+                writer.write(chunk)
+        if not os.path.exists(target):
+            raise ValueError(f"{path} can't be written as Parquet (column types differ between chunks)")
+        return
+    os.replace(tmp, target)
+
+
+def _drop_old_versions(slug, extension, keep):
+    # <slug>.<mtime>-<size><extension> of earlier dataset versions
+    pattern = re.compile(re.escape(slug) + r"\.\d+-\d+" + re.escape(extension) + "$")
+    for filename in os.listdir(EXPORT_DIR):
+        stale = os.path.join(EXPORT_DIR, filename)
+        if pattern.match(filename) and stale != keep:
+            os.remove(stale)
+
+
+def export_file(path, fmt="csv"):
+    """Path of a ``fmt`` export of the dataset at ``path``, writing it if needed.
+
+    CSV and current Parquet artifacts are already in export format and are
+    served as they are; everything else is written to ``EXPORT_DIR`` once per
+    dataset version.
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown export format: {fmt}")
+    if fmt == "csv" and os.path.exists(path):
+        return path
+    if fmt == "parquet" and path.endswith(".csv") and columnar_path(path):
+        return columnar_path(path)
+
+    extension = FORMATS[fmt][0]
+    slug = _slug(path)
+    target = os.path.join(EXPORT_DIR, f"{slug}.{_version(path)}{extension}")
+    if os.path.exists(target):
+        return target
+    with _locks_guard:
+        lock = _locks.setdefault(target, threading.Lock())
+    # Two sessions clicking at once: one writes, the other waits for it
+    with lock:
+        if not os.path.exists(target):
+            os.makedirs(EXPORT_DIR, exist_ok=True)
+            _build(path, fmt, target)
+            _drop_old_versions(slug, extension, target)
+    return target
+
+
+def export_bytes(path, fmt="csv"):
+    with open(export_file(path, fmt), "rb") as f:
+        return f.read()
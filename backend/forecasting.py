@@ -0,0 +1,164 @@
+import glob
+import hashlib
+import json
+import os
+import time
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+from statsmodels.tsa.holtwinters import ExponentialSmoothing
+
+MODEL_PATH = "backend/models/holt_winters"
+METRICS = ["zn", "sb", "tax", "marza"]
+HW_CONFIG = {"trend": "add", "seasonal": "add", "seasonal_periods": 7}
+
+
+def prepare_daily(df):
+    """Daily, gap-free frame indexed by Date (same rules as the original script)."""
+    df = df.set_index("Date")
+    df = df.resample("D").mean().interpolate()
+    return df.dropna()
+
+
+def series_hash(series, n_obs=None):
+    # Hash of the first n_obs values plus the start date and model config, so a
+    # stored fit can be matched both exactly and as a prefix of a longer series
+    values = np.ascontiguousarray(series.to_numpy(dtype="float64")[:n_obs])
+    digest = hashlib.sha256(values.tobytes())
+    digest.update(str(series.index[0]).encode())
+    digest.update(json.dumps(HW_CONFIG, sort_keys=True).encode())
+    return digest.hexdigest()[:16]
+
+
+def _model_file(metric, key):
+    return os.path.join(MODEL_PATH, f"{metric}-{key}.json")
+
+
+def _load_fits(metric):
+    fits = []
+    for path in glob.glob(os.path.join(MODEL_PATH, f"{metric}-*.json")):
+        with open(path) as f:
+            fits.append(json.load(f))
+    return fits
+
+
+def _find_stored_fit(metric, series):
+    """Return (fit, "exact" | "prefix") for the best stored fit, or (None, None)."""
+    key = series_hash(series)
+    best = None
+    for fit in _load_fits(metric):
+        if fit["series_hash"] == key:
+            return fit, "exact"
+        n_obs = fit["n_obs"]
+        if n_obs < len(series) and series_hash(series, n_obs) == fit["series_hash"]:
+            if best is None or n_obs > best["n_obs"]:
+                best = fit
+    return (best, "prefix") if best is not None else (None, None)
+
+
+def _start_params(params):
+    # statsmodels order: [alpha, beta, gamma, initial_level, initial_trend, s0..s<m-1>]
+    return np.r_[
+        params["smoothing_level"],
+        params["smoothing_trend"],
+        params["smoothing_seasonal"],
+        params["initial_level"],
+        params["initial_trend"],
+        params["initial_seasons"],
+    ]
+
+
+def _params_to_json(params):
+    keys = ["smoothing_level", "smoothing_trend", "smoothing_seasonal", "initial_level", "initial_trend"]
+    out = {key: float(params[key]) for key in keys}
+    out["initial_seasons"] = [float(v) for v in params["initial_seasons"]]
+    return out
+
+
+def fit_metric(metric, series, horizon=30):
+    """Fit (or reuse) Holt-Winters for one series and forecast ``horizon`` days.
+
+    An exact series-hash match reuses the stored parameters without
+    optimizing; a stored fit on a prefix of the series (new days appended)
+    warm-starts the optimizer from its parameters; otherwise it fits cold.
+    """
+    start = time.perf_counter()
+    stored, match = _find_stored_fit(metric, series)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        if match == "exact":
+            params = stored["params"]
+            model = ExponentialSmoothing(
+                series,
+                initialization_method="known",
+                initial_level=params["initial_level"],
+                initial_trend=params["initial_trend"],
+                initial_seasonal=params["initial_seasons"],
+                **HW_CONFIG,
+            )
+            fit = model.fit(
+                smoothing_level=params["smoothing_level"],
+                smoothing_trend=params["smoothing_trend"],
+                smoothing_seasonal=params["smoothing_seasonal"],
+                optimized=False,
+            )
+            mode = "cached"
+        else:
+            model = ExponentialSmoothing(series, **HW_CONFIG)
+            if match == "prefix":
+                fit = model.fit(start_params=_start_params(stored["params"]), use_brute=False)
+                mode = "warm"
+            else:
+                fit = model.fit()
+                mode = "cold"
+        forecast = fit.forecast(horizon)
+    elapsed = time.perf_counter() - start
+
+    key = series_hash(series)
+    if mode != "cached":
+        os.makedirs(MODEL_PATH, exist_ok=True)
+        with open(_model_file(metric, key), "w") as f:
+            json.dump({
+                "metric": metric,
+                "series_hash": key,
+                "n_obs": len(series),
+                "start": str(series.index[0].date()),
+                "end": str(series.index[-1].date()),
+                "config": HW_CONFIG,
+                "params": _params_to_json(fit.params),
+                "sse": float(fit.sse),
+                "fit_seconds": elapsed,
+                "mode": mode,
+            }, f, indent=2)
+
+    report = {"metric": metric, "mode": mode, "n_obs": len(series), "fit_seconds": elapsed, "series_hash": key}
+    return np.asarray(forecast), report
+
+
+def _fit_task(task):
+    metric, series, horizon = task
+    return fit_metric(metric, series, horizon)
+
+
+def forecast_metrics(df, metrics=METRICS, horizon=30, workers=None):
+    """Forecast every metric column of a daily frame in a process pool.
+
+    Returns the forecast frame (``Date`` + one column per metric, the
+    ``sales_forecast.csv`` layout) and a per-series fit report.
+    """
+    tasks = [(metric, df[metric].asfreq("D"), horizon) for metric in metrics]
+    workers = workers or min(len(tasks), os.cpu_count())
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_fit_task, tasks))
+    else:
+        results = [_fit_task(task) for task in tasks]
+
+    result = pd.DataFrame({metric: values for metric, (values, _) in zip(metrics, results)})
+    result["Date"] = pd.date_range(start=df.index[-1] + pd.Timedelta(days=1), periods=horizon)
+    result = result[["Date"] + list(metrics)]
+    report = pd.DataFrame([report for _, report in results])
+    return result, report
@@ -0,0 +1,153 @@
+import glob
+import hashlib
+import json
+import os
+import threading
+import time
+
+import joblib
+import numpy as np
+import pandas as pd
+import sklearn
+from scipy import sparse
+
+REGISTRY_PATH = "backend/models/registry"
+
+# Deserialized estimators, shared by every caller (and Streamlit session) in
+# the process; keyed on the file path, which never changes for a version
+_cache = {}
+_cache_lock = threading.Lock()
+
+
+def data_hash(*frames, params=None):
+    """Fingerprint of the training inputs: values, column names and params."""
+    digest = hashlib.sha256()
+    for frame in frames:
+        if isinstance(frame, (pd.DataFrame, pd.Series)):
+            digest.update(pd.util.hash_pandas_object(frame, index=False).to_numpy().tobytes())
+            names = list(frame.columns) if isinstance(frame, pd.DataFrame) else [frame.name]
+            digest.update(json.dumps([str(n) for n in names]).encode())
+        elif sparse.issparse(frame):
+            frame = sparse.csr_matrix(frame)
+            digest.update(str(frame.shape).encode())
+            for part in (frame.data, frame.indices, frame.indptr):
+                digest.update(np.ascontiguousarray(part).tobytes())
+        else:
+            digest.update(np.ascontiguousarray(frame).tobytes())
+    digest.update(json.dumps(params or {}, sort_keys=True, default=str).encode())
+    return digest.hexdigest()[:16]
+
+
+def _model_dir(name, directory=REGISTRY_PATH):
+    return os.path.join(directory, name)
+
+
+def list_versions(name, directory=REGISTRY_PATH):
+    """Metadata of every saved version of ``name``, oldest first."""
+    versions = []
+    for path in glob.glob(os.path.join(_model_dir(name, directory), "v*.json")):
+        with open(path) as f:
+            versions.append(json.load(f))
+    return sorted(versions, key=lambda meta: meta["version"])
+
+
+class ModelHandle:
+    """A registered model version; the estimator is only unpickled on first use."""
+
+    def __init__(self, meta, directory=REGISTRY_PATH):
+        self.meta = meta
+        self.name = meta["name"]
+        self.version = meta["version"]
+        self.path = os.path.join(_model_dir(self.name, directory), f"v{self.version}.joblib")
+
+    @property
+    def estimator(self):
+        with _cache_lock:
+            if self.path not in _cache:
+                _cache[self.path] = joblib.load(self.path)
+            return _cache[self.path]
+
+    @property
+    def metrics(self):
+        return self.meta.get("metrics", {})
+
+    def predict(self, X):
+        return self.estimator.predict(X)
+
+
+def find(name, fingerprint, directory=REGISTRY_PATH):
+    """Latest version trained on exactly these inputs, or None."""
+    for meta in reversed(list_versions(name, directory)):
+        if meta["data_hash"] == fingerprint:
+            return ModelHandle(meta, directory)
+    return None
+
+
+def latest(name, directory=REGISTRY_PATH):
+    versions = list_versions(name, directory)
+    return ModelHandle(versions[-1], directory) if versions else None
+
+
+def get_version(name, version, directory=REGISTRY_PATH):
+    """Handle for version ``version`` of ``name``, or None if it isn't registered."""
+    path = os.path.join(_model_dir(name, directory), f"v{int(version)}.json")
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        return ModelHandle(json.load(f), directory)
+
+
+def register(name, estimator, fingerprint, features, metrics=None, params=None, train_seconds=None,
+             directory=REGISTRY_PATH, extra=None):
+    """Save ``estimator`` as the next version of ``name`` and return its handle.
+
+    ``extra`` is merged into the metadata (e.g. hyperparameter search results).
+    """
+    model_dir = _model_dir(name, directory)
+    os.makedirs(model_dir, exist_ok=True)
+    versions = list_versions(name, directory)
+    version = versions[-1]["version"] + 1 if versions else 1
+
+    meta = {
+        "name": name,
+        "version": version,
+        "data_hash": fingerprint,
+        "features": [str(f) for f in features],
+        "params": params or {},
+        "metrics": metrics or {},
+        "train_seconds": train_seconds,
+        "estimator": type(estimator).__name__,
+        "sklearn_version": sklearn.__version__,
+        "created_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+    }
+    meta.update(extra or {})
+    handle = ModelHandle(meta, directory)
+    # Model file first, metadata last: a version only counts once both exist
+    joblib.dump(estimator, handle.path)
+    with open(os.path.join(model_dir, f"v{version}.json"), "w") as f:
+        json.dump(meta, f, indent=2, default=str)
+    with _cache_lock:
+        _cache[handle.path] = estimator
+    return handle
+
+
+def get_or_train(name, train, fingerprint, features, params=None, directory=REGISTRY_PATH):
+    """Reuse the version trained on the same inputs, or call ``train()`` and register it.
+
+    ``train`` returns ``(estimator, metrics)`` or ``(estimator, metrics, extra)``
+    with extra metadata to store. Returns ``(handle, reused)``.
+    """
+    handle = find(name, fingerprint, directory)
+    if handle is not None:
+        return handle, True
+    start = time.perf_counter()
+    estimator, metrics, *extra = train()
+    train_seconds = time.perf_counter() - start
+    handle = register(name, estimator, fingerprint, features, metrics, params, train_seconds, directory,
+                      extra[0] if extra else None)
+    return handle, False
+
+
+def clear_cache():
+    with _cache_lock:
+        _cache.clear()
@@ -0,0 +1,71 @@
+import io
+import os
+from multiprocessing import Pool
+
+import pandas as pd
+
+from backend.schemas import apply_schema, reader_options, source_path
+
+# Target size of one byte range; several per worker keeps the pool busy even
+# when some ranges clean faster than others
+PARTITION_BYTES = 64 * 1024 * 1024
+
+
+def byte_ranges(path, parts, size=None):
+    """Split ``path`` into ``parts`` newline-aligned (start, end) byte ranges.
+
+    The header line is excluded; every range starts at the beginning of a
+    line and ends just after a newline (or at EOF / ``size``). Assumes no
+    quoted field spans several lines, which holds for the semicolon exports
+    we ingest.
+    """
+    size = os.path.getsize(path) if size is None else size
+    with open(path, "rb") as f:
+        f.readline()
+        start = f.tell()
+        step = max((size - start) // max(parts, 1), 1)
+        ranges = []
+        while start < size:
+            f.seek(min(start + step, size))
+            f.readline()
+            end = min(f.tell(), size)
+            ranges.append((start, end))
+            start = end
+    return ranges
+
+
+def read_header(path):
+    with open(path, "rb") as f:
+        return f.readline()
+
+
+def _parse_range(task):
+    name, path, header, start, end, clean_chunk = task
+    with open(path, "rb") as f:
+        f.seek(start)
+        data = f.read(end - start)
+    df = pd.read_csv(io.BytesIO(header + data), **reader_options(name))
+    df = clean_chunk(apply_schema(df, name))
+    # Render the CSV here so the parent only has to concatenate text
+    return df, df.to_csv(index=False, header=False)
+
+
+def parallel_read(name, clean_chunk, workers=None, partition_bytes=PARTITION_BYTES, path=None, end=None):
+    """Parse and clean one raw source across a process pool.
+
+    Yields ``(frame, csv_text)`` per byte range, in file order, so the output
+    written from it is identical to the serial path. ``clean_chunk`` must be a
+    module-level function so it can be sent to the workers. ``end`` stops at
+    that byte offset instead of the current end of the file.
+    """
+    workers = workers or os.cpu_count()
+    path = path or source_path(name)
+    header = read_header(path)
+    size = os.path.getsize(path) if end is None else end
+    parts = max(workers, size // partition_bytes + 1)
+    tasks = [(name, path, header, start, stop, clean_chunk) for start, stop in byte_ranges(path, parts, size)]
+
+    with Pool(workers) as pool:
+        # imap keeps results in submission order while workers run ahead
+        for result in pool.imap(_parse_range, tasks):
+            yield result
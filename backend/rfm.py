@@ -0,0 +1,113 @@
+import os
+from multiprocessing import Pool
+
+import pandas as pd
+
+from backend.artifact_store import artifact_paths, iter_artifact, load_artifact, save_artifact
+
+# Partial RFM state is kept per (customer, invoice): the latest invoice line
+# date and the summed amount. Any two states merge with max/sum, so chunks or
+# partitions can be aggregated on their own and combined later, even when an
+# invoice is split across them. It stays much smaller than the raw lines.
+STATE_NAME = "rfm_state"
+KEYS = ["CustomerID", "InvoiceNo"]
+COLUMNS = ["InvoiceNo", "InvoiceDate", "CustomerID", "Quantity", "UnitPrice"]
+
+# How many partial states to collect before folding them together
+MERGE_EVERY = 8
+
+
+def partial_rfm(df):
+    """Invoice-level partial state for one chunk of cleaned retail rows."""
+    df = df.copy()
+    df["InvoiceDate"] = pd.to_datetime(df["InvoiceDate"], errors="coerce")
+    df = df.dropna(subset=["InvoiceDate", "CustomerID"])
+    # Invoice numbers come back as int from all-numeric chunks and str
+    # otherwise; one type keeps merges across chunks and runs consistent
+    df["InvoiceNo"] = df["InvoiceNo"].astype(str)
+    if "TotalAmount" not in df.columns:
+        df["TotalAmount"] = df["Quantity"] * df["UnitPrice"]
+
+    return df.groupby(KEYS, sort=False).agg(
+        LastDate=("InvoiceDate", "max"),
+        Amount=("TotalAmount", "sum"),
+    ).reset_index()
+
+
+def merge_partials(states):
+    """Combine partial states (from chunks, partitions or earlier runs) into one."""
+    states = [s for s in states if s is not None and len(s)]
+    if not states:
+        return pd.DataFrame(columns=KEYS + ["LastDate", "Amount"])
+    if len(states) == 1:
+        return states[0]
+    return pd.concat(states, ignore_index=True).groupby(KEYS, sort=False).agg(
+        LastDate=("LastDate", "max"),
+        Amount=("Amount", "sum"),
+    ).reset_index()
+
+
+def finalize_rfm(state, snapshot_date=None):
+    """Recency / Frequency / Monetary per customer from a merged state.
+
+    ``snapshot_date`` defaults to one day after the latest invoice, as in the
+    original segmentation script.
+    """
+    customers = state.groupby("CustomerID").agg(
+        LastDate=("LastDate", "max"),
+        Frequency=("InvoiceNo", "size"),
+        Monetary=("Amount", "sum"),
+    )
+    if snapshot_date is None:
+        snapshot_date = customers["LastDate"].max() + pd.Timedelta(days=1)
+    customers.insert(0, "Recency", (snapshot_date - customers["LastDate"]).dt.days)
+    return customers.drop(columns="LastDate")
+
+
+def rfm_state_from_chunks(chunks, workers=None):
+    """Fold an iterable of raw frames into one partial state.
+
+    With ``workers`` > 1 the chunks are aggregated in a process pool; only
+    up to ``MERGE_EVERY`` partial states are held before they are merged.
+    """
+    pool = Pool(workers) if workers and workers > 1 else None
+    partials = pool.imap(partial_rfm, chunks) if pool else map(partial_rfm, chunks)
+    state, pending = None, []
+    try:
+        for partial in partials:
+            pending.append(partial)
+            if len(pending) >= MERGE_EVERY:
+                state = merge_partials([state] + pending)
+                pending = []
+    finally:
+        if pool:
+            pool.close()
+            pool.join()
+    return merge_partials([state] + pending)
+
+
+def compute_rfm(name="retail_cleaned", chunksize=500_000, workers=None):
+    """RFM table for a cleaned artifact, read chunk by chunk."""
+    chunks = iter_artifact(name, chunksize, columns=COLUMNS)
+    state = rfm_state_from_chunks(chunks, workers)
+    return finalize_rfm(state), state
+
+
+def load_state():
+    csv_path, parquet_path = artifact_paths(STATE_NAME)
+    if not (os.path.exists(csv_path) or os.path.exists(parquet_path)):
+        return None
+    state = load_artifact(STATE_NAME, parse_dates=["LastDate"])
+    state["LastDate"] = pd.to_datetime(state["LastDate"])
+    return state
+
+
+def save_state(state):
+    return save_artifact(state, STATE_NAME)
+
+
+def update_rfm(new_rows):
+    """Merge newly landed invoice lines into the stored state and return fresh RFM."""
+    state = merge_partials([load_state(), partial_rfm(new_rows)])
+    save_state(state)
+    return finalize_rfm(state), state
@@ -0,0 +1,164 @@
+import io
+import os
+
+import pandas as pd
+
+RAW_PATH = "data/raw"
+
+# -- Per-source raw file schemas --
+# Dialect keys (sep, encoding, decimal, thousands, na_values) go straight to the
+# C CSV parser, so European numbers like "1 334,95" are converted while the file
+# is tokenized instead of through string rewrites afterwards. "dates" maps
+# columns to their strptime format (None = let pandas infer) and "dtypes"
+# pins the final column types so every chunk of a file comes out the same.
+SOURCES = {
+    "retail": {
+        "file": "Retail.csv",
+        "encoding": "ISO-8859-1",
+        "dates": {"InvoiceDate": None},
+        "dtypes": {"Quantity": "float64", "UnitPrice": "float64", "CustomerID": "float64"},
+    },
+    "sell_1": {
+        "file": "SELL_1.csv",
+        "sep": ";",
+        "encoding": "ISO-8859-1",
+        "decimal": ",",
+        "na_values": [" "],
+        "dates": {"Date": "%d.%m.%Y"},
+        "dtypes": {
+            "PKod": "Int64",
+            "Pquantity": "float64",
+            "pce_zn": "float64",
+            "pwa_zn": "float64",
+            "pce_sn": "float64",
+            "pwa_sn": "float64",
+            "pce_sb": "float64",
+            "pwa_sb": "float64",
+            "pudzsb": "float64",
+            "pmarza": "float64",
+            "pmarzajedn": "float64",
+            "pkwmarza": "float64",
+            "pudzmarza": "float64",
+        },
+    },
+    "ads": {
+        "file": "Ads.csv",
+        "dtypes": {"id": "int64", "age": "float64", "click": "Int64"},
+    },
+    "day_sell": {
+        "file": "Day Sell.csv",
+        "sep": ";",
+        "decimal": ",",
+        "thousands": " ",
+        "names": ["Date", "zn", "sb", "tax", "marza"],
+        "dates": {"Date": "%d.%m.%Y"},
+        "dtypes": {"zn": "float64", "sb": "float64", "tax": "float64", "marza": "float64"},
+    },
+    "rotation": {
+        "file": "Rotation.csv",
+        "sep": ";",
+        "encoding": "ISO-8859-1",
+        "decimal": ",",
+        "na_values": ["-"],
+        "dtypes": {
+            "Lp": "Int64",
+            "PKod": "Int64",
+            "p_sale_in_time": "float64",
+            "Psale": "float64",
+            "Pavarage_stock": "float64",
+            "Rotation_in_days": "float64",
+            "Rotation_in_times": "float64",
+        },
+    },
+    "mock_kaggle": {
+        "file": "Mock Kaggle.csv",
+        "rename": {"date": "data"},
+        "dates": {"data": "%Y-%m-%d"},
+        "dtypes": {"venda": "Int64", "estoque": "Int64", "preco": "float64"},
+    },
+}
+
+READER_KEYS = ["sep", "encoding", "decimal", "thousands", "na_values"]
+
+
+def source_path(name):
+    return os.path.join(RAW_PATH, SOURCES[name]["file"])
+
+
+def reader_options(name):
+    schema = SOURCES[name]
+    options = {key: schema[key] for key in READER_KEYS if key in schema}
+    if "names" in schema:
+        options["names"] = schema["names"]
+        options["header"] = 0
+    return options
+
+
+def apply_schema(df, name):
+    """Normalize headers and cast a freshly parsed raw frame to its schema types."""
+    schema = SOURCES[name]
+    df.columns = df.columns.str.strip()
+    if "rename" in schema:
+        df = df.rename(columns=schema["rename"])
+
+    for col, fmt in schema.get("dates", {}).items():
+        if col in df.columns:
+            df[col] = pd.to_datetime(df[col], format=fmt, errors="coerce")
+
+    for col, dtype in schema.get("dtypes", {}).items():
+        if col not in df.columns:
+            continue
+        if not pd.api.types.is_numeric_dtype(df[col]):
+            # Only dirty columns get here (the parser gives up on the whole
+            # column for one bad value), so apply the dialect by hand and
+            # coerce the leftovers to NaN like before
+            values = df[col].astype(str)
+            if "thousands" in schema:
+                values = values.str.replace(schema["thousands"], "", regex=False)
+            if schema.get("decimal", ".") != ".":
+                values = values.str.replace(schema["decimal"], ".", regex=False)
+            df[col] = pd.to_numeric(values, errors="coerce")
+        df[col] = df[col].astype(dtype)
+    return df
+
+
+class _FirstBytes(io.RawIOBase):
+    # The first ``end`` bytes of a file, read as a stream (nothing buffered
+    # beyond what the parser asks for)
+    def __init__(self, path, end):
+        self._file = open(path, "rb")
+        self._remaining = end
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        data = self._file.read(min(len(buffer), self._remaining))
+        buffer[:len(data)] = data
+        self._remaining -= len(data)
+        return len(data)
+
+    def close(self):
+        self._file.close()
+        super().close()
+
+
+def read_source(name, chunksize=None, path=None, end=None):
+    """Yield the typed frame(s) of a raw source: one frame, or one per chunk.
+
+    ``path`` reads another file in the same format (e.g. a bigger export).
+    ``end`` stops at that byte offset, so rows appended while the file is
+    being read are left for the next run.
+    """
+    options = reader_options(name)
+    path = path or source_path(name)
+    source = path if end is None else io.BufferedReader(_FirstBytes(path, end))
+    try:
+        if chunksize:
+            for chunk in pd.read_csv(source, chunksize=chunksize, **options):
+                yield apply_schema(chunk, name)
+        else:
+            yield apply_schema(pd.read_csv(source, **options), name)
+    finally:
+        if end is not None:
+            source.close()
@@ -0,0 +1,194 @@
+import argparse
+import json
+import os
+import queue
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+from scipy import sparse
+
+from backend.ad_features import layout_from_meta
+from backend.model_registry import REGISTRY_PATH, get_version, latest
+
+MODEL_NAME = "ad_click_rf"
+# Version to serve; unset means the latest one registered when the server starts
+MODEL_VERSION = os.environ.get("MARKETLENS_AD_MODEL_VERSION")
+
+
+class _Request:
+    __slots__ = ("X", "done", "result", "error")
+
+    def __init__(self, X):
+        self.X = X
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class MicroBatcher:
+    """Funnel concurrent scoring requests into one ``predict`` call per batch.
+
+    A single worker thread takes everything queued (up to ``max_batch``
+    rows), optionally waiting ``max_wait_ms`` for more, scores it in one
+    call and hands each caller its slice. Under load, requests pile up while
+    the model is busy, so batches grow without adding latency at low load.
+    """
+
+    def __init__(self, predict, max_batch=512, max_wait_ms=0.0):
+        self.predict = predict
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000
+        self.batches = 0
+        self.rows = 0
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def submit(self, X):
+        request = _Request(X)
+        self._queue.put(request)
+        request.done.wait()
+        if request.error is not None:
+            raise request.error
+        return request.result
+
+    def _collect(self):
+        batch = [self._queue.get()]
+        rows = batch[0].X.shape[0]
+        deadline = time.perf_counter() + self.max_wait
+        while rows < self.max_batch:
+            try:
+                timeout = deadline - time.perf_counter()
+                request = self._queue.get(timeout=timeout) if timeout > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            batch.append(request)
+            rows += request.X.shape[0]
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._collect()
+            try:
+                parts = [request.X for request in batch]
+                X = sparse.vstack(parts, format="csr") if sparse.issparse(parts[0]) else np.vstack(parts)
+                scores = self.predict(X)
+                start = 0
+                for request in batch:
+                    request.result = scores[start:start + request.X.shape[0]]
+                    start += request.X.shape[0]
+            except Exception as e:
+                for request in batch:
+                    request.error = e
+            self.batches += 1
+            self.rows += sum(request.X.shape[0] for request in batch)
+            for request in batch:
+                request.done.set()
+
+
+class AdClickScorer:
+    """Registered ad-click model + the feature layout it was trained with.
+
+    The version is fixed when the scorer starts (``version``, or the latest
+    one registered then), so retraining never swaps the model under a
+    running server.
+    """
+
+    def __init__(self, registry=REGISTRY_PATH, max_batch=512, max_wait_ms=0.0, version=MODEL_VERSION):
+        if version is not None:
+            handle = get_version(MODEL_NAME, version, registry)
+            if handle is None:
+                raise FileNotFoundError(f"No {MODEL_NAME} v{version} in {registry}")
+        else:
+            handle = latest(MODEL_NAME, registry)
+        if handle is None:
+            raise FileNotFoundError(f"No {MODEL_NAME} model registered; run scripts/ad_campaign_analysis.py first")
+        self.version = handle.version
+        self.model = handle.estimator
+        self.layout = layout_from_meta(handle.meta)
+        # Column of predict_proba holding the "clicked" class
+        self.positive = list(self.model.classes_).index(1)
+        self.batcher = MicroBatcher(self._predict, max_batch, max_wait_ms)
+
+    def _predict(self, X):
+        # Models fitted on a DataFrame (before the sparse pipeline) expect column names
+        if hasattr(self.model, "feature_names_in_"):
+            X = self.layout.frame(X)
+        return self.model.predict_proba(X)[:, self.positive]
+
+    def score(self, records):
+        # Checked up front: the encoders index into each record, and anything
+        # but a dict would fail there with an error the handler doesn't expect
+        if not isinstance(records, list) or not all(isinstance(record, dict) for record in records):
+            raise TypeError("expected an impression object or a list of impression objects")
+        return self.batcher.submit(self.layout.encode(records))
+
+
+def make_handler(scorer):
+    class ScoringHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # keep-alive, so clients reuse connections
+
+        def _reply(self, status, payload):
+            body = json.dumps(payload).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            if self.path != "/health":
+                return self._reply(404, {"error": "not found"})
+            self._reply(200, {
+                "model": MODEL_NAME,
+                "version": scorer.version,
+                "batches": scorer.batcher.batches,
+                "rows": scorer.batcher.rows,
+            })
+
+        def do_POST(self):
+            if self.path != "/score":
+                return self._reply(404, {"error": "not found"})
+            try:
+                payload = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+                records = payload["impressions"] if isinstance(payload, dict) and "impressions" in payload else payload
+                if isinstance(records, dict):
+                    records = [records]
+                scores = scorer.score(records)
+            except (ValueError, KeyError, TypeError) as e:
+                return self._reply(400, {"error": f"bad request: {e}", "version": scorer.version})
+            except Exception as e:
+                # Anything else is our fault, but the client still gets an answer
+                return self._reply(500, {"error": f"scoring failed: {e}", "version": scorer.version})
+            self._reply(200, {"click_probability": [float(s) for s in scores], "version": scorer.version})
+
+        def log_message(self, format, *args):
+            pass  # one line per request would dominate the latency
+
+    return ScoringHandler
+
+
+def make_server(host="127.0.0.1", port=8000, registry=REGISTRY_PATH, max_batch=512, max_wait_ms=0.0,
+                version=MODEL_VERSION):
+    scorer = AdClickScorer(registry, max_batch, max_wait_ms, version)
+    server = ThreadingHTTPServer((host, port), make_handler(scorer))
+    server.daemon_threads = True
+    return server, scorer
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve ad-click probabilities over HTTP")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--max-batch", type=int, default=512)
+    parser.add_argument("--max-wait-ms", type=float, default=0.0)
+    parser.add_argument("--model-version", type=int, default=MODEL_VERSION,
+                        help="registered version to serve (default: latest)")
+    args = parser.parse_args()
+
+    server, scorer = make_server(args.host, args.port, max_batch=args.max_batch, max_wait_ms=args.max_wait_ms,
+                                 version=args.model_version)
+    print(f"🚀 Scoring {MODEL_NAME} v{scorer.version} on http://{args.host}:{args.port}/score")
+    server.serve_forever()
@@ -0,0 +1,249 @@
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import joblib
+import numpy as np
+import pandas as pd
+from sklearn.cluster import KMeans, MiniBatchKMeans
+from sklearn.metrics import silhouette_score
+from sklearn.preprocessing import StandardScaler
+
+from backend.model_registry import REGISTRY_PATH, data_hash, get_or_train
+
+SEGMENT_PATH = "backend/models/segmentation"
+FEATURES = ["Recency", "Frequency", "Monetary"]
+
+# Segment names by value rank: cluster 0 is always the most valuable one
+# (see _value_order), so names no longer have to be matched up by hand
+SEGMENT_NAMES = {
+    2: ["High Value", "Low Value"],
+    3: ["High Value", "Mid Value", "Low Value"],
+    4: ["High Value", "Mid Value", "Low Value", "Budget Shopper"],
+}
+
+# The k sweep fits on at most this many customers and scores silhouette on a
+# smaller sample; exact silhouette is O(n^2) and useless at millions of rows
+SWEEP_FIT_SAMPLE = 200_000
+SILHOUETTE_SAMPLE = 5_000
+
+
+def _paths(directory=SEGMENT_PATH):
+    # JSON holds what scoring needs; the pickle is the streaming estimator
+    return os.path.join(directory, "kmeans.json"), os.path.join(directory, "minibatch.joblib")
+
+
+class SegmentModel:
+    """Frozen scaler + centroids; assigns RFM rows to the nearest centroid."""
+
+    def __init__(self, mean, scale, centroids, labels=None, meta=None):
+        self.mean = np.asarray(mean, dtype="float64")
+        self.scale = np.asarray(scale, dtype="float64")
+        self.centroids = np.asarray(centroids, dtype="float64")
+        self.labels = {int(k): v for k, v in (labels or {}).items()}
+        self.meta = meta or {}
+        # Centroids in raw RFM units: scaling a row and comparing it with the
+        # scaled centroids is the same as comparing raw distances / scale
+        self._weights = 1.0 / (self.scale * self.scale)
+        self._raw_centroids = self.centroids * self.scale + self.mean
+
+    def _matrix(self, rfm):
+        if hasattr(rfm, "columns"):
+            rfm = rfm[FEATURES].to_numpy(dtype="float64")
+        return np.atleast_2d(np.asarray(rfm, dtype="float64"))
+
+    def assign(self, rfm):
+        """Cluster id for every row of ``rfm`` (frame with R/F/M columns or an n x 3 array)."""
+        X = self._matrix(rfm)
+        diff = X[:, None, :] - self._raw_centroids[None, :, :]
+        return np.einsum("nkf,nkf,f->nk", diff, diff, self._weights).argmin(axis=1)
+
+    def assign_one(self, recency, frequency, monetary):
+        """Single-customer fast path (plain Python floats, no frame overhead)."""
+        best, best_dist = 0, float("inf")
+        w = self._weights.tolist()
+        for k, (r, f, m) in enumerate(self._raw_centroids.tolist()):
+            dist = (recency - r) ** 2 * w[0] + (frequency - f) ** 2 * w[1] + (monetary - m) ** 2 * w[2]
+            if dist < best_dist:
+                best, best_dist = k, dist
+        return best
+
+    def segment(self, rfm):
+        """Segment names for every row (falls back to the cluster id)."""
+        return [self.labels.get(int(c), str(c)) for c in self.assign(rfm)]
+
+    def to_json(self):
+        return {
+            "features": FEATURES,
+            "scaler_mean": self.mean.tolist(),
+            "scaler_scale": self.scale.tolist(),
+            "centroids": self.centroids.tolist(),
+            "labels": {str(k): v for k, v in self.labels.items()},
+            "meta": self.meta,
+        }
+
+    @classmethod
+    def from_json(cls, data):
+        return cls(data["scaler_mean"], data["scaler_scale"], data["centroids"], data["labels"], data.get("meta"))
+
+
+def save_model(model, minibatch=None, directory=SEGMENT_PATH):
+    json_path, pickle_path = _paths(directory)
+    os.makedirs(directory, exist_ok=True)
+    with open(json_path, "w") as f:
+        json.dump(model.to_json(), f, indent=2)
+    if minibatch is not None:
+        joblib.dump(minibatch, pickle_path)
+    return json_path
+
+
+_loaded = {}
+
+
+def load_model(directory=SEGMENT_PATH, reload=False):
+    """Load the persisted model once per process; ``reload`` rereads it from disk."""
+    json_path, _ = _paths(directory)
+    if reload or json_path not in _loaded:
+        if not os.path.exists(json_path):
+            raise FileNotFoundError(f"No segmentation model at {json_path}; run scripts/customer_segmentation.py first")
+        with open(json_path) as f:
+            _loaded[json_path] = SegmentModel.from_json(json.load(f))
+    return _loaded[json_path]
+
+
+def assign_segments(rfm, directory=SEGMENT_PATH):
+    """Cluster ids for new or updated RFM rows using the persisted model."""
+    return load_model(directory).assign(rfm)
+
+
+def segment_names(n_clusters):
+    names = SEGMENT_NAMES.get(n_clusters)
+    if names is None:
+        names = [f"Tier {i + 1}" for i in range(n_clusters)]
+    return dict(enumerate(names))
+
+
+def _value_order(scaled_centroids):
+    # Most valuable first: high Monetary and low Recency (both standardized)
+    recency = scaled_centroids[:, FEATURES.index("Recency")]
+    monetary = scaled_centroids[:, FEATURES.index("Monetary")]
+    return np.argsort(recency - monetary, kind="stable")
+
+
+def _sweep_task(task):
+    X, k, random_state, silhouette_sample = task
+    start = time.perf_counter()
+    kmeans = KMeans(n_clusters=k, random_state=random_state).fit(X)
+    fit_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    silhouette = silhouette_score(X, kmeans.labels_, sample_size=min(silhouette_sample, len(X)), random_state=random_state)
+    return {
+        "k": k,
+        "inertia": float(kmeans.inertia_),
+        "inertia_per_row": float(kmeans.inertia_) / len(X),
+        "silhouette": float(silhouette),
+        "fit_seconds": fit_seconds,
+        "silhouette_seconds": time.perf_counter() - start,
+    }
+
+
+def sweep_k(rfm, k_values=range(2, 9), workers=None, fit_sample=SWEEP_FIT_SAMPLE,
+            silhouette_sample=SILHOUETTE_SAMPLE, random_state=42):
+    """Score each k by sampled silhouette and inertia, one process per k.
+
+    Every k is fitted on the same random sample of at most ``fit_sample``
+    customers, so the sweep time is bounded no matter how many customers
+    there are. Returns (results by k, the k with the best silhouette).
+    """
+    X = rfm[FEATURES].to_numpy(dtype="float64")
+    if len(X) > fit_sample:
+        X = X[np.random.default_rng(random_state).choice(len(X), fit_sample, replace=False)]
+    X = StandardScaler().fit_transform(X)
+
+    tasks = [(X, k, random_state, silhouette_sample) for k in k_values]
+    workers = workers or min(len(tasks), os.cpu_count())
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_sweep_task, tasks))
+    else:
+        results = [_sweep_task(task) for task in tasks]
+
+    results = pd.DataFrame(results)
+    best_k = int(results.loc[results["silhouette"].idxmax(), "k"])
+    return results, best_k
+
+
+def _train_segments(X, n_clusters, random_state, labels):
+    start = time.perf_counter()
+    scaler = StandardScaler().fit(X)
+    X_scaled = scaler.transform(X)
+    kmeans = KMeans(n_clusters=n_clusters, random_state=random_state).fit(X_scaled)
+
+    order = _value_order(kmeans.cluster_centers_)
+    centroids = kmeans.cluster_centers_[order]
+
+    # One pass sets the per-cluster counts; it also nudges the centres, so put
+    # the KMeans centroids back to keep minibatch.joblib and kmeans.json in step
+    minibatch = MiniBatchKMeans(n_clusters=n_clusters, init=centroids, n_init=1, random_state=random_state)
+    minibatch.partial_fit(X_scaled)
+    minibatch.cluster_centers_ = centroids.copy()
+
+    model = SegmentModel(scaler.mean_, scaler.scale_, centroids, labels or segment_names(n_clusters), {
+        "n_clusters": n_clusters,
+        "n_rows": len(X),
+        "inertia": float(kmeans.inertia_),
+        "fit_seconds": time.perf_counter() - start,
+        "updated_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+    })
+    return {"segments": model, "minibatch": minibatch}, {"inertia": float(kmeans.inertia_)}
+
+
+def fit_segments(rfm, n_clusters=4, random_state=42, labels=None, directory=SEGMENT_PATH, registry=REGISTRY_PATH):
+    """Fit scaler + KMeans on the full RFM table and persist them.
+
+    Cluster ids are renumbered by value (0 = high Monetary / recent), so the
+    same kind of customer keeps the same id and name across refits. ``labels``
+    defaults to ``segment_names(n_clusters)``. The fitted centroids also seed
+    a MiniBatchKMeans (one pass over the same rows sets its per-cluster
+    counts), which later ``partial_fit`` calls keep updating as new RFM rows
+    stream in. An unchanged RFM table reuses the registered fit.
+    """
+    params = {"n_clusters": n_clusters, "random_state": random_state, "labels": labels}
+    X = rfm[FEATURES].to_numpy(dtype="float64")
+    handle, _ = get_or_train(
+        "customer_segments",
+        lambda: _train_segments(X, n_clusters, random_state, labels),
+        data_hash(rfm[FEATURES], params=params),
+        FEATURES,
+        params,
+        registry,
+    )
+    fitted = handle.estimator
+    model = fitted["segments"]
+    save_model(model, fitted["minibatch"], directory)
+    _loaded[_paths(directory)[0]] = model
+    return model, model.assign(X)
+
+
+def partial_fit_segments(rfm, directory=SEGMENT_PATH):
+    """Move the persisted centroids towards a new batch of RFM rows.
+
+    The scaler stays frozen so cluster ids keep their meaning between
+    updates; refit with ``fit_segments`` when the RFM distribution shifts.
+    """
+    model = load_model(directory)
+    if len(rfm) == 0:
+        return model
+    _, pickle_path = _paths(directory)
+    minibatch = joblib.load(pickle_path)
+    X_scaled = (rfm[FEATURES].to_numpy(dtype="float64") - model.mean) / model.scale
+    minibatch.partial_fit(X_scaled)
+
+    meta = dict(model.meta)
+    meta["n_rows"] = meta.get("n_rows", 0) + len(X_scaled)
+    meta["updated_at"] = time.strftime("%Y-%m-%d %H:%M:%S")
+    model = SegmentModel(model.mean, model.scale, minibatch.cluster_centers_, model.labels, meta)
+    save_model(model, minibatch, directory)
+    _loaded[_paths(directory)[0]] = model
+    return model
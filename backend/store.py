@@ -0,0 +1,298 @@
+import os
+import queue
+import sqlite3
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+import numpy as np
+import pandas as pd
+
+from backend.artifact_store import iter_artifact, resolve_artifact
+
+# Analytical store: the processed datasets bulk-loaded into one SQLite file
+# (WAL mode) with indexes on the key columns, so the dashboard can look up a
+# customer / product / day without parsing a whole CSV.
+
+STORE_PATH = os.environ.get("MARKETLENS_STORE_DB", "data/processed/marketlens.sqlite")
+POOL_SIZE = int(os.environ.get("MARKETLENS_STORE_POOL", 4))
+LOAD_CHUNK = 100_000
+
+# Store table -> source artifact
+DATASETS = {
+    "sales": "data/processed/sell_1_cleaned.csv",
+    "daily_sales": "data/processed/day_sell_cleaned.csv",
+    "segments": "data/processed/customer_segments.csv",
+    "clv": "data/processed/clv.csv",
+    "ad_predictions": "data/processed/ad_campaign_predictions.csv",
+    "forecast": "data/final_output.csv",
+    "competitor": "data/processed/competitor_data.csv",
+}
+
+# Every table gets an index on whichever of these columns it has
+INDEX_COLUMNS = ("Date", "PKod", "CustomerID", "customer_id", "id")
+
+
+def _quote(name):
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+def _signature(path):
+    stat = os.stat(resolve_artifact(path))
+    return f"{stat.st_mtime_ns}:{stat.st_size}"
+
+
+def _sql_type(dtype):
+    if pd.api.types.is_bool_dtype(dtype) or pd.api.types.is_integer_dtype(dtype):
+        return "INTEGER"
+    if pd.api.types.is_float_dtype(dtype):
+        return "REAL"
+    return "TEXT"
+
+
+def _datetime_text(values):
+    # Same text as astype(str); date-only columns (the usual case) go through
+    # numpy, which is several times faster than formatting Timestamps
+    missing = values.isna().to_numpy()
+    if values.dt.tz is None:
+        stamps = values.to_numpy()
+        if (stamps.astype("datetime64[D]") == stamps)[~missing].all():
+            text = np.datetime_as_string(stamps, unit="D").tolist()
+            for i in np.flatnonzero(missing):
+                text[i] = None
+            return text
+    return values.astype(str).where(~missing, None).tolist()
+
+
+def _rows(chunk):
+    # Plain Python values column by column (tolist() unboxes numpy scalars);
+    # NaN binds as NULL, timestamps go in as ISO text. Nullable columns
+    # (Int64, boolean, string) hold pd.NA, which sqlite3 can't bind, so their
+    # missing values become None
+    columns = []
+    for name in chunk.columns:
+        values = chunk[name]
+        if pd.api.types.is_datetime64_any_dtype(values):
+            columns.append(_datetime_text(values))
+        elif pd.api.types.is_extension_array_dtype(values) and values.hasnans:
+            columns.append(values.astype(object).where(values.notna(), None).tolist())
+        else:
+            columns.append(values.tolist())
+    return zip(*columns)
+
+
+class ConnectionPool:
+    """Fixed-size pool of SQLite connections shared by all threads.
+
+    A connection is used by one thread at a time (``with pool.connection()``)
+    and handed back afterwards, so N sessions share ``size`` connections
+    instead of each opening its own.
+    """
+
+    def __init__(self, db_path=STORE_PATH, size=POOL_SIZE):
+        self.db_path = db_path
+        self.size = size
+        self._idle = queue.LifoQueue()
+        self._opened = 0
+        self._lock = threading.Lock()
+
+    def _open(self):
+        os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
+        connection = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        # WAL + NORMAL only syncs at checkpoints; a crash can lose the last
+        # load but never corrupts the file (and loads are re-runnable)
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute("PRAGMA temp_store=MEMORY")
+        connection.execute("CREATE TABLE IF NOT EXISTS _sources (tbl TEXT PRIMARY KEY, signature TEXT)")
+        return connection
+
+    @contextmanager
+    def connection(self):
+        try:
+            connection = self._idle.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                can_open = self._opened < self.size
+                if can_open:
+                    self._opened += 1
+            connection = self._open() if can_open else self._idle.get()
+        try:
+            yield connection
+        finally:
+            if connection.in_transaction:
+                connection.rollback()
+            self._idle.put(connection)
+
+    def close(self):
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+        with self._lock:
+            self._opened = 0
+
+
+class Store:
+    """Bulk loading and querying of the processed datasets in SQLite.
+
+    Tables load on first use (and again when their source file changes) or
+    all at once with ``load_all()`` / scripts/load_store.py.
+    """
+
+    def __init__(self, db_path=STORE_PATH, pool_size=POOL_SIZE, datasets=DATASETS, load_chunk=LOAD_CHUNK):
+        self.pool = ConnectionPool(db_path, pool_size)
+        self.datasets = dict(datasets)
+        self.load_chunk = load_chunk
+        self._load_lock = threading.Lock()
+        self._columns = {}
+        self.latency = deque(maxlen=1000)  # seconds per query
+
+    def _stored_signature(self, connection, table):
+        row = connection.execute("SELECT signature FROM _sources WHERE tbl = ?", (table,)).fetchone()
+        return row[0] if row else None
+
+    def ensure(self, table):
+        """Load ``table`` if it's missing or its source file changed."""
+        if table not in self.datasets:
+            raise KeyError(f"Unknown table: {table}")
+        path = self.datasets[table]
+        signature = _signature(path)
+        with self.pool.connection() as connection:
+            if self._stored_signature(connection, table) == signature:
+                return table
+        with self._load_lock:
+            # Another thread may have loaded it while we waited
+            with self.pool.connection() as connection:
+                stale = self._stored_signature(connection, table) != signature
+            if stale:
+                self.load(table)
+        return table
+
+    def load(self, table):
+        """Bulk-load ``table`` from its artifact; returns (rows, seconds).
+
+        Rows go in with executemany inside one transaction, under a scratch
+        name. Indexes are built after the data (one sort instead of an update
+        per row), then the scratch table is swapped in, so readers only ever
+        see a complete table.
+        """
+        path = self.datasets[table]
+        signature = _signature(path)
+        directory, filename = os.path.split(path)
+        name = os.path.splitext(filename)[0]
+        scratch = table + "__loading"
+        start = time.perf_counter()
+        rows = 0
+        with self.pool.connection() as connection:
+            connection.execute(f"DROP TABLE IF EXISTS {_quote(scratch)}")
+            columns = None
+            insert = None
+            with connection:
+                for chunk in iter_artifact(name, self.load_chunk, directory=directory or "."):
+                    if columns is None:
+                        columns = list(chunk.columns)
+                        spec = ", ".join(f"{_quote(c)} {_sql_type(chunk[c].dtype)}" for c in columns)
+                        connection.execute(f"CREATE TABLE {_quote(scratch)} ({spec})")
+                        marks = ", ".join("?" for _ in columns)
+                        insert = f"INSERT INTO {_quote(scratch)} VALUES ({marks})"
+                    connection.executemany(insert, _rows(chunk[columns]))
+                    rows += len(chunk)
+            if columns is None:
+                raise ValueError(f"{path} has no rows to load")
+            with connection:
+                # DDL doesn't open a transaction by itself; without BEGIN each
+                # statement would commit on its own
+                connection.execute("BEGIN IMMEDIATE")
+                connection.execute(f"DROP TABLE IF EXISTS {_quote(table)}")
+                connection.execute(f"ALTER TABLE {_quote(scratch)} RENAME TO {_quote(table)}")
+                for column in INDEX_COLUMNS:
+                    if column in columns:
+                        connection.execute(f"CREATE INDEX {_quote(f'ix_{table}_{column}')} "
+                                           f"ON {_quote(table)} ({_quote(column)})")
+                connection.execute(f"ANALYZE {_quote(table)}")
+                connection.execute("INSERT OR REPLACE INTO _sources VALUES (?, ?)", (table, signature))
+        self._columns.pop(table, None)
+        return rows, time.perf_counter() - start
+
+    def columns(self, table):
+        """Column names of ``table`` (loading it if needed)."""
+        self.ensure(table)
+        if table not in self._columns:
+            with self.pool.connection() as connection:
+                info = connection.execute(f"PRAGMA table_info({_quote(table)})").fetchall()
+            self._columns[table] = [row[1] for row in info]
+        return self._columns[table]
+
+    def load_all(self, tables=None):
+        """Load every dataset whose source exists; returns {table: (rows, seconds)}."""
+        loaded = {}
+        for table in tables or self.datasets:
+            if os.path.exists(resolve_artifact(self.datasets[table])):
+                with self._load_lock:
+                    loaded[table] = self.load(table)
+        return loaded
+
+    def query(self, sql, params=(), tables=()):
+        """Run ``sql`` on a pooled connection and return a DataFrame.
+
+        ``tables`` are loaded / refreshed first.
+        """
+        for table in tables:
+            self.ensure(table)
+        start = time.perf_counter()
+        with self.pool.connection() as connection:
+            df = pd.read_sql_query(sql, connection, params=params)
+        self.latency.append(time.perf_counter() - start)
+        return df
+
+    def lookup(self, table, column, value, columns=None):
+        """Rows of ``table`` where ``column`` == ``value`` (an index seek on key columns)."""
+        known = self.columns(table)
+        for name in [column] + list(columns or []):
+            if name not in known:
+                raise KeyError(f"Unknown column: {name}")
+        select = ", ".join(_quote(c) for c in columns) if columns else "*"
+        return self.query(f"SELECT {select} FROM {_quote(table)} WHERE {_quote(column)} = ?", (value,))
+
+    def read(self, table, columns=None):
+        """The whole of ``table`` (or just ``columns``) as a DataFrame."""
+        select = ", ".join(_quote(c) for c in columns) if columns else "*"
+        return self.query(f"SELECT {select} FROM {_quote(table)}", tables=(table,))
+
+    def latency_stats(self):
+        """Query count and p50 / p95 latency (seconds) over recent queries."""
+        seconds = sorted(self.latency)
+        if not seconds:
+            return {"queries": 0, "p50": 0.0, "p95": 0.0}
+        return {
+            "queries": len(seconds),
+            "p50": seconds[len(seconds) // 2],
+            "p95": seconds[min(len(seconds) - 1, int(len(seconds) * 0.95))],
+        }
+
+
+# Shared by every Streamlit session running in this process
+_store = Store()
+
+
+def store_query(sql, params=(), tables=()):
+    return _store.query(sql, params, tables)
+
+
+def store_lookup(table, column, value, columns=None):
+    return _store.lookup(table, column, value, columns)
+
+
+def store_read(table, columns=None):
+    return _store.read(table, columns)
+
+
+def store_stats():
+    return _store.latency_stats()
+
+
+def load_store(tables=None):
+    return _store.load_all(tables)
@@ -0,0 +1,196 @@
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import deque, namedtuple
+
+import pandas as pd
+
+from backend.artifact_store import iter_artifact, resolve_artifact
+
+# Query layer behind the dashboard's paged tables: each CSV/Parquet artifact
+# is copied into SQLite once (and again when the file changes), then filters,
+# sorting, column selection and LIMIT/OFFSET run in SQL so only the visible
+# page of rows ever reaches pandas / the browser.
+
+DB_PATH = os.environ.get("MARKETLENS_TABLE_DB", "data/processed/table_views.sqlite")
+LOAD_CHUNK = 100_000
+PAGE_SIZE = 50
+
+# UI operator -> SQL; "contains" becomes LIKE %value%
+OPERATORS = {"=": "=", "!=": "!=", "<": "<", "<=": "<=", ">": ">", ">=": ">=", "contains": "LIKE"}
+
+Page = namedtuple("Page", ["rows", "total", "page", "page_size", "seconds"])
+
+
+def _quote(name):
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+def _table_name(path):
+    return "t_" + re.sub(r"\W", "_", os.path.normpath(path))
+
+
+def _signature(path):
+    stat = os.stat(resolve_artifact(path))
+    return f"{stat.st_mtime_ns}:{stat.st_size}"
+
+
+class TableQuery:
+    """SQL-backed filtering / sorting / paging over processed artifacts.
+
+    Connections are per thread (Streamlit serves each session from its own
+    thread); the database runs in WAL mode so page queries don't block on a
+    table being reloaded.
+    """
+
+    def __init__(self, db_path=DB_PATH, load_chunk=LOAD_CHUNK):
+        self.db_path = db_path
+        self.load_chunk = load_chunk
+        self._local = threading.local()
+        self._load_lock = threading.Lock()
+        self._columns = {}
+        # (table, file signature, WHERE, params) -> matching row count; paging
+        # through the same filter doesn't need to count again
+        self._counts = {}
+        self.latency = deque(maxlen=500)  # (path, seconds) per query
+
+    def _connection(self):
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
+            connection = sqlite3.connect(self.db_path, timeout=30)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("CREATE TABLE IF NOT EXISTS _sources (tbl TEXT PRIMARY KEY, signature TEXT)")
+            self._local.connection = connection
+        return connection
+
+    def _stored_signature(self, connection, table):
+        row = connection.execute("SELECT signature FROM _sources WHERE tbl = ?", (table,)).fetchone()
+        return row[0] if row else None
+
+    def table(self, path):
+        """SQLite table holding ``path``, (re)loading it when the file changed."""
+        table = _table_name(path)
+        connection = self._connection()
+        signature = _signature(path)
+        if self._stored_signature(connection, table) == signature:
+            return table
+        with self._load_lock:
+            # Another thread may have loaded it while we waited
+            if self._stored_signature(connection, table) != signature:
+                self._load(connection, path, table, signature)
+        return table
+
+    def _load(self, connection, path, table, signature):
+        # Load under a scratch name and swap it in, so readers only ever see
+        # a complete table
+        scratch = table + "__loading"
+        connection.execute(f"DROP TABLE IF EXISTS {_quote(scratch)}")
+        directory, filename = os.path.split(path)
+        name = os.path.splitext(filename)[0]
+        for chunk in iter_artifact(name, self.load_chunk, directory=directory or "."):
+            chunk.to_sql(scratch, connection, if_exists="append", index=False, chunksize=self.load_chunk)
+        with connection:
+            connection.execute(f"DROP TABLE IF EXISTS {_quote(table)}")
+            connection.execute(f"ALTER TABLE {_quote(scratch)} RENAME TO {_quote(table)}")
+            connection.execute("INSERT OR REPLACE INTO _sources VALUES (?, ?)", (table, signature))
+        self._columns.pop(table, None)
+
+    def columns(self, path):
+        """Column name -> declared SQLite type for ``path``."""
+        table = self.table(path)
+        if table not in self._columns:
+            info = self._connection().execute(f"PRAGMA table_info({_quote(table)})").fetchall()
+            self._columns[table] = {row[1]: row[2] for row in info}
+        return self._columns[table]
+
+    def _index(self, connection, table, column):
+        # A sort column gets an index the first time it's used, so a page is
+        # an ordered index walk that stops after LIMIT rows. Filter columns
+        # are left alone: on low-selectivity columns (gender, age ranges) an
+        # index lookup per row is slower than a scan. ANALYZE keeps the
+        # planner from picking those anyway once other indexes exist
+        name = f"ix_{table}_{column}"
+        if not connection.execute("SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = ?", (name,)).fetchone():
+            # Another session may create it between the check and here
+            connection.execute(f"CREATE INDEX IF NOT EXISTS {_quote(name)} ON {_quote(table)} ({_quote(column)})")
+            connection.execute(f"ANALYZE {_quote(table)}")
+
+    def _where(self, filters, known):
+        clauses, params = [], []
+        for column, operator, value in filters:
+            if column not in known:
+                raise KeyError(f"Unknown column: {column}")
+            if operator not in OPERATORS:
+                raise ValueError(f"Unknown operator: {operator}")
+            if operator == "contains":
+                clauses.append(f"CAST({_quote(column)} AS TEXT) LIKE ?")
+                params.append(f"%{value}%")
+            else:
+                clauses.append(f"{_quote(column)} {OPERATORS[operator]} ?")
+                params.append(value)
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+    def query(self, path, columns=None, filters=(), sort=None, descending=False, page=0, page_size=PAGE_SIZE):
+        """One page of ``path`` after filtering and sorting in SQLite.
+
+        ``filters`` is a list of (column, operator, value) with operators from
+        ``OPERATORS``. Returns a Page(rows, total matching rows, page,
+        page_size, seconds).
+        """
+        start = time.perf_counter()
+        table = self.table(path)
+        known = self.columns(path)
+        columns = list(columns) if columns else list(known)
+        for column in columns + ([sort] if sort else []):
+            if column not in known:
+                raise KeyError(f"Unknown column: {column}")
+
+        connection = self._connection()
+        where, params = self._where(filters, known)
+        if sort:
+            self._index(connection, table, sort)
+
+        count_key = (table, _signature(path), where, tuple(params))
+        if count_key not in self._counts:
+            if len(self._counts) > 1000:
+                self._counts.clear()
+            self._counts[count_key] = connection.execute(f"SELECT COUNT(*) FROM {_quote(table)}{where}", params).fetchone()[0]
+        total = self._counts[count_key]
+        # rowid breaks ties, so rows with equal sort keys never hop between pages
+        order = f" ORDER BY {_quote(sort)} {'DESC' if descending else 'ASC'}, rowid" if sort else ""
+        select = ", ".join(_quote(c) for c in columns)
+        sql = f"SELECT {select} FROM {_quote(table)}{where}{order} LIMIT ? OFFSET ?"
+        rows = pd.read_sql_query(sql, connection, params=params + [page_size, page * page_size])
+
+        seconds = time.perf_counter() - start
+        self.latency.append((path, seconds))
+        return Page(rows, total, page, page_size, seconds)
+
+    def latency_stats(self):
+        """Query count and p50 / p95 latency (seconds) over recent queries."""
+        seconds = sorted(s for _, s in self.latency)
+        if not seconds:
+            return {"queries": 0, "p50": 0.0, "p95": 0.0}
+        return {
+            "queries": len(seconds),
+            "p50": seconds[len(seconds) // 2],
+            "p95": seconds[min(len(seconds) - 1, int(len(seconds) * 0.95))],
+        }
+
+
+_tables = TableQuery()
+
+
+def query_table(path, columns=None, filters=(), sort=None, descending=False, page=0, page_size=PAGE_SIZE):
+    return _tables.query(path, columns, filters, sort, descending, page, page_size)
+
+
+def table_columns(path):
+    return _tables.columns(path)
+
+
+def latency_stats():
+    return _tables.latency_stats()
@@ -0,0 +1,127 @@
+import math
+import os
+import time
+
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed
+from sklearn.base import clone
+from sklearn.metrics import roc_auc_score
+from sklearn.model_selection import ParameterSampler, StratifiedKFold
+
+# Random-forest search space for the ad-click model
+RF_SPACE = {
+    "n_estimators": [50, 100, 200, 400],
+    "max_depth": [None, 8, 16, 32],
+    "min_samples_leaf": [1, 2, 5, 10],
+    "max_features": ["sqrt", 0.5, None],
+}
+
+
+def _fit_fold(estimator, params, X, y, train, test, scoring):
+    model = clone(estimator).set_params(**params)
+    start = time.perf_counter()
+    model.fit(X[train], y[train])
+    fit_seconds = time.perf_counter() - start
+    if scoring == "roc_auc":
+        score = roc_auc_score(y[test], model.predict_proba(X[test])[:, 1])
+    else:
+        score = model.score(X[test], y[test])
+    return score, fit_seconds
+
+
+def _rung_rows(n_rows, n_rungs, factor, min_rows):
+    # Training rows per rung: the last rung uses everything, each earlier one
+    # ``factor`` times fewer (never below ``min_rows``)
+    return [max(min_rows, n_rows // factor ** (n_rungs - 1 - r)) for r in range(n_rungs)]
+
+
+def successive_halving(estimator, X, y, space=RF_SPACE, budget_seconds=300, n_candidates=27, factor=3,
+                       cv=3, min_rows=200, scoring="accuracy", n_jobs=-1, random_state=42):
+    """Cross-validated successive-halving search under a wall-clock budget.
+
+    Every rung scores the surviving candidates with ``cv``-fold CV on a row
+    subsample (all candidate x fold fits run in parallel across cores), then
+    keeps the best 1/``factor`` and gives them ``factor`` times more rows.
+    Before each rung the search projects its cost from the previous one and
+    stops once that would overrun ``budget_seconds``; a rung that runs past
+    the budget stops starting new fits. The best candidate of the last
+    (possibly partial) rung wins.
+
+    Returns (per-rung results frame, best params, search summary dict).
+    """
+    start = time.perf_counter()
+    y = np.asarray(y)
+    candidates = list(ParameterSampler(space, n_candidates, random_state=random_state))
+    n_rungs = max(1, math.ceil(math.log(n_candidates, factor)) + 1)
+    rows_per_rung = _rung_rows(X.shape[0], n_rungs, factor, min_rows)
+    rng = np.random.default_rng(random_state)
+    order = rng.permutation(X.shape[0])
+
+    results, stop_reason = [], "finished"
+    best_params, best_score, last = None, None, None
+    for rung, n_rows in enumerate(rows_per_rung):
+        elapsed = time.perf_counter() - start
+        if last is not None:
+            # Cost scales with candidates x rows; the first rung always runs
+            last_seconds, last_candidates, last_rows = last
+            projected = last_seconds * len(candidates) / last_candidates * n_rows / last_rows
+            if elapsed + projected > budget_seconds:
+                stop_reason = f"budget: rung {rung} projected {projected:.1f}s with {budget_seconds - elapsed:.1f}s left"
+                break
+
+        rung_start = time.perf_counter()
+        rows = np.sort(order[:n_rows])
+        X_rung, y_rung = X[rows], y[rows]
+        folds = list(StratifiedKFold(cv, shuffle=True, random_state=random_state).split(np.zeros(n_rows), y_rung))
+        # Fits are dispatched lazily, so once the budget runs out no new ones
+        # start; candidates without all their folds are dropped from the rung
+        fits = Parallel(n_jobs=n_jobs, return_as="generator", pre_dispatch="2*n_jobs")(
+            delayed(_fit_fold)(estimator, params, X_rung, y_rung, train, test, scoring)
+            for params in candidates for train, test in folds
+        )
+        scores = []
+        for score in fits:
+            scores.append(score)
+            if time.perf_counter() - start > budget_seconds and len(scores) >= cv and len(scores) % cv == 0:
+                break
+        fits.close()
+        if len(scores) < len(candidates) * cv:
+            stop_reason = f"budget: rung {rung} cut after {len(scores) // cv} of {len(candidates)} candidates"
+            candidates = candidates[:len(scores) // cv]
+        scores = np.asarray(scores).reshape(len(candidates), cv, 2)
+        last = (time.perf_counter() - rung_start, len(candidates), n_rows)
+
+        for params, fold_scores in zip(candidates, scores):
+            results.append({
+                "rung": rung,
+                "n_rows": n_rows,
+                "params": params,
+                "mean_score": float(fold_scores[:, 0].mean()),
+                "std_score": float(fold_scores[:, 0].std()),
+                "fit_seconds": float(fold_scores[:, 1].mean()),
+            })
+
+        mean_scores = scores[:, :, 0].mean(axis=1)
+        ranked = np.argsort(-mean_scores, kind="stable")
+        best_params, best_score = candidates[ranked[0]], float(mean_scores[ranked[0]])
+        if len(candidates) == 1 or stop_reason != "finished":
+            break
+        candidates = [candidates[i] for i in ranked[:max(1, len(candidates) // factor)]]
+
+    results = pd.DataFrame(results)
+    summary = {
+        "scoring": scoring,
+        "cv": cv,
+        "factor": factor,
+        "n_candidates": n_candidates,
+        "rungs_planned": n_rungs,
+        "rungs_completed": int(results["rung"].max()) + 1,
+        "budget_seconds": budget_seconds,
+        "search_seconds": time.perf_counter() - start,
+        "stop_reason": stop_reason,
+        "n_jobs": os.cpu_count() if n_jobs == -1 else n_jobs,
+        "best_params": best_params,
+        "best_cv_score": best_score,
+    }
+    return results, best_params, summary
@@ -0,0 +1,115 @@
+import hashlib
+import io
+import json
+import os
+import time
+
+import pandas as pd
+
+from backend.schemas import apply_schema, reader_options
+
+WATERMARK_PATH = "data/processed/.watermarks"
+
+# Hash in 8 MB blocks so checking a multi-GB prefix never loads it at once
+BLOCK_SIZE = 8 * 1024 * 1024
+
+
+def watermark_file(name):
+    return os.path.join(WATERMARK_PATH, f"{name}.json")
+
+
+def load_watermark(name):
+    path = watermark_file(name)
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_watermark(name, watermark):
+    os.makedirs(WATERMARK_PATH, exist_ok=True)
+    with open(watermark_file(name), "w") as f:
+        json.dump(watermark, f, indent=2)
+
+
+def _hash_bytes(f, length, digest):
+    remaining = length
+    while remaining > 0:
+        block = f.read(min(BLOCK_SIZE, remaining))
+        if not block:
+            break
+        digest.update(block)
+        remaining -= len(block)
+    return digest
+
+
+def _ends_with_newline(f, size):
+    f.seek(max(size - 1, 0))
+    return f.read(1) == b"\n"
+
+
+def snapshot(path):
+    """Describe the raw file as it is right now, before it gets read."""
+    size = os.path.getsize(path)
+    with open(path, "rb") as f:
+        digest = _hash_bytes(f, size, hashlib.sha256())
+        return {
+            "offset": size,
+            "ends_with_newline": _ends_with_newline(f, size),
+            "prefix_sha256": digest.hexdigest(),
+        }
+
+
+def plan_update(name, path, artifact_path):
+    """Decide how to bring ``artifact_path`` up to date with the raw file.
+
+    Returns ``("append", state)`` when the raw file only grew since the last
+    run (same bytes up to the stored offset, which ended on a full line);
+    ``state`` holds the byte range to clean and the watermark to store once
+    it is written. Otherwise returns ``("full", reason)``.
+    """
+    watermark = load_watermark(name)
+    if watermark is None:
+        return "full", "no watermark yet"
+    if not os.path.exists(artifact_path):
+        return "full", "processed artifact is missing"
+    if not watermark["ends_with_newline"]:
+        return "full", "last run ended on a partial line"
+    size = os.path.getsize(path)
+    start = watermark["offset"]
+    if size < start:
+        return "full", "raw file shrank"
+
+    with open(path, "rb") as f:
+        # One pass: verify the old prefix, then extend the same hash over the tail
+        digest = _hash_bytes(f, start, hashlib.sha256())
+        if digest.hexdigest() != watermark["prefix_sha256"]:
+            return "full", "already-processed rows changed"
+        _hash_bytes(f, size - start, digest)
+        return "append", {
+            "start": start,
+            "offset": size,
+            "ends_with_newline": _ends_with_newline(f, size),
+            "prefix_sha256": digest.hexdigest(),
+        }
+
+
+def read_tail(name, path, start, end, chunksize=None):
+    """Yield typed frames for the raw rows between byte ``start`` and ``end``."""
+    with open(path, "rb") as f:
+        header = f.readline()
+        f.seek(start)
+        data = f.read(end - start)
+    options = reader_options(name)
+    buffer = io.BytesIO(header + data)
+    if chunksize:
+        for chunk in pd.read_csv(buffer, chunksize=chunksize, **options):
+            yield apply_schema(chunk, name)
+    else:
+        yield apply_schema(pd.read_csv(buffer, **options), name)
+
+
+def record(name, state, rows, mode):
+    watermark = {key: state[key] for key in ("offset", "ends_with_newline", "prefix_sha256")}
+    watermark.update({"mode": mode, "rows_written": rows, "updated_at": time.strftime("%Y-%m-%d %H:%M:%S")})
+    save_watermark(name, watermark)
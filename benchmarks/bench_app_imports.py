@@ -0,0 +1,91 @@
+# Cold import cost of the dashboard: the app shell, then each page module on
+# top of it, with the heaviest packages behind each (python -X importtime).
+# Usage: python benchmarks/bench_app_imports.py [--top 5] [--save imports.csv] [--max-shell-ms 1500]
+
+import argparse
+import ast
+import os
+import subprocess
+import sys
+from collections import defaultdict
+
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+from views import PAGES
+
+
+def app_imports(path=os.path.join(ROOT, "app.py")):
+    """Modules app.py imports at module level, read from its source."""
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read())
+    modules = []
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            modules += [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            modules.append(node.module)
+    return list(dict.fromkeys(modules))
+
+
+# What app.py imports before any page is drawn
+SHELL = app_imports()
+# The same shell plus what the old single-file app.py imported up front for every page
+EAGER = SHELL + ["matplotlib.pyplot", "seaborn", "PIL.Image", "streamlit_lottie"]
+
+
+def importtime(modules, already=()):
+    """Per-module self/cumulative microseconds for a cold import of ``modules``.
+
+    ``already`` is imported first and left out, so the numbers are what
+    ``modules`` add on top of it.
+    """
+    code = "".join(f"import {m}\n" for m in already) + "import sys; sys.stderr.write('--start--\\n')\n"
+    code += "".join(f"import {m}\n" for m in modules)
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", code], cwd=ROOT,
+                            capture_output=True, text=True, check=True)
+    stderr = result.stderr.split("--start--\n", 1)[1]
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append({"module": name.strip(), "self_us": int(self_us), "cumulative_us": int(cumulative_us)})
+    return pd.DataFrame(rows, columns=["module", "self_us", "cumulative_us"])
+
+
+def by_package(rows, top):
+    # Self time summed per top-level package, heaviest first
+    totals = defaultdict(int)
+    for module, self_us in zip(rows["module"], rows["self_us"]):
+        totals[module.split(".")[0]] += self_us
+    return sorted(totals.items(), key=lambda item: -item[1])[:top]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--top", type=int, default=5, help="heaviest packages to list per entry")
+    parser.add_argument("--save", help="write the per-entry totals to this CSV")
+    parser.add_argument("--max-shell-ms", type=float, help="exit 1 when the app shell import is slower than this")
+    args = parser.parse_args()
+
+    entries = [("app shell", SHELL, ()), ("old eager app.py", EAGER, ())]
+    entries += [(f"page: {page}", [f"views.{module}"], SHELL) for page, module in PAGES.items()]
+
+    report = []
+    for label, modules, already in entries:
+        rows = importtime(modules, already)
+        total_ms = rows["self_us"].sum() / 1000
+        heaviest = ", ".join(f"{name} {us / 1000:.0f}" for name, us in by_package(rows, args.top))
+        report.append({"entry": label, "import_ms": total_ms, "modules": len(rows), "heaviest_ms": heaviest})
+        extra = " (on top of the shell)" if already else ""
+        print(f"⏱️ {label:<36} {total_ms:8.0f} ms, {len(rows):4d} modules{extra}  [{heaviest}]")
+
+    if args.save:
+        pd.DataFrame(report).to_csv(args.save, index=False)
+        print(f"✅ Report saved to {args.save}")
+
+    if args.max_shell_ms is not None and report[0]["import_ms"] > args.max_shell_ms:
+        print(f"❌ App shell import {report[0]['import_ms']:.0f} ms is over the {args.max_shell_ms:.0f} ms limit")
+        sys.exit(1)
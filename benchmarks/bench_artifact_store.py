@@ -0,0 +1,54 @@
+# Read/write benchmark: CSV vs the Parquet artifact store on SELL_1 and Rotation.
+# Usage: python benchmarks/bench_artifact_store.py [--scale 20] [--repeat 3]
+
+import argparse
+import os
+import sys
+import tempfile
+
+import pandas as pd
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from backend.artifact_store import artifact_paths, read_table, save_artifact
+from common import best_of
+
+DATASETS = {
+    "sell_1_cleaned": ["Date", "PKod", "Pquantity", "pce_zn"],
+    "rotation_cleaned": ["PKod", "Pname", "Psale"],
+}
+
+
+def run(name, columns, scale, repeat, workdir):
+    df = pd.read_csv(artifact_paths(name)[0])
+    if scale > 1:
+        df = pd.concat([df] * scale, ignore_index=True)
+    csv_path, parquet_path = artifact_paths(name, workdir)
+
+    results = {
+        "write csv": best_of(repeat, lambda: df.to_csv(csv_path, index=False)),
+        "write parquet": best_of(repeat, lambda: save_artifact(df, name, workdir, write_csv=False)),
+        "read csv": best_of(repeat, lambda: read_table(csv_path)),
+        "read parquet": best_of(repeat, lambda: read_table(parquet_path)),
+        "read csv (projected)": best_of(repeat, lambda: read_table(csv_path, columns=columns)),
+        "read parquet (projected)": best_of(repeat, lambda: read_table(parquet_path, columns=columns)),
+        "read parquet (projected, mmap)": best_of(
+            repeat, lambda: read_table(parquet_path, columns=columns, memory_map=True)
+        ),
+    }
+    size_csv = os.path.getsize(csv_path) / 1024 / 1024
+    size_parquet = os.path.getsize(parquet_path) / 1024 / 1024
+
+    print(f"\n📦 {name}: {len(df):,} rows, CSV {size_csv:.1f} MB, Parquet {size_parquet:.1f} MB")
+    for label, seconds in results.items():
+        print(f"  {label:<32} {seconds * 1000:9.1f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--scale", type=int, default=20, help="replicate each dataset N times")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        for name, columns in DATASETS.items():
+            run(name, columns, args.scale, args.repeat, workdir)
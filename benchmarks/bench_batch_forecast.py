@@ -0,0 +1,64 @@
+# Vectorized per-series Holt-Winters at 1k / 10k / 100k daily series.
+# Usage: python benchmarks/bench_batch_forecast.py [--series 1000 10000 100000] [--days 365]
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from backend.batch_forecast import build_matrix, forecast_matrix
+
+
+def synthetic_sales(n_series, days, density, rng):
+    # Weekly-seasonal daily sales, keeping only the days a product actually sold
+    t = np.arange(days)
+    base = rng.gamma(2.0, 5.0, size=(n_series, 1))
+    weekly = 1 + 0.3 * np.sin(2 * np.pi * t / 7)
+    y = rng.poisson(base * weekly)
+    rows, cols = np.nonzero((rng.random((n_series, days)) < density) & (y > 0))
+    return pd.DataFrame({
+        "PKod": rows,
+        "Date": pd.Timestamp("2018-01-01") + pd.to_timedelta(cols, unit="D"),
+        "Pquantity": y[rows, cols].astype("float64"),
+    })
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--series", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--density", type=float, default=0.3, help="share of days with a sale")
+    parser.add_argument("--baseline", type=int, default=20,
+                        help="series to fit one by one with statsmodels for comparison (0 to skip)")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(42)
+    for n in args.series:
+        df = synthetic_sales(n, args.days, args.density, rng)
+
+        start = time.perf_counter()
+        y, keys, periods = build_matrix(df, "PKod", "Pquantity", freq="D")
+        pivot = time.perf_counter() - start
+
+        start = time.perf_counter()
+        forecast, _ = forecast_matrix(y, horizon=30, season=7)
+        fit = time.perf_counter() - start
+
+        print(f"📈 {n:>7,} series x {len(periods)} days ({len(df):,} rows): "
+              f"pivot {pivot:6.2f} s, fit+forecast {fit:6.2f} s, {n / fit:10,.0f} series/sec")
+
+    if args.baseline:
+        import warnings
+        from statsmodels.tsa.holtwinters import ExponentialSmoothing
+
+        warnings.simplefilter("ignore")
+        start = time.perf_counter()
+        for row in y[:args.baseline]:
+            ExponentialSmoothing(row, trend="add", seasonal="add", seasonal_periods=7).fit().forecast(30)
+        per_series = (time.perf_counter() - start) / args.baseline
+        print(f"🐢 statsmodels loop: {1 / per_series:,.0f} series/sec "
+              f"(~{per_series * max(args.series) / 60:,.0f} min for {max(args.series):,} series)")
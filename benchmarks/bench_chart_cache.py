@@ -0,0 +1,64 @@
+# Dashboard chart cost per rerun: drawing with matplotlib/seaborn every time
+# vs. serving the PNG from the chart cache.
+# Usage: python benchmarks/bench_chart_cache.py [--repeat 20] [--scatter-rows 100000]
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import matplotlib
+matplotlib.use("Agg")
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from backend.chart_cache import ChartCache, dataset_fingerprint, render_png
+from backend.downsample import point_budget
+from views.clv import _top_customers_bar
+from views.competitor_analysis import _price_sales_scatter
+from views.customer_segmentation import _segment_pie
+from views.sales_forecast import _forecast_line
+
+
+def synthetic_frames(scatter_rows, rng):
+    forecast = pd.DataFrame({c: rng.normal(100, 10, 30).cumsum() for c in ["ZN", "SB", "TAX", "MARZA", "total_sales"]})
+    segments = pd.DataFrame({"segment": rng.choice(["Champions", "Loyal", "At Risk", "Lost"], 5_000)})
+    clv = pd.DataFrame({"customer_id": np.arange(50_000), "clv": rng.gamma(2, 500, 50_000)})
+    competitor = pd.DataFrame({"Price": rng.uniform(1, 3, scatter_rows), "Sales": rng.poisson(120, scatter_rows)})
+    return forecast, segments, clv, competitor
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--scatter-rows", type=int, default=100_000)
+    args = parser.parse_args()
+
+    forecast, segments, clv, competitor = synthetic_frames(args.scatter_rows, np.random.default_rng(42))
+    line_budget, scatter_budget = point_budget("forecast_line"), point_budget("price_sales_scatter")
+    charts = [(("forecast_line", c), lambda c=c: _forecast_line(forecast, c, line_budget)) for c in forecast.columns]
+    charts += [
+        ("segment_pie", lambda: _segment_pie(segments)),
+        ("top10_clv_bar", lambda: _top_customers_bar(clv)),
+        ("price_sales_scatter", lambda: _price_sales_scatter(competitor, scatter_budget)),
+    ]
+
+    with tempfile.NamedTemporaryFile(suffix=".csv") as data:
+        fingerprint = dataset_fingerprint(data.name)
+        cache = ChartCache()
+        for spec, draw in charts:
+            start = time.perf_counter()
+            png = render_png(draw())
+            draw_ms = (time.perf_counter() - start) * 1000
+
+            cache.get(fingerprint, spec, draw)
+            start = time.perf_counter()
+            for _ in range(args.repeat):
+                cache.get(fingerprint, spec, draw)
+            cached_ms = (time.perf_counter() - start) / args.repeat * 1000
+            print(f"🎨 {str(spec):<32} draw + encode {draw_ms:8.1f} ms, cached {cached_ms:8.4f} ms, {len(png) / 1024:6.0f} KB")
+
+    stats = cache.stats()
+    print(f"📦 {stats['entries']} charts cached in {stats['cached_mb']:.1f} MB, hit ratio {stats['hit_ratio']:.0%}")
@@ -0,0 +1,65 @@
+# BG/NBD + Gamma-Gamma fit and score time against customer count.
+# Usage: python benchmarks/bench_clv.py [--customers 10000 100000 1000000]
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from backend.clv import fit_bgnbd, fit_gamma_gamma, score
+
+# Generating parameters; the fit should land close to these
+TRUE_BGNBD = {"r": 0.25, "alpha": 4.0, "a": 0.8, "b": 2.5}
+TRUE_GAMMA_GAMMA = {"p": 6.0, "q": 4.0, "v": 15.0}
+
+
+def synthetic_customers(n, rng):
+    # Straight from the generative story: Poisson purchases at rate lam,
+    # dropping out after each repeat purchase with probability p_drop
+    T = rng.integers(30, 366, n).astype("float64")
+    lam = rng.gamma(TRUE_BGNBD["r"], 1 / TRUE_BGNBD["alpha"], n)
+    p_drop = rng.beta(TRUE_BGNBD["a"], TRUE_BGNBD["b"], n)
+    arrivals = rng.poisson(lam * T)
+    survive = rng.geometric(p_drop)  # repeat purchases until (and including) the last one
+    x = np.minimum(arrivals, survive).astype("float64")
+    # x-th of ``arrivals`` uniform arrival times in [0, T]
+    t_x = np.zeros(n)
+    repeat = x > 0
+    t_x[repeat] = np.floor(rng.beta(x[repeat], arrivals[repeat] - x[repeat] + 1) * T[repeat])
+
+    nu = rng.gamma(TRUE_GAMMA_GAMMA["q"], 1 / TRUE_GAMMA_GAMMA["v"], n)
+    m = np.zeros(n)
+    m[repeat] = rng.gamma(TRUE_GAMMA_GAMMA["p"] * x[repeat], 1 / (nu[repeat] * x[repeat]))
+    return pd.DataFrame({"frequency": x, "recency": t_x, "T": T, "monetary_value": m})
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--customers", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(42)
+    for n in args.customers:
+        summary = synthetic_customers(n, rng)
+
+        start = time.perf_counter()
+        bgnbd, _ = fit_bgnbd(summary)
+        bgnbd_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        gamma_gamma, _ = fit_gamma_gamma(summary)
+        gamma_gamma_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        scored = score(summary, bgnbd, gamma_gamma)
+        score_seconds = time.perf_counter() - start
+
+        fitted = ", ".join(f"{k}={v:.2f}" for k, v in {**bgnbd, **gamma_gamma}.items())
+        print(f"💰 {n:>10,} customers: BG/NBD fit {bgnbd_seconds:6.2f} s, Gamma-Gamma fit {gamma_gamma_seconds:6.2f} s, "
+              f"score {score_seconds:6.2f} s ({n / score_seconds:12,.0f} customers/sec)  [{fitted}]")
+    truth = ", ".join(f"{k}={v:.2f}" for k, v in {**TRUE_BGNBD, **TRUE_GAMMA_GAMMA}.items())
+    print(f"🎯 generating params: [{truth}]")
@@ -0,0 +1,62 @@
+# Daily refresh cost: one incremental RollingMetrics update vs. recomputing the
+# rolling windows over the whole history with pandas.
+# Usage: python benchmarks/bench_competitor_metrics.py [--days 1000 10000 100000]
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from backend.competitor_metrics import RollingMetrics
+
+
+def synthetic_days(n, rng):
+    price = np.round(1.29 + np.cumsum(rng.choice([0, 0, 0, 0, 0, 0, 0.1, -0.1], n)).clip(-1, 3), 2)
+    # Starts early so 100k+ days still fit in datetime64[ns]
+    return pd.DataFrame({
+        "Date": pd.date_range("1700-01-01", periods=n, freq="D"),
+        "Sales": rng.poisson(120, n),
+        "Stock": rng.integers(-200, 5000, n).clip(0),
+        "Price": price,
+    })
+
+
+def full_recompute(df):
+    s = df.set_index("Date")
+    stockout = (s["Stock"] <= 0).astype(int)
+    return pd.DataFrame({
+        "sales_7d": s["Sales"].rolling("7D").sum(),
+        "sales_30d": s["Sales"].rolling("30D").sum(),
+        "stockout_days_30d": stockout.rolling("30D").sum(),
+        "price_change_pct": s["Price"].pct_change() * 100,
+    })
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--days", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--refresh", type=int, default=1_000, help="daily refreshes to time")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(42)
+    for n in args.days:
+        df = synthetic_days(n + args.refresh, rng)
+        history, new_days = df.iloc[:n], df.iloc[n:]
+
+        metrics = RollingMetrics()
+        metrics.update_frame(history)
+        start = time.perf_counter()
+        for values in new_days[["Date", "Sales", "Stock", "Price"]].itertuples(index=False):
+            metrics.update(*values)
+        incremental_us = (time.perf_counter() - start) / args.refresh * 1e6
+
+        start = time.perf_counter()
+        full_recompute(df)
+        full_ms = (time.perf_counter() - start) * 1e3
+
+        print(f"📅 {n:>8,} days of history: incremental {incremental_us:7.1f} µs/day, "
+              f"full pandas recompute {full_ms:8.1f} ms/day")
@@ -0,0 +1,54 @@
+# Chart render time as the data grows: plotting every point vs. the point
+# budget (LTTB for lines, density grid for scatters).
+# Usage: python benchmarks/bench_downsample.py [--sizes 10000 100000 1000000 10000000] [--max-full 1000000]
+
+import argparse
+import os
+import sys
+import time
+
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from backend.chart_cache import render_png
+from backend.downsample import plot_line, plot_scatter, point_budget
+
+
+def render_ms(draw):
+    # Draw + PNG encode, the same work a chart-cache miss does
+    start = time.perf_counter()
+    fig, ax = plt.subplots(figsize=(10, 4))
+    draw(ax)
+    render_png(fig)
+    return (time.perf_counter() - start) * 1000
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000, 10_000_000])
+    parser.add_argument("--max-full", type=int, default=1_000_000, help="skip plotting every point above this size")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(42)
+    line_budget, scatter_budget = point_budget("forecast_line"), point_budget("price_sales_scatter")
+    print(f"📏 Budgets: line {line_budget:,} points, scatter {scatter_budget:,} points")
+
+    for n in args.sizes:
+        x = np.arange(n, dtype="float64")
+        y = rng.normal(0, 1, n).cumsum()
+        price = rng.uniform(1, 3, n)
+        sales = rng.poisson(120 - 20 * price)
+
+        budget_line = render_ms(lambda ax: plot_line(ax, x, y, line_budget))
+        budget_scatter = render_ms(lambda ax: plot_scatter(ax, price, sales, scatter_budget))
+        if n <= args.max_full:
+            full_line = f"{render_ms(lambda ax: ax.plot(x, y)):7.0f} ms"
+            full_scatter = f"{render_ms(lambda ax: ax.scatter(price, sales)):7.0f} ms"
+        else:
+            full_line = full_scatter = "  skipped"
+
+        print(f"🎨 {n:>11,} points | line: all {full_line:>10}, budget {budget_line:7.0f} ms"
+              f" | scatter: all {full_scatter:>10}, budget {budget_scatter:7.0f} ms")
@@ -0,0 +1,70 @@
+# Grouped closed-form elasticities against one LinearRegression per product.
+# Usage: python benchmarks/bench_elasticity.py [--products 1000 10000 100000] [--days 30] [--loop-products 2000]
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+from sklearn.linear_model import LinearRegression
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from backend.elasticity import elasticity_table
+
+
+def synthetic_sales(products, days, rng):
+    # Each product has its own baseline price/demand and true elasticity
+    true = rng.normal(-1.5, 0.8, products)
+    pkod = np.repeat(np.arange(products), days)
+    base_price = np.repeat(rng.lognormal(1.5, 1.0, products), days)
+    price = base_price * rng.lognormal(0, 0.15, products * days)
+    demand = np.repeat(rng.lognormal(2.0, 1.0, products), days)
+    quantity = demand * (price / base_price) ** true[pkod] * rng.lognormal(0, 0.3, products * days)
+    groups = np.array([f"G{g:02d}" for g in range(40)])
+    return pd.DataFrame({
+        "PKod": pkod,
+        "Pgroup": groups[pkod % 40],
+        "pce_sb": price,
+        "Pquantity": quantity,
+    }), true
+
+
+def loop_fit(df):
+    # The per-product alternative: one sklearn fit per product
+    slopes = {}
+    for pkod, rows in df.groupby("PKod"):
+        model = LinearRegression().fit(np.log(rows[["pce_sb"]]), np.log(rows["Pquantity"]))
+        slopes[pkod] = model.coef_[0]
+    return slopes
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--products", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--days", type=int, default=30)
+    parser.add_argument("--loop-products", type=int, default=2_000, help="products for the per-product sklearn loop")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(42)
+    for n in args.products:
+        df, true = synthetic_sales(n, args.days, rng)
+        start = time.perf_counter()
+        table = elasticity_table(df)
+        seconds = time.perf_counter() - start
+
+        products = table[table["scope"] == "product"]
+        truth = true[products["PKod"].to_numpy(dtype="int64")]
+        covered = ((products["ci_low"] <= truth) & (truth <= products["ci_high"])).mean()
+        print(f"📈 {n:>8,} products x {args.days} days: grouped fit {seconds:6.2f} s "
+              f"({n / seconds:10,.0f} products/sec), 95% CI covers the true elasticity {covered:.1%}")
+
+    df, _ = synthetic_sales(args.loop_products, args.days, rng)
+    start = time.perf_counter()
+    slopes = loop_fit(df)
+    seconds = time.perf_counter() - start
+    grouped = elasticity_table(df).query("scope == 'product'").set_index("PKod")["elasticity"]
+    max_diff = np.abs(grouped - pd.Series(slopes)).max()
+    print(f"🐢 sklearn loop, {args.loop_products:,} products: {seconds:6.2f} s "
+          f"({args.loop_products / seconds:10,.0f} products/sec), max |difference| vs grouped {max_diff:.1e}")
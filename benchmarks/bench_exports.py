@@ -0,0 +1,65 @@
+# Download-button cost: the old df.to_csv into BytesIO on every rerun vs. the
+# lazily written, on-disk exports (first download builds, later ones read).
+# Usage: python benchmarks/bench_exports.py [--rows 1000000] [--repeat 3]
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from io import BytesIO
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from backend import exports
+from backend.artifact_store import save_artifact
+
+
+def synthetic_frame(rows, rng):
+    return pd.DataFrame({
+        "Date": pd.date_range("2000-01-01", periods=rows, freq="min").astype(str),
+        "PKod": rng.integers(1, 5_000, rows),
+        "Pgroup": rng.choice(["A", "B", "C", "D"], rows),
+        "Price": rng.uniform(1, 50, rows).round(2),
+        "Sales": rng.poisson(20, rows),
+    })
+
+
+def best_ms(fn, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times) * 1000
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    df = synthetic_frame(args.rows, np.random.default_rng(42))
+    with tempfile.TemporaryDirectory() as tmp:
+        save_artifact(df, "bench", directory=tmp)
+        path = os.path.join(tmp, "bench.csv")
+        exports.EXPORT_DIR = os.path.join(tmp, "exports")
+
+        def old_rerun():
+            buffer = BytesIO()
+            df.to_csv(buffer, index=False)
+            return buffer.getvalue()
+
+        print(f"📄 {args.rows:,} rows")
+        print(f"🐢 old: to_csv on every rerun          {best_ms(old_rerun, args.repeat):9.1f} ms per page render")
+        print(f"⚡ new: page render (callable only)     {best_ms(lambda: (lambda: exports.export_bytes(path)), args.repeat):9.4f} ms")
+        for fmt in exports.FORMATS:
+            start = time.perf_counter()
+            exports.export_file(path, fmt)
+            first_ms = (time.perf_counter() - start) * 1000
+            later_ms = best_ms(lambda: exports.export_bytes(path, fmt), args.repeat)
+            size_mb = os.path.getsize(exports.export_file(path, fmt)) / (1024 * 1024)
+            print(f"📥 {fmt:<8} first download {first_ms:9.1f} ms, later downloads {later_ms:7.1f} ms, {size_mb:7.1f} MB")
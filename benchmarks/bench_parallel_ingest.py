@@ -0,0 +1,52 @@
+# Serial vs parallel byte-range ingest of one large SELL_1-style export.
+# Usage: python benchmarks/bench_parallel_ingest.py [--scale 50] [--workers 1 2 4 8]
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from backend.parallel_ingest import parallel_read
+from backend.schemas import read_source
+from clean_data import clean_sell1_chunk
+from common import scaled_copy
+
+
+def serial(path):
+    frames = [clean_sell1_chunk(df) for df in read_source("sell_1", path=path)]
+    return "".join(df.to_csv(index=False, header=False) for df in frames)
+
+
+def parallel(path, workers, partition_bytes):
+    parts = parallel_read("sell_1", clean_sell1_chunk, workers, partition_bytes, path=path)
+    return "".join(csv_text for _, csv_text in parts)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--scale", type=int, default=50, help="replicate SELL_1.csv N times")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8, 16, 32])
+    parser.add_argument("--partition-mb", type=float, default=16)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        path, rows = scaled_copy("sell_1", args.scale, workdir)
+        size_mb = os.path.getsize(path) / 1024 / 1024
+        print(f"📦 {rows:,} rows, {size_mb:.0f} MB, {os.cpu_count()} cores available")
+
+        start = time.perf_counter()
+        expected = serial(path)
+        base = time.perf_counter() - start
+        print(f"  serial          {base:7.2f} s  {rows / base:12,.0f} rows/sec")
+
+        for workers in args.workers:
+            start = time.perf_counter()
+            output = parallel(path, workers, int(args.partition_mb * 1024 * 1024))
+            elapsed = time.perf_counter() - start
+            same = "identical" if output == expected else "MISMATCH"
+            print(f"  {workers:2d} workers      {elapsed:7.2f} s  {rows / elapsed:12,.0f} rows/sec"
+                  f"  {base / elapsed:5.1f}x  ({same})")
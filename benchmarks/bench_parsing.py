@@ -0,0 +1,67 @@
+# Throughput benchmark: legacy string-rewrite cleaning vs schema-driven parsing.
+# Usage: python benchmarks/bench_parsing.py [--scale 20] [--repeat 3]
+
+import argparse
+import os
+import sys
+import tempfile
+
+import pandas as pd
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from backend.schemas import apply_schema, reader_options
+from common import best_of, scaled_copy
+
+
+# -- Parsing as clean_data.py did it before backend/schemas.py --
+def legacy_sell1(path):
+    df = pd.read_csv(path, delimiter=";", encoding='ISO-8859-1')
+    df.columns = df.columns.str.strip()
+    df["Date"] = pd.to_datetime(df["Date"], dayfirst=True, errors='coerce')
+    for col in ["pce_zn", "pwa_sb", "pudzsb", "pmarza", "pmarzajedn", "pkwmarza", "pudzmarza"]:
+        df[col] = df[col].astype(str).str.replace(",", ".")
+        df[col] = pd.to_numeric(df[col], errors="coerce")
+    return df
+
+
+def legacy_day_sell(path):
+    df = pd.read_csv(path, sep=";")
+    df.columns = ["Date", "zn", "sb", "tax", "marza"]
+    df["Date"] = pd.to_datetime(df["Date"], dayfirst=True, errors='coerce')
+    for col in ["zn", "sb", "tax", "marza"]:
+        df[col] = df[col].astype(str).str.replace(" ", "").str.replace(",", ".")
+        df[col] = pd.to_numeric(df[col], errors="coerce")
+    return df
+
+
+def legacy_rotation(path):
+    # The old path left the numeric columns as text; this is the minimum
+    # extra work needed to get the same typed result
+    df = pd.read_csv(path, sep=";", encoding="ISO-8859-1")
+    df.columns = df.columns.str.strip()
+    for col in ["p_sale_in_time", "Psale", "Pavarage_stock", "Rotation_in_days", "Rotation_in_times"]:
+        df[col] = pd.to_numeric(df[col].astype(str).str.replace(",", "."), errors="coerce")
+    return df
+
+
+LEGACY = {"sell_1": legacy_sell1, "day_sell": legacy_day_sell, "rotation": legacy_rotation}
+
+
+def schema_read(name, path):
+    return apply_schema(pd.read_csv(path, **reader_options(name)), name)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--scale", type=int, default=20, help="replicate each raw file N times")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        for name, legacy in LEGACY.items():
+            path, rows = scaled_copy(name, args.scale, workdir)
+            old = best_of(args.repeat, lambda: legacy(path))
+            new = best_of(args.repeat, lambda: schema_read(name, path))
+            print(f"\n⏱️ {name}: {rows:,} rows")
+            print(f"  legacy string rewrites  {rows / old:12,.0f} rows/sec")
+            print(f"  schema-driven parser    {rows / new:12,.0f} rows/sec  ({old / new:.1f}x)")
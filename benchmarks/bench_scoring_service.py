@@ -0,0 +1,91 @@
+# Load test for the ad-click scoring service: p50/p99 latency and throughput,
+# with micro-batching on vs. one predict_proba per request.
+# Usage: python benchmarks/bench_scoring_service.py [--clients 16] [--seconds 5] [--url http://host:port]
+
+import argparse
+import http.client
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from urllib.parse import urlparse
+
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import RandomForestClassifier
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from backend.artifact_store import load_artifact
+from backend.model_registry import data_hash, register
+from backend.scoring_service import MODEL_NAME, make_server
+
+
+def register_model(registry):
+    # Same features and params as scripts/ad_campaign_analysis.py
+    df = load_artifact("ads_cleaned").drop(columns=["id", "full_name"]).dropna()
+    X = pd.get_dummies(df, drop_first=True).drop("click", axis=1)
+    model = RandomForestClassifier(n_estimators=100, random_state=42).fit(X, df["click"])
+    register(MODEL_NAME, model, data_hash(X), X.columns, directory=registry)
+    return df.drop(columns="click").to_dict("records")
+
+
+def client(host, port, bodies, stop, latencies):
+    conn = http.client.HTTPConnection(host, port)
+    i = 0
+    while not stop.is_set():
+        start = time.perf_counter()
+        conn.request("POST", "/score", bodies[i % len(bodies)], {"Content-Type": "application/json"})
+        response = conn.getresponse()
+        response.read()
+        latencies.append(time.perf_counter() - start)
+        i += 1
+    conn.close()
+
+
+def load_test(host, port, bodies, clients, seconds):
+    stop = threading.Event()
+    per_client = [[] for _ in range(clients)]
+    threads = [threading.Thread(target=client, args=(host, port, bodies, stop, per_client[c])) for c in range(clients)]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    time.sleep(seconds)
+    stop.set()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+    latencies = np.concatenate([np.asarray(l) for l in per_client]) * 1000
+    return len(latencies) / elapsed, np.percentile(latencies, 50), np.percentile(latencies, 99)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--clients", type=int, default=16, help="concurrent keep-alive connections")
+    parser.add_argument("--seconds", type=float, default=5)
+    parser.add_argument("--url", help="test an already running service instead of in-process ones")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as registry:
+        records = register_model(registry)
+        bodies = [json.dumps({"impressions": [r]}) for r in records[:500]]
+
+        if args.url:
+            url = urlparse(args.url)
+            targets = [("external", url.hostname, url.port)]
+        else:
+            targets = []
+            for label, max_batch in [("micro-batched", 512), ("unbatched", 1)]:
+                server, scorer = make_server(port=0, registry=registry, max_batch=max_batch)
+                threading.Thread(target=server.serve_forever, daemon=True).start()
+                targets.append((label, "127.0.0.1", server.server_address[1], server, scorer))
+
+        for label, host, port, *running in targets:
+            rps, p50, p99 = load_test(host, port, bodies, args.clients, args.seconds)
+            line = f"⚡ {label:<14} {args.clients} clients: {rps:8,.0f} req/s  p50 {p50:7.2f} ms  p99 {p99:7.2f} ms"
+            if running:
+                server, scorer = running
+                line += f"  ({scorer.batcher.rows / max(scorer.batcher.batches, 1):.1f} rows/batch)"
+                server.shutdown()
+            print(line)
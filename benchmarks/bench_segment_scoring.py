@@ -0,0 +1,63 @@
+# Segment assignment latency: single customer and batched, against the old refit-everything path.
+# Usage: python benchmarks/bench_segment_scoring.py [--customers 100000] [--repeat 20000]
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from backend.segmentation import fit_segments, load_model
+
+
+def synthetic_rfm(n, rng):
+    return pd.DataFrame({
+        "Recency": rng.integers(0, 365, n),
+        "Frequency": rng.poisson(4, n) + 1,
+        "Monetary": rng.gamma(2.0, 600.0, n),
+    })
+
+
+def per_call_us(fn, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--customers", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=20_000)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(42)
+    rfm = synthetic_rfm(args.customers, rng)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        start = time.perf_counter()
+        fit_segments(rfm, directory=tmp, registry=tmp)
+        refit = time.perf_counter() - start
+
+        start = time.perf_counter()
+        model = load_model(tmp, reload=True)
+        load = time.perf_counter() - start
+
+    one = per_call_us(lambda: model.assign_one(30, 4, 1200.0), args.repeat)
+    row = np.array([[30, 4, 1200.0]])
+    one_array = per_call_us(lambda: model.assign(row), args.repeat)
+
+    start = time.perf_counter()
+    model.assign(rfm)
+    batch = time.perf_counter() - start
+
+    print(f"🔁 refit scaler + KMeans on {args.customers:,} customers: {refit:8.3f} s")
+    print(f"📂 load persisted model:                       {load * 1000:8.3f} ms")
+    print(f"👤 assign_one:                                 {one:8.2f} µs")
+    print(f"👤 assign (1-row array):                       {one_array:8.2f} µs")
+    print(f"👥 assign {args.customers:,} rows:                      {batch * 1000:8.2f} ms "
+          f"({args.customers / batch:,.0f} customers/sec)")
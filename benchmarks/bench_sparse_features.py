@@ -0,0 +1,110 @@
+# Dense get_dummies vs. sparse CSR (exact one-hot and hashed) ad features:
+# peak memory and time to build the matrix, then fit time on each.
+# Usage: python benchmarks/bench_sparse_features.py [--rows 10000000] [--user-ids 1000000] [--rf-rows 1000000]
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.linear_model import SGDClassifier
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from backend.ad_features import CATEGORICAL, HashedLayout, build_layout
+
+LEVELS = {
+    "gender": ["Female", "Male", "Non-Binary"],
+    "device_type": ["Desktop", "Mobile", "Tablet"],
+    "ad_position": ["Bottom", "Side", "Top"],
+    "browsing_history": ["Education", "Entertainment", "News", "Shopping", "Social Media"],
+    "time_of_day": ["Afternoon", "Evening", "Morning", "Night", "Unknown"],
+}
+
+
+def synthetic_ads(rows, user_ids, rng):
+    # Categoricals keep the raw frame small enough to build 10M rows here
+    df = pd.DataFrame({"age": rng.integers(18, 65, rows).astype("float64")})
+    for column, levels in LEVELS.items():
+        df[column] = pd.Categorical.from_codes(rng.integers(0, len(levels), rows), levels)
+    if user_ids:
+        df["user_id"] = pd.Categorical.from_codes(rng.integers(0, user_ids, rows), [f"u{i}" for i in range(user_ids)])
+    logit = -1 + 0.02 * (df["age"] - 40) + (df["device_type"] == "Mobile") * 0.8 + (df["ad_position"] == "Top") * 0.5
+    click = (rng.random(rows) < 1 / (1 + np.exp(-logit))).astype("int64")
+    return df, click
+
+
+def measure(build):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = build()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak / 1024 ** 2
+
+
+def matrix_mb(X):
+    if hasattr(X, "data") and hasattr(X, "indptr"):
+        return (X.data.nbytes + X.indices.nbytes + X.indptr.nbytes) / 1024 ** 2
+    return X.nbytes / 1024 ** 2
+
+
+def fit_seconds(model, X, y):
+    start = time.perf_counter()
+    model.fit(X, y)
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    parser.add_argument("--user-ids", type=int, default=1_000_000, help="high-cardinality column for the hashed path (0 = none)")
+    parser.add_argument("--hash-features", type=int, default=2 ** 20)
+    parser.add_argument("--rf-rows", type=int, default=1_000_000, help="rows for the random-forest fit (0 = skip)")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(42)
+    df, y = synthetic_ads(args.rows, args.user_ids, rng)
+    base = df[["age"] + CATEGORICAL]
+    print(f"📦 {args.rows:,} impressions, {len(base.columns)} raw columns"
+          + (f" + user_id ({args.user_ids:,} levels)" if args.user_ids else ""))
+
+    # Current path: dense bool frame from get_dummies, then the float32 copy the model trains on
+    def dense():
+        dummies = pd.get_dummies(base, drop_first=True)
+        return dummies.to_numpy(dtype="float32")
+
+    layout = build_layout(base)
+    hashed = HashedLayout(args.hash_features, categorical=CATEGORICAL + (["user_id"] if args.user_ids else []))
+
+    paths = [
+        ("dense get_dummies", dense),
+        ("sparse one-hot", lambda: layout.encode_sparse(base)),
+    ]
+    if args.user_ids:
+        paths.append(("sparse hashed +user_id", lambda: hashed.encode_sparse(df)))
+
+    built = {}
+    for label, build in paths:
+        X, seconds, peak = measure(build)
+        built[label] = X
+        print(f"🧱 {label:<24} build {seconds:7.2f} s  peak {peak:9,.0f} MB  matrix {matrix_mb(X):9,.0f} MB  shape {X.shape}")
+
+    if args.user_ids:
+        dense_user_mb = args.rows * (len(layout.features) + args.user_ids - 1) / 1024 ** 2
+        print(f"🚫 dense get_dummies +user_id would need ~{dense_user_mb:,.0f} MB (bool), not attempted")
+
+    for label, X in built.items():
+        seconds = fit_seconds(SGDClassifier(loss="log_loss", max_iter=5, tol=None, random_state=42), X, y)
+        print(f"⏱️ SGD logistic fit, {label:<24} {seconds:7.2f} s")
+
+    if args.rf_rows:
+        n = min(args.rf_rows, args.rows)
+        for label, X in built.items():
+            model = RandomForestClassifier(n_estimators=10, max_depth=12, random_state=42, n_jobs=-1)
+            seconds = fit_seconds(model, X[:n], y[:n])
+            print(f"🌲 RF(10 trees) fit on {n:,} rows, {label:<24} {seconds:7.2f} s")
@@ -0,0 +1,116 @@
+# SQLite store: bulk-load throughput (executemany vs. DataFrame.to_sql) and
+# point-query latency on the indexed key columns, single-threaded and through
+# the connection pool from several threads.
+# Usage: python benchmarks/bench_store.py [--rows 1000000] [--queries 2000] [--threads 4]
+
+import argparse
+import os
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from backend.artifact_store import save_artifact
+from backend.store import Store
+
+
+def synthetic_sales(rows, rng):
+    return pd.DataFrame({
+        "Date": pd.Timestamp("2015-01-01") + pd.to_timedelta(rng.integers(0, 3_000, rows), unit="D"),
+        # Nullable Int64 like the cleaned SELL_1 export, with some codes missing
+        "PKod": pd.Series(rng.integers(1, 20_000, rows), dtype="Int64").where(rng.random(rows) > 0.001),
+        "CustomerID": rng.integers(10_000, 200_000, rows).astype("float64"),
+        "Pgroup": rng.choice(["A", "B", "C", "D"], rows),
+        "Pquantity": rng.poisson(3, rows),
+        "pce_sb": rng.uniform(1, 50, rows).round(2),
+    })
+
+
+def percentiles(seconds):
+    seconds = sorted(seconds)
+    return seconds[len(seconds) // 2] * 1000, seconds[int(len(seconds) * 0.95)] * 1000
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--queries", type=int, default=2_000)
+    parser.add_argument("--threads", type=int, default=4)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(42)
+    df = synthetic_sales(args.rows, rng)
+    with tempfile.TemporaryDirectory() as tmp:
+        save_artifact(df, "sales", directory=tmp)
+        store = Store(os.path.join(tmp, "store.sqlite"), pool_size=args.threads,
+                      datasets={"sales": os.path.join(tmp, "sales.csv")})
+
+        rows, seconds = store.load("sales")
+        print(f"🚚 executemany load: {rows:,} rows in {seconds:6.2f} s ({rows / seconds:,.0f} rows/s, indexes included)")
+        missing = store.query('SELECT COUNT(*) AS n FROM sales WHERE "PKod" IS NULL')["n"][0]
+        assert missing == df["PKod"].isna().sum(), "missing PKod values didn't load as NULL"
+        print(f"✅ {missing:,} missing PKod values stored as NULL")
+
+        # What the paged-table layer does: pandas to_sql (then the same indexes,
+        # so both loads end with an equally queryable table)
+        plain = sqlite3.connect(os.path.join(tmp, "plain.sqlite"))
+        start = time.perf_counter()
+        df.to_sql("sales", plain, index=False, chunksize=100_000)
+        plain.commit()
+        seconds = time.perf_counter() - start
+        print(f"🐢 to_sql load:      {rows:,} rows in {seconds:6.2f} s ({rows / seconds:,.0f} rows/s, no indexes)")
+        copy = sqlite3.connect(os.path.join(tmp, "indexed.sqlite"))
+        start = time.perf_counter()
+        df.to_sql("sales", copy, index=False, chunksize=100_000)
+        for column in ["Date", "PKod", "CustomerID"]:
+            copy.execute(f'CREATE INDEX "ix_{column}" ON sales ("{column}")')
+        copy.commit()
+        seconds = time.perf_counter() - start
+        print(f"🐢 to_sql + indexes: {rows:,} rows in {seconds:6.2f} s ({rows / seconds:,.0f} rows/s)")
+        copy.close()
+
+        keys = rng.integers(1, 20_000, args.queries)
+        for label, column, values in [("PKod", "PKod", keys), ("CustomerID", "CustomerID", rng.integers(10_000, 200_000, args.queries))]:
+            times = []
+            for value in values:
+                start = time.perf_counter()
+                store.lookup("sales", column, int(value))
+                times.append(time.perf_counter() - start)
+            p50, p95 = percentiles(times)
+            print(f"🔍 indexed lookup by {label:<10} p50 {p50:7.2f} ms, p95 {p95:7.2f} ms")
+
+        times = []
+        for value in keys[:50]:
+            start = time.perf_counter()
+            pd.read_sql_query('SELECT * FROM sales WHERE "PKod" = ?', plain, params=(int(value),))
+            times.append(time.perf_counter() - start)
+        p50, p95 = percentiles(times)
+        print(f"🐢 unindexed lookup by PKod   p50 {p50:7.2f} ms, p95 {p95:7.2f} ms (full scan, 50 queries)")
+
+        # Same lookups from several threads sharing the pool
+        per_thread = np.array_split(keys, args.threads)
+        thread_times = [[] for _ in range(args.threads)]
+
+        def worker(i):
+            for value in per_thread[i]:
+                start = time.perf_counter()
+                store.lookup("sales", "PKod", int(value))
+                thread_times[i].append(time.perf_counter() - start)
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(args.threads)]
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        wall = time.perf_counter() - start
+        p50, p95 = percentiles([t for times in thread_times for t in times])
+        print(f"🧵 {args.threads} threads, pool of {store.pool.size}: {len(keys) / wall:,.0f} lookups/s, "
+              f"p50 {p50:7.2f} ms, p95 {p95:7.2f} ms")
+        plain.close()
+        store.pool.close()
@@ -0,0 +1,78 @@
+# Paged table latency: SQLite query layer vs. the old path of reading the whole
+# artifact with pandas and shipping every row to st.dataframe on each rerun.
+# Usage: python benchmarks/bench_table_query.py [--rows 1000000] [--repeat 20]
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from backend.table_query import TableQuery
+
+
+def synthetic_table(rows, rng):
+    return pd.DataFrame({
+        "id": np.arange(rows),
+        "age": rng.integers(18, 65, rows).astype("float64"),
+        "gender": rng.choice(["Female", "Male", "Non-Binary"], rows),
+        "device_type": rng.choice(["Desktop", "Mobile", "Tablet"], rows),
+        "click": rng.integers(0, 2, rows),
+        "clv": rng.integers(0, 10_000, rows),
+    })
+
+
+def timings_ms(fn, repeat):
+    # First call separately: it pays for new indexes and the row count
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return times[0] * 1000, np.median(times[1:] or times) * 1000
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "table.csv")
+        synthetic_table(args.rows, np.random.default_rng(42)).to_csv(path, index=False)
+        tables = TableQuery(os.path.join(directory, "tables.sqlite"))
+
+        start = time.perf_counter()
+        tables.table(path)
+        print(f"📥 {args.rows:,} rows loaded into SQLite in {time.perf_counter() - start:.2f} s (once per file change)")
+
+        filters = [("gender", "=", "Female"), ("age", ">=", 30)]
+        cases = [
+            ("first page", {}),
+            ("page 1000", {"page": 999}),
+            ("filter + sort, page 1", {"filters": filters, "sort": "clv", "descending": True}),
+            ("filter + sort, page 50", {"filters": filters, "sort": "clv", "descending": True, "page": 49}),
+            ("3 columns, contains", {"columns": ["id", "gender", "clv"], "filters": [("device_type", "contains", "ob")]}),
+        ]
+        for label, kwargs in cases:
+            first, median = timings_ms(lambda: tables.query(path, **kwargs), args.repeat)
+            print(f"⚡ query layer, {label:<24} first {first:8.1f} ms, then {median:8.1f} ms")
+
+        # Old path: whole file parsed and every row serialized for the browser
+        def full_table():
+            df = pd.read_csv(path)
+            pa.Table.from_pandas(df)
+
+        def full_filter_sort():
+            df = pd.read_csv(path)
+            df = df[(df["gender"] == "Female") & (df["age"] >= 30)].sort_values("clv", ascending=False)
+            pa.Table.from_pandas(df)
+
+        print(f"🐢 pandas + full st.dataframe payload            every rerun {timings_ms(full_table, 3)[1]:8.1f} ms")
+        print(f"🐢 pandas filter + sort + full payload           every rerun {timings_ms(full_filter_sort, 3)[1]:8.1f} ms")
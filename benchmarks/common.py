@@ -0,0 +1,33 @@
+# Helpers shared by the benchmark scripts (imported as `from common import ...`,
+# since each script runs with benchmarks/ on sys.path).
+
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from backend.schemas import SOURCES, source_path
+
+
+def best_of(repeat, fn):
+    """Fastest of ``repeat`` runs of ``fn()``, in seconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def scaled_copy(name, scale, workdir):
+    """Write raw source ``name`` into ``workdir`` with its body repeated ``scale``
+    times; returns (path, data rows)."""
+    encoding = SOURCES[name].get("encoding", "utf-8")
+    with open(source_path(name), encoding=encoding) as f:
+        header, *body = f.readlines()
+    path = os.path.join(workdir, SOURCES[name]["file"])
+    with open(path, "w", encoding=encoding) as f:
+        f.write(header)
+        for _ in range(scale):
+            f.writelines(body)
+    return path, len(body) * scale
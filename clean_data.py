@@ -1,121 +1,155 @@
+import argparse
 import pandas as pd
 import os
+from backend.artifact_store import ArtifactWriter
+from backend.parallel_ingest import parallel_read
+from backend.schemas import read_source, source_path
+from backend.watermark import plan_update, read_tail, record, snapshot
 
-# Paths
-RAW_PATH = "data/raw"
+# Paths (raw file names and formats live in backend/schemas.py)
 PROCESSED_PATH = "data/processed"
 
-# Helper function to save cleaned data
-def save_cleaned(df, name):
-    output_path = os.path.join(PROCESSED_PATH, f"{name}_cleaned.csv")
-    df.to_csv(output_path, index=False)
-    print(f"\u2705 Saved cleaned data: {output_path}")
+# Helper function to read + clean a raw source: whole, in chunks, or in parallel byte ranges
+# (``end`` = byte offset to stop at)
+def read_cleaned(name, clean_chunk, chunksize=None, workers=None, end=None):
+    if workers and workers > 1:
+        return parallel_read(name, clean_chunk, workers, end=end)
+    return (clean_chunk(df) for df in read_source(name, chunksize, end=end))
+
+# Helper function to save cleaned data (a single frame or a stream of chunks)
+def save_cleaned(chunks, name, append=False):
+    if isinstance(chunks, pd.DataFrame):
+        chunks = [chunks]
+    with ArtifactWriter(f"{name}_cleaned", PROCESSED_PATH, append=append) as writer:
+        for chunk in chunks:
+            # Parallel ingest hands over (frame, pre-rendered csv text) pairs
+            if isinstance(chunk, tuple):
+                writer.write(*chunk)
+            else:
+                writer.write(chunk)
+    action = "Appended" if append else "Saved"
+    print(f"\u2705 {action} cleaned data: {writer.output_path} ({writer.rows} rows)")
+    return writer.rows
+
+# Helper function to clean one raw source; with incremental=True only the rows
+# appended to the raw file since the last run are cleaned and appended
+def ingest(name, clean_chunk, chunksize=None, workers=None, incremental=False):
+    path = source_path(name)
+    if incremental:
+        artifact_path = os.path.join(PROCESSED_PATH, f"{name}_cleaned.csv")
+        mode, state = plan_update(name, path, artifact_path)
+        if mode == "append":
+            if state["offset"] == state["start"]:
+                print(f"\u2705 {name} is already up to date")
+                return
+            tail = read_tail(name, path, state["start"], state["offset"], chunksize)
+            rows = save_cleaned((clean_chunk(df) for df in tail), name, append=True)
+            record(name, state, rows, "append")
+            return
+        print(f"\u21BB Full rebuild of {name}: {state}")
+
+    # Read exactly the bytes the watermark describes: rows appended during the
+    # run belong to the next incremental update, not to this artifact
+    state = snapshot(path)
+    rows = save_cleaned(read_cleaned(name, clean_chunk, chunksize, workers, end=state["offset"]), name)
+    record(name, state, rows, "full")
 
 # 1. Retail Dataset
-def clean_retail():
+def clean_retail_chunk(df):
+    df.dropna(subset=["InvoiceNo", "Description", "CustomerID"], inplace=True)
+    df = df[df["Quantity"] > 0]
+    df = df[df["UnitPrice"] > 0]
+    return df
+
+def clean_retail(chunksize=None, workers=None, incremental=False):
     print("\nCleaning Retail dataset...")
-    path = os.path.join(RAW_PATH, "Retail.csv")
+    path = source_path("retail")
     if not os.path.exists(path):
         print(f"\u274C File not found: {path}")
         return
 
-    df = pd.read_csv(path, encoding='ISO-8859-1')
-
-    df.dropna(subset=["InvoiceNo", "Description", "CustomerID"], inplace=True)
-    df["InvoiceDate"] = pd.to_datetime(df["InvoiceDate"], errors='coerce')
-    df = df[df["Quantity"] > 0]
-    df = df[df["UnitPrice"] > 0]
-
-    save_cleaned(df, "retail")
+    ingest("retail", clean_retail_chunk, chunksize, workers, incremental)
 
 # 2. Sell_1 Dataset
-def clean_sell1():
+def clean_sell1_chunk(df):
+    df.dropna(subset=["Pgroup", "Pname", "pce_zn"], inplace=True)
+    return df
+
+def clean_sell1(chunksize=None, workers=None, incremental=False):
     print("\nCleaning Sell_1 dataset...")
-    path = os.path.join(RAW_PATH, "SELL_1.csv")
+    path = source_path("sell_1")
     if not os.path.exists(path):
         print(f"\u274C File not found: {path}")
         return
 
-    df = pd.read_csv(path, delimiter=";", encoding='ISO-8859-1')
-    df.columns = df.columns.str.strip()
-    df.dropna(subset=["Pgroup", "Pname", "pce_zn"], inplace=True)
-    df["Date"] = pd.to_datetime(df["Date"], dayfirst=True, errors='coerce')
-
-    numeric_cols = ["pce_zn", "pwa_sb", "pudzsb", "pmarza", "pmarzajedn", "pkwmarza", "pudzmarza"]
-    for col in numeric_cols:
-        if col in df.columns:
-            df[col] = df[col].astype(str).str.replace(",", ".")
-            df[col] = pd.to_numeric(df[col], errors="coerce")
-
-    save_cleaned(df, "sell_1")
+    ingest("sell_1", clean_sell1_chunk, chunksize, workers, incremental)
 
 # 3. Ads Dataset
-def clean_ads():
+def clean_ads_chunk(df):
+    df.dropna(subset=["age", "gender", "device_type"], inplace=True)
+    df["time_of_day"] = df["time_of_day"].fillna("Unknown")
+    return df
+
+def clean_ads(chunksize=None, workers=None, incremental=False):
     print("\nCleaning Ads dataset...")
-    path = os.path.join(RAW_PATH, "Ads.csv")
+    path = source_path("ads")
     if not os.path.exists(path):
         print(f"\u274C File not found: {path}")
         return
 
-    df = pd.read_csv(path)
-
-    df.dropna(subset=["age", "gender", "device_type"], inplace=True)
-    df["time_of_day"] = df["time_of_day"].fillna("Unknown")
-
-    save_cleaned(df, "ads")
+    ingest("ads", clean_ads_chunk, chunksize, workers, incremental)
 
 # 4. Day Sell Dataset
-def clean_day_sell():
+def clean_day_sell_chunk(df):
+    # Date parsing and decimal-comma / space-thousands numbers are handled by the reader
+    return df
+
+def clean_day_sell(chunksize=None, workers=None, incremental=False):
     print("\nCleaning Day Sell dataset...")
-    path = os.path.join(RAW_PATH, "Day Sell.csv")
+    path = source_path("day_sell")
     if not os.path.exists(path):
         print(f"\u274C File not found: {path}")
         return
 
-    df = pd.read_csv(path, sep=";")
-    df.columns = ["Date", "zn", "sb", "tax", "marza"]
-    df["Date"] = pd.to_datetime(df["Date"], dayfirst=True, errors='coerce')
-
-    for col in ["zn", "sb", "tax", "marza"]:
-        df[col] = df[col].astype(str).str.replace(" ", "").str.replace(",", ".")
-        df[col] = pd.to_numeric(df[col], errors="coerce")
-
-    save_cleaned(df, "day_sell")
+    ingest("day_sell", clean_day_sell_chunk, chunksize, workers, incremental)
 
 # 5. Rotation Dataset
-def clean_rotation():
-    path = os.path.join(RAW_PATH, "Rotation.csv")
-    df = pd.read_csv(path, sep=";", encoding="ISO-8859-1")
-
-    df.columns = df.columns.str.strip()
+def clean_rotation_chunk(df):
     df.dropna(how="all", inplace=True)
+    return df
 
-    save_cleaned(df, "rotation")
+def clean_rotation(chunksize=None, workers=None, incremental=False):
+    ingest("rotation", clean_rotation_chunk, chunksize, workers, incremental)
 
 # 6. Mock Kaggle Dataset
-def clean_mock_kaggle():
+def clean_mock_kaggle_chunk(df):
+    df = df.dropna()
+    df = df[df["preco"] > 0]
+    return df
+
+def clean_mock_kaggle(chunksize=None, workers=None, incremental=False):
     print("\nCleaning Mock Kaggle dataset...")
-    path = os.path.join(RAW_PATH, "Mock Kaggle.csv")
+    path = source_path("mock_kaggle")
     if not os.path.exists(path):
         print(f"\u274C File not found: {path}")
         return
 
-    df = pd.read_csv(path)
-    if "data" not in df.columns:
-        if "date" in df.columns:
-            df.rename(columns={"date": "data"}, inplace=True)
-
-    df["data"] = pd.to_datetime(df["data"], errors='coerce')
-    df = df.dropna()
-    df = df[df["preco"] > 0]
-
-    save_cleaned(df, "mock_kaggle")
+    ingest("mock_kaggle", clean_mock_kaggle_chunk, chunksize, workers, incremental)
 
 # Run all cleaning functions
 if __name__ == "__main__":
-    clean_retail()
-    clean_sell1()
-    clean_ads()
-    clean_day_sell()
-    clean_rotation()
-    clean_mock_kaggle()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Clean raw datasets into data/processed")
+    parser.add_argument("--chunksize", type=int, default=None,
+                        help="stream each raw file in chunks of this many rows (bounded memory)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="parse each raw file in newline-aligned byte ranges across this many processes")
+    parser.add_argument("--incremental", action="store_true",
+                        help="only clean rows appended to each raw file since the last run")
+    args = parser.parse_args()
+
+    clean_retail(args.chunksize, args.workers, args.incremental)
+    clean_sell1(args.chunksize, args.workers, args.incremental)
+    clean_ads(args.chunksize, args.workers, args.incremental)
+    clean_day_sell(args.chunksize, args.workers, args.incremental)
+    clean_rotation(args.chunksize, args.workers, args.incremental)
+    clean_mock_kaggle(args.chunksize, args.workers, args.incremental)
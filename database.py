@@ -1,10 +1,15 @@
-from sqlalchemy import create_engine, Column, Integer, String, Float, MetaData, Table
+import os
+
+from sqlalchemy import create_engine, Column, Integer, String
 from sqlalchemy.orm import sessionmaker, declarative_base
 
-engine = create_engine("sqlite:///users.db", echo=True)
-Session = sessionmaker(bind=engine)
-session = Session()
+# Nothing connects on import: the engine is created on first use, and SQL
+# echo is opt-in (MARKETLENS_SQL_ECHO=1) instead of logging every statement
+DATABASE_URL = os.environ.get("MARKETLENS_USERS_DB", "sqlite:///users.db")
 Base = declarative_base()
+Session = sessionmaker()
+_engine = None
+
 
 class User(Base):
     __tablename__ = "users"
@@ -12,4 +17,17 @@ class User(Base):
     name = Column(String)
     email = Column(String)
 
-Base.metadata.create_all(engine)
+
+def get_engine():
+    global _engine
+    if _engine is None:
+        _engine = create_engine(DATABASE_URL, echo=os.environ.get("MARKETLENS_SQL_ECHO") == "1")
+        Base.metadata.create_all(_engine)
+        Session.configure(bind=_engine)
+    return _engine
+
+
+def get_session():
+    """A new Session; close it when done (or use it as a context manager)."""
+    get_engine()
+    return Session()
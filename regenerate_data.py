@@ -1,8 +1,9 @@
 import pandas as pd
 import numpy as np
+from backend.artifact_store import load_artifact, save_artifact
 
 # Load the cleaned data
-df = pd.read_csv('data/processed/ads_cleaned.csv')
+df = load_artifact('ads_cleaned')
 
 # 🧠 Add dummy 'segment' values based on age
 try:
@@ -14,5 +15,5 @@ except:
 df['clv'] = np.random.randint(500, 10000, size=len(df))
 
 # Save it again
-df.to_csv('data/final_output.csv', index=False)
+save_artifact(df, 'final_output', directory='data')
 print("✅ final_output.csv is ready with 'segment' and 'clv' columns.")
@@ -1,32 +1,102 @@
 # scripts/ad_campaign_analysis.py
 
+import argparse
+import json
+import time
+import numpy as np
 import pandas as pd
+import matplotlib
+matplotlib.use("Agg")  # headless: figures are saved, never shown
 import matplotlib.pyplot as plt
 import seaborn as sns
 from sklearn.model_selection import train_test_split
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.metrics import classification_report, confusion_matrix
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from backend.ad_features import HashedLayout, build_layout
+from backend.artifact_store import load_artifact, save_artifact
+from backend.model_registry import data_hash, get_or_train
+from backend.tuning import successive_halving
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--hash-features", type=int, default=0,
+                    help="hash categories into this many columns instead of exact one-hot (0 = off)")
+parser.add_argument("--sparse", choices=["auto", "on", "off"], default="auto",
+                    help="CSR features: auto = only once the one-hot width reaches SPARSE_MIN_FEATURES (hashing is always sparse)")
+parser.add_argument("--tune", action="store_true",
+                    help="pick hyperparameters with a cross-validated successive-halving search")
+parser.add_argument("--budget", type=float, default=300, help="wall-clock budget for --tune, in seconds")
+parser.add_argument("--candidates", type=int, default=27, help="parameter sets sampled for --tune")
+args = parser.parse_args()
 
 # Step 1: Load the data
-df = pd.read_csv('data/processed/ads_cleaned.csv')
+df = load_artifact('ads_cleaned')
 
 # Step 2: Basic cleanup
 df.drop(columns=['id', 'full_name'], inplace=True)
 df.dropna(inplace=True)
 
-# Step 3: Convert categorical to numeric
-df_encoded = pd.get_dummies(df, drop_first=True)
+# Step 3: Convert categorical to numeric -- the columns pd.get_dummies(drop_first=True)
+# would give, or hashed columns for unbounded categories (see backend/ad_features.py).
+# Dense by default: sklearn's sparse tree splitter made the RF ~9x slower on these
+# ~15 low-cardinality columns, so CSR only pays off once the one-hot gets wide
+SPARSE_MIN_FEATURES = 1_000
+y = df['click'].to_numpy()
+features = df.drop(columns='click')
+if args.hash_features:
+    layout = HashedLayout(args.hash_features)
+    use_sparse = True
+else:
+    layout = build_layout(features)
+    use_sparse = args.sparse == "on" or (args.sparse == "auto" and len(layout.features) >= SPARSE_MIN_FEATURES)
+X = layout.encode_sparse(features) if use_sparse else layout.encode_frame(features)
+print(f"🧮 {X.shape[0]} rows x {X.shape[1]} features ({'sparse CSR' if use_sparse else 'dense'})")
+
+# Step 4/5: Train/Test split (row indices, so the matrix is sliced once)
+train_idx, test_idx = train_test_split(np.arange(X.shape[0]), test_size=0.2, random_state=42)
+X_train, X_test = X[train_idx], X[test_idx]
+y_train, y_test = y[train_idx], y[test_idx]
+
+# Step 6: Train the model (reused from backend/models/registry/ when the
+# training split and params are unchanged)
+params = {"n_estimators": 100, "random_state": 42, "hash_features": args.hash_features}
+if args.tune:
+    params = {"tune": True, "budget_seconds": args.budget, "candidates": args.candidates,
+              "random_state": 42, "hash_features": args.hash_features}
+
+def train():
+    model = RandomForestClassifier(n_estimators=params["n_estimators"], random_state=params["random_state"])
+    model.fit(X_train, y_train)
+    return model, {"test_accuracy": float(model.score(X_test, y_test))}
 
-# Step 4: Split features and target
-X = df_encoded.drop('click', axis=1)
-y = df_encoded['click']
+def tune():
+    # Search on the training split only (CV inside it), then refit the winner on all of it
+    results, best, search = successive_halving(
+        RandomForestClassifier(random_state=42), X_train, y_train,
+        budget_seconds=args.budget, n_candidates=args.candidates,
+    )
+    model = RandomForestClassifier(random_state=42, n_jobs=-1, **best)
+    start = time.perf_counter()
+    model.fit(X_train, y_train)
+    search["refit_seconds"] = time.perf_counter() - start
+    model.set_params(n_jobs=None)  # scoring small batches is faster without a worker pool
 
-# Step 5: Train/Test split
-X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
+    results = results.assign(params=results["params"].map(json.dumps))
+    save_artifact(results, "ad_tuning_results")
+    search["results"] = results.round(4).to_dict("records")
+    metrics = {"test_accuracy": float(model.score(X_test, y_test)), "cv_score": search["best_cv_score"]}
+    return model, metrics, {"search": search}
 
-# Step 6: Train the model
-model = RandomForestClassifier(n_estimators=100, random_state=42)
-model.fit(X_train, y_train)
+handle, reused = get_or_train("ad_click_rf", tune if args.tune else train,
+                               data_hash(X_train, y_train, params=params), layout.describe(), params)
+model = handle.estimator
+print(f"{'♻️ Reused' if reused else '🆕 Trained'} ad_click_rf v{handle.version} (accuracy {handle.metrics['test_accuracy']:.3f})")
+if "search" in handle.meta:
+    search = handle.meta["search"]
+    print(f"🔧 Search: {search['rungs_completed']}/{search['rungs_planned']} rungs in {search['search_seconds']:.1f}s "
+          f"({search['stop_reason']}), best CV {search['scoring']} {search['best_cv_score']:.3f} with {search['best_params']}")
 
 # Step 7: Make predictions and evaluate
 y_pred = model.predict(X_test)
@@ -37,19 +107,25 @@ print(classification_report(y_test, y_pred))
 print("\n🌀 Confusion Matrix:\n")
 print(confusion_matrix(y_test, y_pred))
 
-# Step 8: Feature Importance
-feature_imp = pd.Series(model.feature_importances_, index=X.columns).sort_values(ascending=False)
+# Step 8: Feature Importance (Figures/Figure_9.png is what the dashboard shows)
+feature_imp = pd.Series(model.feature_importances_, index=layout.features).sort_values(ascending=False).head(20)
 plt.figure(figsize=(10, 6))
 sns.barplot(x=feature_imp, y=feature_imp.index)
 plt.title("🔥 Feature Importance in Ad Click Prediction")
 plt.xlabel("Importance Score")
 plt.ylabel("Features")
 plt.tight_layout()
-plt.show()
+plt.savefig("Figures/Figure_9.png")
+plt.close()
+save_artifact(feature_imp.rename_axis("feature").reset_index(name="importance"), "ad_feature_importance")
 
 # ✅ Step 9: Save predictions to a CSV file (with actual + predicted clicks)
-df_results = X_test.copy()
-df_results['actual_click'] = y_test.values
+# (one-hot columns as before; hashed runs keep the raw feature columns instead)
+if args.hash_features:
+    df_results = features.iloc[test_idx].reset_index(drop=True)
+else:
+    df_results = layout.frame(X_test)
+df_results['actual_click'] = y_test
 df_results['predicted_click'] = y_pred
-df_results.to_csv('data/processed/ad_campaign_predictions.csv', index=False)
+save_artifact(df_results, 'ad_campaign_predictions')
 print("\n✅ ad_campaign_predictions.csv saved to data/processed/")
@@ -1,50 +1,85 @@
 import pandas as pd
 import numpy as np
+import matplotlib
+matplotlib.use("Agg")  # headless: figures are saved, never shown
 import matplotlib.pyplot as plt
 import seaborn as sns
 
 from sklearn.cluster import KMeans
+from sklearn.pipeline import Pipeline
 from sklearn.preprocessing import StandardScaler
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from backend.artifact_store import artifact_paths, iter_artifact, load_artifact, save_artifact
+from backend.clv import HORIZON_DAYS, fit_clv, score, transaction_summary
+from backend.model_registry import data_hash, get_or_train
+from backend.rfm import COLUMNS, rfm_state_from_chunks
 
-# Load data
-df = pd.read_csv('data/processed/ads_cleaned.csv')
-print("📦 Data Loaded:\n", df.head())
 
-# Simulate purchase value and frequency (demo purpose)
-np.random.seed(42)
-df['purchase_value'] = np.random.uniform(20, 200, size=len(df))
-df['purchase_frequency'] = np.random.randint(1, 10, size=len(df))
+def artifact_exists(name):
+    return any(os.path.exists(path) for path in artifact_paths(name))
 
-# Calculate CLV
-df['CLV'] = df['purchase_value'] * df['purchase_frequency']
 
-print("\n💰 Sample CLV Data:\n", df[['id', 'purchase_value', 'purchase_frequency', 'CLV']].head())
+# Load real transactions: retail invoices per customer, or -- when there is
+# no retail export -- SELL_1 sales per product (PKod stands in for the customer)
+if artifact_exists('retail_cleaned'):
+    # Invoice-level state from the RFM engine: one row per (customer, invoice)
+    invoices = rfm_state_from_chunks(iter_artifact('retail_cleaned', 500_000, columns=COLUMNS))
+    summary = transaction_summary(invoices, 'CustomerID', 'LastDate', 'Amount')
+    source = "retail_cleaned (customers)"
+else:
+    sales = load_artifact('sell_1_cleaned', columns=['PKod', 'Date', 'Pquantity', 'pce_sb'], parse_dates=['Date'])
+    sales['amount'] = sales['Pquantity'] * sales['pce_sb']
+    summary = transaction_summary(sales[sales['amount'] > 0], 'PKod', 'Date', 'amount')
+    source = "sell_1_cleaned (products)"
+print(f"📦 Transaction summary from {source}:\n", summary.head())
 
-# Scale CLV for clustering
-scaler = StandardScaler()
-df['CLV_scaled'] = scaler.fit_transform(df[['CLV']])
+# Fit BG/NBD + Gamma-Gamma (reused from backend/models/registry/ when the
+# summary is unchanged) and score every customer over the next year
+def train_clv():
+    scored, params, timings = fit_clv(summary, HORIZON_DAYS)
+    return params, timings
 
-# Cluster customers based on CLV
-kmeans = KMeans(n_clusters=3, random_state=42)
-df['CLV_segment'] = kmeans.fit_predict(df[['CLV_scaled']])
+handle, reused = get_or_train("clv_bgnbd_gamma_gamma", train_clv, data_hash(summary, params={"horizon_days": HORIZON_DAYS}),
+                              list(summary.columns), {"horizon_days": HORIZON_DAYS})
+clv_params = handle.estimator
+print(f"{'♻️ Reused' if reused else '🆕 Fitted'} clv_bgnbd_gamma_gamma v{handle.version}: {clv_params}")
 
-# Rename segments
-segment_map = {
-    0: 'Low CLV',
-    1: 'Medium CLV',
-    2: 'High CLV'
-}
-df['CLV_segment'] = df['CLV_segment'].map(lambda x: segment_map.get(x, 'Unknown'))
+df = score(summary, clv_params["bgnbd"], clv_params["gamma_gamma"], HORIZON_DAYS)
+df = df.rename_axis('customer_id').reset_index()
+
+print("\n💰 Sample CLV Data:\n", df[['customer_id', 'frequency', 'p_alive', 'expected_purchases', 'clv']].head())
+
+# Scale CLV and cluster customers on it (the fitted pipeline is reused from
+# backend/models/registry/ when the CLV values are unchanged)
+params = {"n_clusters": 3, "random_state": 42}
+
+def train_clv_segments():
+    pipeline = Pipeline([("scaler", StandardScaler()), ("kmeans", KMeans(**params))])
+    pipeline.fit(df[['clv']])
+    return pipeline, {"inertia": float(pipeline.named_steps["kmeans"].inertia_)}
+
+handle, reused = get_or_train("clv_kmeans", train_clv_segments, data_hash(df[['clv']], params=params), ['clv'], params)
+clv_model = handle.estimator
+print(f"{'♻️ Reused' if reused else '🆕 Trained'} clv_kmeans v{handle.version}")
+df['CLV_scaled'] = clv_model.named_steps["scaler"].transform(df[['clv']])[:, 0]
+
+# Rename segments (clusters ranked by their centre, lowest CLV first)
+centres = clv_model.named_steps["kmeans"].cluster_centers_[:, 0]
+segment_map = dict(zip(np.argsort(centres), ['Low CLV', 'Medium CLV', 'High CLV']))
+df['CLV_segment'] = pd.Series(clv_model.predict(df[['clv']])).map(segment_map)
 
 # 📊 Visualize
 plt.figure(figsize=(8, 5))
-sns.boxplot(data=df, x='CLV_segment', y='CLV', palette='Set2')
-plt.title("💎 Customer Segments based on CLV")
+sns.boxplot(data=df, x='CLV_segment', y='clv', hue='CLV_segment', palette='Set2', legend=False)
+plt.title("Customer Segments based on CLV")
 plt.xlabel("CLV Segment")
 plt.ylabel("Customer Lifetime Value")
 plt.tight_layout()
-plt.show()
+plt.savefig("Figures/Figure_10.png")  # shown on the dashboard's CLV page
+plt.close()
 
 # ✅ Save the CLV data to CSV
-df.to_csv("data/processed/clv.csv", index=False)
+save_artifact(df, "clv")
 print("✅ clv.csv saved in data/processed/")
@@ -1,33 +1,64 @@
+import argparse
 import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from backend.artifact_store import ArtifactWriter, load_artifact
+from backend.competitor_metrics import RENAME, RollingMetrics, load_state, save_state
+from backend.downsample import plot_line, plot_scatter, point_budget
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--rebuild", action="store_true", help="drop the saved rolling state and recompute from the first day")
+args = parser.parse_args()
 
 # Load dataset
-data_path = "data/processed/mock_kaggle_cleaned.csv"
-df = pd.read_csv(data_path)
+df = load_artifact("mock_kaggle_cleaned")
 
 # Rename columns for simplicity
-df = df.rename(columns={
-    'data': 'Date',
-    'venda': 'Sales',
-    'estoque': 'Stock',
-    'preco': 'Price'
-})
-
-# Convert date column
+df = df.rename(columns=RENAME)
 df['Date'] = pd.to_datetime(df['Date'])
-df = df.sort_values('Date')
 
-# ✅ Step 1: Total sales over time
-df.set_index('Date')['Sales'].plot(title='Total Sales Over Time', figsize=(10,5), color='green')
-plt.ylabel('Sales')
+# ✅ Step 1: Fold only the days newer than the saved state into the rolling metrics
+metrics = None if args.rebuild else load_state()
+rebuild = metrics is None
+if rebuild:
+    metrics = RollingMetrics()
+new_rows, changes, late = metrics.update_frame(df)
+if late and not rebuild:
+    print(f"⏭️ Skipped {late} rows already covered by the saved state")
+print(f"{'🆕 Built' if rebuild else '➕ Added'} {len(new_rows)} days, {len(changes)} price-change responses")
+
+# Append the new days (a rebuild rewrites the files from scratch)
+with ArtifactWriter("competitor_data", append=not rebuild) as writer:
+    writer.write(new_rows)
+with ArtifactWriter("competitor_price_changes", append=not rebuild) as writer:
+    writer.write(changes)
+save_state(metrics)
+print("✅ competitor_data.csv and competitor_price_changes.csv saved in data/processed/")
+
+if len(new_rows):
+    print("\n📈 Latest rolling metrics:\n", new_rows.tail(1).T)
+
+history = load_artifact("competitor_data", parse_dates=['Date'])
+responses = load_artifact("competitor_price_changes")
+
+# ✅ Step 2: Sales over time with rolling averages (LTTB keeps years of days readable)
+fig, ax = plt.subplots(figsize=(10, 5))
+for column, color in zip(['Sales', 'avg_sales_7d', 'avg_sales_30d'], ['lightgreen', 'green', 'darkgreen']):
+    plot_line(ax, history['Date'], history[column], point_budget("sales_history_line"), label=column, color=color)
+ax.set_title('Sales Over Time (7/30-day rolling averages)')
+ax.set_ylabel('Sales')
+ax.legend()
 plt.grid(True)
 plt.tight_layout()
 plt.show()
 
-# ✅ Step 2: Price vs Sales scatter
-plt.figure(figsize=(10,6))
-sns.scatterplot(data=df, x='Price', y='Sales')
+# ✅ Step 3: Price vs Sales scatter (density grid once it's too many points)
+fig, ax = plt.subplots(figsize=(10,6))
+plot_scatter(ax, history['Price'], history['Sales'], point_budget("price_sales_scatter"),
+             scatter=lambda: sns.scatterplot(data=history, x='Price', y='Sales', ax=ax))
 plt.title('Price vs Sales')
 plt.xlabel('Product Price')
 plt.ylabel('Units Sold')
@@ -35,7 +66,14 @@ plt.grid(True)
 plt.tight_layout()
 plt.show()
 
-# ✅ Step 3: Save cleaned + renamed + sorted data as competitor_data.csv
-df.to_csv("data/processed/competitor_data.csv", index=False)
-print("✅ competitor_data.csv saved in data/processed/")
-
+# ✅ Step 4: How sales responded in the week after each price change
+plt.figure(figsize=(10,6))
+sns.scatterplot(data=responses, x='price_change_pct', y='sales_change_pct')
+plt.axhline(0, color='grey', linewidth=1)
+plt.axvline(0, color='grey', linewidth=1)
+plt.title('Price Change vs 7-day Sales Response')
+plt.xlabel('Price Change (%)')
+plt.ylabel('Avg Daily Sales Change, week after vs week before (%)')
+plt.grid(True)
+plt.tight_layout()
+plt.show()
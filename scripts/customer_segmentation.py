@@ -1,99 +1,87 @@
 import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
-from sklearn.cluster import KMeans
-from sklearn.preprocessing import StandardScaler
+import argparse
 import warnings
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from backend.artifact_store import save_artifact
+from backend.rfm import compute_rfm, save_state
+from backend.segmentation import fit_segments, sweep_k
 warnings.filterwarnings("ignore")
 
 
-df = pd.read_csv("data/processed/retail_cleaned.csv")
-print(df.head())
+# Guarded so the worker processes used by the k sweep never rerun the script
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--clusters", type=int, default=4, help="number of segments")
+    parser.add_argument("--select-k", type=int, nargs=2, metavar=("MIN", "MAX"),
+                        help="pick the number of segments from MIN..MAX by sampled silhouette")
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
 
+    # RFM is aggregated chunk by chunk into a mergeable per-invoice state
+    # (see backend/rfm.py), so the full invoice history never sits in memory
+    rfm, rfm_state = compute_rfm("retail_cleaned")
+    save_state(rfm_state)
 
-# Force convert InvoiceDate to datetime
-df['InvoiceDate'] = pd.to_datetime(df['InvoiceDate'], errors='coerce')
+    print(rfm.head())
 
-# Drop rows where InvoiceDate conversion failed (just in case)
-df = df.dropna(subset=['InvoiceDate', 'CustomerID'])
+    n_clusters = args.clusters
+    if args.select_k:
+        k_min, k_max = args.select_k
+        sweep, n_clusters = sweep_k(rfm, range(k_min, k_max + 1), workers=args.workers)
+        print("\n🔎 k sweep (sampled silhouette, higher is better):")
+        print(sweep.round(4).to_string(index=False))
+        print(f"✅ Using k = {n_clusters}")
+        save_artifact(sweep, "segment_k_sweep")
 
-# Create TotalAmount column if not already present
-if 'TotalAmount' not in df.columns:
-    df['TotalAmount'] = df['Quantity'] * df['UnitPrice']
 
+    # Fit scaler + KMeans and persist them in backend/models/segmentation/ so new
+    # customers can be scored with backend.segmentation.assign_segments.
+    # Cluster 0 is always the most valuable segment, so names stay stable
+    segment_model, rfm['Cluster'] = fit_segments(rfm, n_clusters=n_clusters, random_state=42)
 
-snapshot_date = df['InvoiceDate'].max() + pd.Timedelta(days=1)
+    print(rfm.head())
 
-rfm = df.groupby('CustomerID').agg({
-    'InvoiceDate': lambda x: (snapshot_date - x.max()).days,
-    'InvoiceNo': 'nunique',
-    'TotalAmount': 'sum'
-})
 
-rfm.rename(columns={
-    'InvoiceDate': 'Recency',
-    'InvoiceNo': 'Frequency',
-    'TotalAmount': 'Monetary'
-}, inplace=True)
+    sns.scatterplot(data=rfm, x='Recency', y='Monetary', hue='Cluster', palette='Set2')
+    plt.title('Customer Segments')
+    plt.show()
 
-print(rfm.head())
 
+    save_artifact(rfm, "customer_segments", index=True)
+    print("Segmented data saved successfully! 🥳")
 
-scaler = StandardScaler()
-rfm_scaled = scaler.fit_transform(rfm)
 
-kmeans = KMeans(n_clusters=4, random_state=42)
-rfm['Cluster'] = kmeans.fit_predict(rfm_scaled)
+    # Set plot style
+    sns.set(style="whitegrid")
 
-print(rfm.head())
+    # Rename clusters for better understanding
+    rfm['Segment'] = rfm['Cluster'].map(segment_model.labels)
 
+    # Plot Recency vs Monetary by Segment
+    plt.figure(figsize=(10,6))
+    sns.scatterplot(data=rfm, x='Recency', y='Monetary', hue='Segment', palette='viridis', s=100)
+    plt.title('Customer Segments: Recency vs Monetary')
+    plt.savefig('outputs/recency_vs_monetary.png')
+    plt.show()
 
-sns.scatterplot(data=rfm, x='Recency', y='Monetary', hue='Cluster', palette='Set2')
-plt.title('Customer Segments')
-plt.show()
+    # Summary statistics by cluster
+    segment_summary = rfm.groupby('Segment').agg({
+        'Recency': 'mean',
+        'Frequency': 'mean',
+        'Monetary': 'mean'
+    }).round(2)
 
+    print("\nSegment Summary:")
+    print(segment_summary)
 
-rfm.to_csv("data/processed/customer_segments.csv")
-print("Segmented data saved successfully! 🥳")
-
-
-import matplotlib.pyplot as plt
-import seaborn as sns
-
-# Set plot style
-sns.set(style="whitegrid")
-
-# Rename clusters for better understanding
-cluster_map = {
-    0: 'High Value',
-    1: 'Low Value',
-    2: 'Mid Value',
-    3: 'Budget Shopper'  # You have 4 clusters, so let's label 4
-}
-rfm['Segment'] = rfm['Cluster'].map(cluster_map)
-
-# Plot Recency vs Monetary by Segment
-plt.figure(figsize=(10,6))
-sns.scatterplot(data=rfm, x='Recency', y='Monetary', hue='Segment', palette='viridis', s=100)
-plt.title('Customer Segments: Recency vs Monetary')
-plt.savefig('outputs/recency_vs_monetary.png')
-plt.show()
-
-# Summary statistics by cluster
-segment_summary = rfm.groupby('Segment').agg({
-    'Recency': 'mean',
-    'Frequency': 'mean',
-    'Monetary': 'mean'
-}).round(2)
-
-print("\nSegment Summary:")
-print(segment_summary)
-
-# Save each segment into a separate CSV
-for segment in rfm['Segment'].unique():
-    segment_df = rfm[rfm['Segment'] == segment]
-    filename = f"outputs/{segment.replace(' ', '_').lower()}_customers.csv"
-    segment_df.to_csv(filename)
-
-print("All segment files saved separately 🗂️")
+    # Save each segment into a separate CSV
+    for segment in rfm['Segment'].unique():
+        segment_df = rfm[rfm['Segment'] == segment]
+        filename = f"outputs/{segment.replace(' ', '_').lower()}_customers.csv"
+        segment_df.to_csv(filename)
 
+    print("All segment files saved separately 🗂️")
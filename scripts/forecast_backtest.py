@@ -0,0 +1,30 @@
+import pandas as pd
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from backend.artifact_store import load_artifact, save_artifact
+from backend.backtest import backtest, backtest_matrix
+from backend.batch_forecast import build_matrix, default_season
+from backend.forecasting import METRICS, prepare_daily
+
+pd.set_option('display.width', 120)
+
+if __name__ == "__main__":
+    # 1. Day Sell aggregates: every statsmodels config, 30-day folds every 14 days
+    df = prepare_daily(load_artifact('day_sell_cleaned', parse_dates=['Date']))
+    folds, summary = backtest(df, METRICS, initial=180, horizon=30, step=14)
+    print("\n📊 Day Sell backtest (mean over folds and metrics):")
+    print(summary.round(4))
+
+    # 2. Per-product SELL_1 series with the vectorized engine
+    sell = load_artifact('sell_1_cleaned', columns=['Date', 'PKod', 'Pquantity'], parse_dates=['Date'])
+    y, keys, periods = build_matrix(sell.dropna(subset=['Date']), 'PKod', 'Pquantity')
+    product_folds, product_summary = backtest_matrix(
+        y, default_season(periods), initial=max(2, len(periods) // 2), horizon=1
+    )
+    print(f"\n📦 Per-product backtest ({len(keys)} series x {len(periods)} periods):")
+    print(product_summary.round(4))
+
+    # ✅ Save every fold so configs can be compared on accuracy and compute cost
+    save_artifact(pd.concat([folds, product_folds], ignore_index=True), "forecast_backtest")
+    print("\n✅ forecast_backtest.csv saved in data/processed/")
@@ -0,0 +1,21 @@
+import argparse
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from backend.store import DATASETS, STORE_PATH, load_store
+
+# Bulk-load the processed datasets into the SQLite store the dashboard queries
+parser = argparse.ArgumentParser()
+parser.add_argument("tables", nargs="*", help=f"tables to load (default: all of {', '.join(DATASETS)})")
+args = parser.parse_args()
+unknown = [t for t in args.tables if t not in DATASETS]
+if unknown:
+    parser.error(f"unknown tables: {', '.join(unknown)}")
+
+loaded = load_store(args.tables or None)
+for table, (rows, seconds) in loaded.items():
+    print(f"✅ {table:<16} {rows:>10,} rows in {seconds:6.2f} s ({rows / max(seconds, 1e-9):,.0f} rows/s)")
+skipped = [t for t in (args.tables or DATASETS) if t not in loaded]
+if skipped:
+    print(f"⚠️ Source files missing, not loaded: {', '.join(skipped)}")
+print(f"📦 Store: {STORE_PATH}")
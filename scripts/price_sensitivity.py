@@ -1,63 +1,51 @@
 # scripts/price_sensitivity.py
 
 import pandas as pd
-import numpy as np
+import matplotlib
+matplotlib.use("Agg")  # headless: figures are saved, never shown
 import matplotlib.pyplot as plt
-import seaborn as sns
 
-from sklearn.linear_model import LinearRegression
-from sklearn.metrics import r2_score
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from backend.artifact_store import load_artifact, save_artifact
+from backend.elasticity import elasticity_table
 
-# 🔹 Load Data
-df = pd.read_csv("data/processed/ads_cleaned.csv")
+# 🔹 Load real prices and units sold per product per day
+df = load_artifact("sell_1_cleaned", columns=["Date", "PKod", "Pgroup", "Pname", "Pquantity", "pce_sb"])
 print("📦 Data Loaded:")
 print(df.head())
 
-# 🔸 Simulate Price and Revenue for Analysis
-np.random.seed(42)
-df['price'] = np.random.uniform(10, 100, size=len(df))
-df['click'] = df['click'].fillna(0)  # Ensure clicks are numeric
-df['revenue'] = df['click'] * df['price']
-
-print("\n💰 Sample Revenue Data:")
-print(df[['id', 'price', 'click', 'revenue']].head())
-
-# 🔹 Visualize Price vs Click Rate
-plt.figure(figsize=(8, 5))
-sns.scatterplot(data=df, x='price', y='click', alpha=0.6)
-plt.title("💸 Price vs Clicks")
-plt.xlabel("Ad Price")
-plt.ylabel("Clicks")
-plt.grid(True)
-plt.tight_layout()
-plt.show()
-
-# 🔸 Train Linear Regression Model to Check Sensitivity
-X = df[['price']]
-y = df['click']
-
-model = LinearRegression()
-model.fit(X, y)
-y_pred = model.predict(X)
-
-# 🔹 Display Model Metrics
-print("\n📉 Price Sensitivity Model:")
-print(f"Slope (Price Coefficient): {model.coef_[0]:.4f}")
-print(f"Intercept: {model.intercept_:.4f}")
-print(f"R-squared: {r2_score(y, y_pred):.4f}")
-
-# 🔸 Visualize Regression Line
-plt.figure(figsize=(8, 5))
-sns.scatterplot(x=df['price'], y=df['click'], alpha=0.5, label="Actual")
-plt.plot(df['price'], y_pred, color='red', label="Regression Line")
-plt.title("🧠 Price Sensitivity (Regression)")
-plt.xlabel("Price")
-plt.ylabel("Clicks")
+# 🔸 Log-log elasticity for every product and product group in one pass
+table = elasticity_table(df)
+groups = table[table["scope"] == "group"].sort_values("elasticity")
+products = table[table["scope"] == "product"]
+print(f"\n📉 Elasticities: {len(products):,} of {df['PKod'].nunique():,} products (rest have too few sales "
+      f"or a fixed price), {len(groups)} groups")
+
+print("\n🛒 Group elasticities (95% CI):")
+print(groups[["Pgroup", "n_products", "n_obs", "elasticity", "ci_low", "ci_high"]].to_string(index=False))
+
+# Products whose whole interval sits below -1: cutting price grows revenue
+elastic = products[products["ci_high"] < -1].sort_values("elasticity")
+print(f"\n💸 {len(elastic)} products are clearly elastic (CI entirely below -1):")
+print(elastic[["PKod", "Pname", "elasticity", "ci_low", "ci_high"]].head(10).to_string(index=False))
+
+# 🔹 Visualize group elasticities with their confidence intervals
+plt.figure(figsize=(8, 10))
+plt.errorbar(groups["elasticity"], groups["Pgroup"],
+             xerr=[groups["elasticity"] - groups["ci_low"], groups["ci_high"] - groups["elasticity"]],
+             fmt="o", capsize=3)
+plt.axvline(0, color="grey", linewidth=1)
+plt.axvline(-1, color="red", linestyle="--", linewidth=1, label="unit elastic")
+plt.title("Price Elasticity by Product Group (95% CI)")
+plt.xlabel("Elasticity (% change in units per 1% price change)")
 plt.legend()
 plt.grid(True)
 plt.tight_layout()
-plt.show()
+plt.savefig("outputs/price_elasticity_groups.png")
+plt.close()
 
-# ✅ Save final data with price & revenue to CSV
-df.to_csv("data/processed/price_sensitivity.csv", index=False)
-print("✅ price_sensitivity.csv saved in data/processed/")
+# ✅ Save the elasticity table for the Price Sensitivity page
+save_artifact(table, "price_elasticity")
+print("✅ price_elasticity.csv saved in data/processed/")
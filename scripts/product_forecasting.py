@@ -0,0 +1,22 @@
+import pandas as pd
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from backend.artifact_store import load_artifact, save_artifact
+from backend.batch_forecast import forecast_by
+
+# Load per-product sales (Parquet keeps Date typed; parse_dates only applies to the CSV fallback)
+df = load_artifact('sell_1_cleaned', columns=['Date', 'PKod', 'Pgroup', 'Pquantity'], parse_dates=['Date'])
+df = df.dropna(subset=['Date'])
+print(f"📦 Loaded {len(df)} rows for {df['PKod'].nunique()} products")
+
+# Forecast quantity for every product and every product group (one vectorized pass each)
+for key, name in [('PKod', 'product_forecast'), ('Pgroup', 'group_forecast')]:
+    result, timings = forecast_by(df, key, value='Pquantity', horizon_days=30)
+    print(f"\n📊 {key}: {timings['series']} series x {timings['periods']} periods "
+          f"(pivot {timings['pivot_seconds'] * 1000:.0f} ms, fit {timings['fit_seconds'] * 1000:.0f} ms)")
+    print(result.iloc[:, :6].head())
+
+    # Same layout as sales_forecast.csv: Date + one column per series
+    save_artifact(result, name)
+    print(f"✅ {name}.csv saved in data/processed/")
@@ -1,41 +1,20 @@
 import pandas as pd
+import matplotlib
+matplotlib.use("Agg")  # headless: figures are saved, never shown
 import matplotlib.pyplot as plt
-from statsmodels.tsa.holtwinters import ExponentialSmoothing
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from backend.artifact_store import load_artifact, save_artifact
+from backend.forecasting import forecast_metrics, prepare_daily
 
-# Load the data
-data_path = 'data/processed/day_sell_cleaned.csv'
-df = pd.read_csv(data_path, parse_dates=['Date'])
-
-# Set Date as index
-df.set_index('Date', inplace=True)
-
-# Resample daily (fill missing dates)
-df = df.resample('D').mean().interpolate()
-
-# Drop rows with any remaining NaNs
-df.dropna(inplace=True)
-
-# Forecast each metric one by one
+# Forecast each metric (fitted in parallel, parameters persisted in backend/models/)
 metrics = ['zn', 'sb', 'tax', 'marza']
 forecast_days = 30
 
-# --- NEW: Create a dictionary to collect all forecasts ---
-all_forecasts = {}
-
-for metric in metrics:
-    print(f"\n📊 Forecasting for: {metric}")
-
-    # Build and fit the model
-    model = ExponentialSmoothing(df[metric], trend='add', seasonal='add', seasonal_periods=7)
-    fit = model.fit()
 
-    # Forecast future values
-    forecast = fit.forecast(forecast_days)
-
-    # Save forecast values to dictionary
-    all_forecasts[metric] = forecast.values
-
-    # Plot
+def plot_forecast(df, result, metric):
+    forecast = result.set_index('Date')[metric]
     plt.figure(figsize=(12, 5))
     plt.plot(df[metric], label=f'Actual {metric}')
     plt.plot(forecast, label=f'Forecasted {metric}', color='red')
@@ -45,17 +24,26 @@ for metric in metrics:
     plt.legend()
     plt.grid(True)
     plt.tight_layout()
-    plt.show()
+    plt.savefig(f'outputs/forecast_{metric}.png')
+    plt.close()
+
+
+if __name__ == "__main__":
+    # Load the data (Parquet keeps Date typed; parse_dates only applies to the CSV fallback)
+    df = load_artifact('day_sell_cleaned', parse_dates=['Date'])
+
+    # Resample daily (fill missing dates) and drop rows with any remaining NaNs
+    df = prepare_daily(df)
 
-# --- NEW: Create a DataFrame from the forecasts ---
-result = pd.DataFrame(all_forecasts)
+    result, report = forecast_metrics(df, metrics, forecast_days)
 
-# Add a date column for the next 30 days
-result['Date'] = pd.date_range(start=df.index[-1] + pd.Timedelta(days=1), periods=forecast_days)
+    print("\n⏱️ Fit report:")
+    for row in report.itertuples():
+        print(f"  {row.metric:<6} {row.mode:<7} {row.n_obs} days  {row.fit_seconds * 1000:8.1f} ms")
 
-# Reorder to keep Date in front
-result = result[['Date'] + metrics]
+    for metric in metrics:
+        plot_forecast(df, result, metric)
 
-# Save the forecast result to CSV
-result.to_csv("data/processed/sales_forecast.csv", index=False)
-print("✅ sales_forecast.csv saved in data/processed/")
+    # Save the forecast result to CSV
+    save_artifact(result, "sales_forecast")
+    print("✅ sales_forecast.csv saved in data/processed/")
@@ -0,0 +1,34 @@
+import importlib
+import sys
+import time
+
+# Page title -> module in views/. A page's module (and whatever it imports,
+# e.g. matplotlib/seaborn) is only loaded the first time that page is opened.
+# Not called pages/ because Streamlit would turn that into its own multipage nav.
+PAGES = {
+    "Home": "home",
+    "Sales Forecast": "sales_forecast",
+    "Customer Segmentation": "customer_segmentation",
+    "Competitor Analysis": "competitor_analysis",
+    "Price Sensitivity": "price_sensitivity",
+    "Customer Lifetime Value": "clv",
+    "Ad Campaign Effectiveness": "ad_campaign",
+    "Extra Insights": "extra_insights",
+}
+
+# Seconds each page module took to import in this process (first open only)
+import_seconds = {}
+
+
+def load_page(page):
+    name = f"views.{PAGES[page]}"
+    if name in sys.modules:
+        return sys.modules[name]
+    start = time.perf_counter()
+    module = importlib.import_module(name)
+    import_seconds[page] = time.perf_counter() - start
+    return module
+
+
+def render(page):
+    load_page(page).render()
@@ -0,0 +1,14 @@
+import streamlit as st
+from views.common import show_figure
+
+
+# ========== AD CAMPAIGN EFFECTIVENESS ==========
+def render():
+    st.header("📢 Ad Campaign Effectiveness")
+    show_figure("Figure_9.png", "Feature Importance for Click Prediction")
+    st.markdown("""
+    <div style="font-size:16px; line-height:1.5; margin-bottom:20px;">
+    This figure shows which features (like user age, device type, ad position and other factors) most influence whether an ad gets clicked.  
+    For Indian digital marketers, understanding these factors is essential to optimize ad targeting, reduce wasted spend, and increase campaign ROI. Finally, a dashboard that shows which campaigns are actually driving results. See your ad spend vs impact in real terms — sales, clicks, conversions, the whole shebang. Kill the campaigns that don’t work, double down on the ones that do, and become a marketing genius with zero guesswork.
+    </div>
+    """, unsafe_allow_html=True)
@@ -0,0 +1,60 @@
+import streamlit as st
+import matplotlib.pyplot as plt
+import seaborn as sns
+from backend.data_loader import load_dataset
+from views.common import download_button, record_lookup, show_chart, show_figure
+
+
+def _top_customers_bar(df):
+    # Ids as text, so seaborn draws one horizontal bar per customer instead of
+    # treating the numeric ids as a value axis
+    top_customers = df.sort_values(by='clv', ascending=False).head(10)
+    top_customers = top_customers.assign(customer_id=top_customers['customer_id'].astype(str))
+    fig, ax = plt.subplots()
+    sns.barplot(data=top_customers, x='clv', y='customer_id', hue='customer_id', palette='Blues_d',
+                legend=False, orient='h', ax=ax)
+    ax.set_title('Top Customers by CLV')
+    return fig
+
+
+# ========== CUSTOMER LIFETIME VALUE ==========
+def render():
+    st.header("💰 Customer Lifetime Value")
+    with st.spinner("Loading CLV data..."):
+        try:
+            df = load_dataset("data/processed/clv.csv")
+            st.dataframe(df.head())
+            download_button("data/processed/clv.csv", "clv.csv")
+            record_lookup("clv", "customer_id", "🔍 Look up a customer by ID")
+
+            if 'clv' in df.columns and 'customer_id' in df.columns:
+                st.subheader("Top 10 Customers by CLV")
+                show_chart("data/processed/clv.csv", "top10_clv_bar", lambda: _top_customers_bar(df))
+
+                st.markdown("""
+                <div style="font-size:16px; line-height:1.5; margin-bottom:20px;">
+                This bar chart ranks the top 10 customers based on their lifetime value.  
+                Indian businesses can focus their retention and loyalty programs on these high-value customers, maximizing profits and encouraging repeat purchases.
+                </div>
+                """, unsafe_allow_html=True)
+
+        except Exception as e:
+            st.error(f"❌ Failed to load data: {e}")
+
+    #  Showing extra figure: CLV by Segment
+
+    st.subheader("Customer segments based on CLV")
+    show_figure("Figure_10.png", "CLV by Segment: Comparing Average Lifetime Value Across Customer Groups")
+
+    st.markdown("""
+    <div style="font-size:16px; line-height:1.5; margin-top:10px;">
+   This segmentation lets you focus on customers who’ll stick around and spend more over time. These insights help you retain valuable customers longer, prioritize your ad spend, and build loyalty strategies that deliver compounding returns. Invest smarter, not harder.  \n
+    You can use this insight to:
+    <ul>
+        <li> Personalize offers and experiences for your best segments</li>
+        <li> Run targeted marketing campaigns only where it counts</li>
+        <li> Prioritize budget and retention efforts to maximize ROI</li>
+    </ul>
+    Instead of treating every customer the same, this helps you invest smartly in the segments that actually matter. 🎯
+    </div>
+    """, unsafe_allow_html=True)
@@ -0,0 +1,93 @@
+import streamlit as st
+import os
+from PIL import Image
+
+
+# -- Show Saved Figures --
+def show_figure(filename, caption=""):
+    path = os.path.join("Figures", filename)
+    if os.path.exists(path):
+        image = Image.open(path)
+        st.image(image, caption=caption, use_container_width=True)
+    else:
+        st.warning(f"⚠️ Figure '{filename}' not found.")
+
+# -- Utility: Download Button (export written on first click, then served from disk) --
+def download_button(path, filename):
+    from backend.exports import FORMATS, export_bytes
+
+    c1, c2 = st.columns([1, 3])
+    fmt = c1.selectbox("Format", list(FORMATS), key=f"{filename}_format", label_visibility="collapsed")
+    extension, mime = FORMATS[fmt]
+    c2.download_button(f"📥 Download {fmt.upper()}", data=lambda: export_bytes(path, fmt),
+                       file_name=os.path.splitext(filename)[0] + extension, mime=mime)
+
+# -- Paged Table: filters, sorting and paging run in SQLite, only one page is sent --
+def paged_table(path, key, page_size=50):
+    from backend.table_query import OPERATORS, query_table, table_columns
+
+    columns = table_columns(path)
+    names = list(columns)
+    with st.expander("🔎 Filter / sort", expanded=False):
+        shown = st.multiselect("Columns", names, default=names, key=f"{key}_columns")
+        c1, c2, c3 = st.columns(3)
+        filter_column = c1.selectbox("Filter column", ["(none)"] + names, key=f"{key}_filter_column")
+        operator = c2.selectbox("Operator", list(OPERATORS), key=f"{key}_operator")
+        value = c3.text_input("Value", key=f"{key}_value")
+        c4, c5 = st.columns(2)
+        sort = c4.selectbox("Sort by", ["(none)"] + names, key=f"{key}_sort")
+        descending = c5.checkbox("Descending", key=f"{key}_descending")
+
+    filters = []
+    if filter_column != "(none)" and value != "":
+        if operator != "contains" and columns[filter_column] in ("INTEGER", "REAL"):
+            try:
+                value = float(value)
+            except ValueError:
+                st.warning(f"⚠️ '{value}' is not a number; comparing as text.")
+        filters.append((filter_column, operator, value))
+
+    # Start from the first page whenever the filter or sort changes (or the
+    # page widget's state was dropped after visiting another page)
+    state = (tuple(shown), tuple(filters), sort, descending)
+    if st.session_state.get(f"{key}_state") != state or f"{key}_page" not in st.session_state:
+        st.session_state[f"{key}_state"] = state
+        st.session_state[f"{key}_page"] = 1
+
+    result = query_table(path, shown or None, filters, None if sort == "(none)" else sort, descending,
+                         st.session_state[f"{key}_page"] - 1, page_size)
+    pages = max(1, -(-result.total // page_size))
+    st.dataframe(result.rows, hide_index=True)
+    c1, c2 = st.columns([1, 3])
+    c1.number_input("Page", min_value=1, max_value=pages, step=1, key=f"{key}_page")
+    first = result.page * page_size
+    c2.caption(f"Rows {min(first + 1, result.total):,}–{min(first + page_size, result.total):,} of {result.total:,} "
+               f"• page {result.page + 1} of {pages} • query {result.seconds * 1000:.1f} ms")
+
+# -- Record Lookup: one indexed query against the SQLite store --
+def record_lookup(table, column, label):
+    from backend.store import store_lookup
+
+    value = st.text_input(label, key=f"{table}_{column}_lookup")
+    if value.strip() == "":
+        return
+    try:
+        value = float(value) if "." in value else int(value)
+    except ValueError:
+        pass  # text keys (dates, names) are compared as text
+    # A failed lookup only replaces its own result, never the rest of the page
+    try:
+        rows = store_lookup(table, column, value)
+    except Exception as e:
+        st.warning(f"⚠️ Lookup failed: {e}")
+        return
+    if rows.empty:
+        st.info(f"No {table} rows with {column} = {value}.")
+    else:
+        st.dataframe(rows, hide_index=True)
+
+# -- Cached Chart: drawn once per version of the data, then served as an image --
+def show_chart(path, spec, draw):
+    from backend.chart_cache import cached_chart
+
+    st.image(cached_chart(path, spec, draw), use_container_width=True)
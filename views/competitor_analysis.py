@@ -0,0 +1,39 @@
+import streamlit as st
+import matplotlib.pyplot as plt
+import seaborn as sns
+from backend.data_loader import load_dataset
+from backend.downsample import plot_scatter, point_budget
+from views.common import download_button, show_chart
+
+
+def _price_sales_scatter(df, budget):
+    fig, ax = plt.subplots(figsize=(10, 6))
+    plot_scatter(ax, df['Price'], df['Sales'], budget,
+                 scatter=lambda: sns.scatterplot(data=df, x='Price', y='Sales', ax=ax))
+    ax.set_title('Price vs Sales')
+    ax.grid(True)
+    return fig
+
+
+# ========== COMPETITOR ANALYSIS ==========
+def render():
+    st.header("🥊 Competitor Analysis")
+    with st.spinner("Loading competitor data..."):
+        try:
+            df = load_dataset("data/processed/competitor_data.csv")
+            st.dataframe(df.head())
+            download_button("data/processed/competitor_data.csv", "competitor_data.csv")
+
+            if 'Price' in df.columns and 'Sales' in df.columns:
+                st.subheader("Price vs Sales")
+                budget = point_budget("price_sales_scatter")
+                show_chart("data/processed/competitor_data.csv", ("price_sales_scatter", budget), lambda: _price_sales_scatter(df, budget))
+
+                st.markdown("""
+                <div style="font-size:16px; line-height:1.5; margin-bottom:20px;">
+                This scatter plot compares competitors' product prices with their sales volume.  
+                For Indian companies, analyzing competitor pricing helps set competitive prices without losing profit, ensuring they attract price-sensitive customers while maintaining market share. Here you can see how changes in price affect your actual sales volume. It's the cheat code for discovering the optimal pricing zone. Whether you're launching new products or adjusting existing ones, you’ll know exactly when you're hitting the sweet spot — and when you’re leaving money on the table.
+                </div>
+                """, unsafe_allow_html=True)
+        except Exception as e:
+            st.error(f"❌ Failed to load data: {e}")
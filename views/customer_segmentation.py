@@ -0,0 +1,47 @@
+import streamlit as st
+import matplotlib.pyplot as plt
+import seaborn as sns
+from backend.data_loader import load_dataset
+from views.common import download_button, record_lookup, show_chart, show_figure
+
+
+def _segment_pie(df):
+    fig, ax = plt.subplots()
+    ax.pie(df['segment'].value_counts(), labels=df['segment'].value_counts().index,
+           autopct='%1.1f%%', colors=sns.color_palette("pastel"))
+    ax.axis('equal')
+    return fig
+
+
+# ========== CUSTOMER SEGMENTATION ==========
+def render():
+    st.header("🧠 Customer Segmentation")
+    with st.spinner("Loading segmentation data..."):
+        try:
+            df = load_dataset("data/processed/customer_segments.csv")
+            st.dataframe(df.head())
+            download_button("data/processed/customer_segments.csv", "customer_segments.csv")
+            record_lookup("segments", "CustomerID", "🔍 Look up a customer by ID")
+
+            if 'segment' in df.columns:
+                st.subheader("Segment Distribution")
+                show_chart("data/processed/customer_segments.csv", "segment_pie", lambda: _segment_pie(df))
+
+                st.markdown("""
+                <div style="font-size:16px; line-height:1.5; margin-bottom:20px;">
+                This pie chart shows how customers are divided into different segments based on their buying behavior.  
+                For Indian businesses, understanding these segments is crucial for tailoring marketing campaigns, creating personalized offers, and improving customer satisfaction.  
+                It helps save costs by targeting the right audience instead of a generic approach.
+                </div>
+                """, unsafe_allow_html=True)
+        except Exception as e:
+            st.error(f"❌ Failed to load data: {e}")
+
+    st.subheader("Customer Segments : Recency vs Monetary")
+    show_figure("Figure_2.png", "Customer Segments: Monetary vs Recency")
+    st.markdown("""
+    <div style="font-size:16px; line-height:1.5; margin-bottom:20px;">
+    This plot visualizes customer segments by how recently and how much they spend.  
+    retailers can use this to identify loyal customers and those at risk of churning, helping design reward programs that boost retention and lifetime value. This chart breaks down customer behavior based on how recently they bought and how much they spent. Want to know who your MVPs are? Or who needs a reactivation nudge? Done. It empowers precision targeting so you don’t waste a single campaign rupee.
+    </div>
+    """, unsafe_allow_html=True)
@@ -0,0 +1,66 @@
+import streamlit as st
+
+
+# ========== EXTRA INSIGHTS ==========
+def render():
+    st.markdown("<h1 style='font-size:36px;'>💡 Extra Insights</h1>", unsafe_allow_html=True)
+
+    st.markdown("""
+    <div style="font-size:18px; line-height:1.8; margin-top:10px; margin-bottom:40px;">
+        This dashboard is more than just charts and predictions — it's designed to support smart decision-making based on real market behavior.  
+        By combining multiple data sources like sales, pricing trends, and customer preferences, we help businesses focus on what matters most.  
+        Here's a breakdown of the most valuable insights uncovered through this project:
+    </div>
+    """, unsafe_allow_html=True)
+
+    st.markdown("""
+    <div style="line-height:1.8; font-size:16px;">
+
+    <h2 style="font-size:24px;">📌 Understanding the Big Picture</h2>
+    <p>
+        Instead of analyzing metrics in isolation, this dashboard combines behavior, pricing, market response, and performance into one unified strategy.  
+        This connected view is essential for businesses to identify long-term patterns, seasonal trends, and emerging opportunities, especially in dynamic markets where customer preferences shift frequently.
+    </p>
+
+    <h2 style="font-size:22px;">👥 Customer Segmentation: Personalizing for Diversity</h2>
+    <p>
+        Every customer is different — some buy often, others only during sales, and some respond better to certain product categories.  
+        With proper segmentation, businesses can identify these patterns and offer more personalized experiences.  
+        For example, customers in Tier-1 cities may value convenience and brand loyalty, while those in Tier-2/3 cities might be more price-sensitive and promo-driven.  
+        This helps companies design smarter campaigns and avoid a one-size-fits-all approach.
+    </p>
+
+    <h2 style="font-size:22px;">💸 Price Sensitivity: Finding the Sweet Spot</h2>
+    <p>
+        Pricing has a direct impact on conversion — and understanding how much a price change affects customer behavior is crucial.  
+        Our analysis helps identify the exact price bands where customers are most likely to purchase.  
+        This is especially important in competitive product categories like mobile accessories or packaged foods, where even ₹10 difference can affect buying decisions.  
+        Businesses can use this to optimize pricing strategy without hurting profit margins.
+    </p>
+
+    <h2 style="font-size:22px;">🏁 Competitor Analysis: Staying Ahead</h2>
+    <p>
+        Businesses don't operate in isolation — customers are constantly comparing options.  
+        Through competitor performance and pricing analysis, companies can spot gaps and areas where they’re underperforming.  
+        For instance, if a competitor is gaining more traction in certain regions or product lines, this insight can prompt a relook into marketing or bundling strategies.  
+        Staying informed about the market helps businesses make proactive moves.
+    </p>
+
+    <h2 style="font-size:22px;">📈 Customer Lifetime Value: Prioritizing What Matters</h2>
+    <p>
+        Some customers bring far more value over time than others.  
+        Our CLV model helps identify which customers are worth investing in for loyalty and retention.  
+        For example, frequent buyers of high-margin items should be targeted with exclusive deals or early access offers.  
+        In a growing online shopping environment, long-term relationships reduce acquisition costs and increase revenue stability.
+    </p>
+
+    <h2 style="font-size:22px;">🎯 Ad Campaign Effectiveness: Smarter Spending</h2>
+    <p>
+        Digital ads can be expensive — and spending without targeting leads to wasted budgets.  
+        By analyzing which customer attributes lead to higher ad clicks, businesses can improve targeting strategies.  
+        For instance, promoting fashion items to users who’ve shown interest in lifestyle content at peak hours yields better results than broad-based campaigns.  
+        This boosts ROI and ensures that campaigns hit the right audience at the right time.
+    </p>
+
+    </div>
+    """, unsafe_allow_html=True)
@@ -0,0 +1,55 @@
+import streamlit as st
+import os
+import json
+
+
+# -- Load Lottie Animation --
+def load_lottiefile(filepath: str):
+    if os.path.exists(filepath):
+        with open(filepath, "r") as f:
+            return json.load(f)
+    return None
+
+
+# ========== HOME ==========
+def render():
+    lottie_dashboard = load_lottiefile("animations/dashboard.json")
+
+    # Properly styled title
+    st.markdown("<h1 style='font-size:36px; font-weight:700; margin-bottom:25px;'>🔍 MarketLens: Market Research & Sales Dashboard</h1>", unsafe_allow_html=True)
+
+    # Optional: Lottie animation
+    if lottie_dashboard:
+        # streamlit_lottie costs ~0.3 s to import; only pay it when there's an animation
+        from streamlit_lottie import st_lottie
+        st_lottie(lottie_dashboard, speed=1, reverse=False, loop=True, quality="high", height=60)
+
+    # Beautifully styled description
+    st.markdown("""
+        <div style="font-size:17px; line-height:1.7; margin-top:10px; margin-bottom:30px;">
+            <p>
+                In today’s fast-changing markets, especially in regions with diverse customer behavior, new businesses often struggle with scattered, disconnected data.  
+                They rely on gut-feel marketing, generic pricing strategies, and guesswork — which frequently results in wasted resources, missed opportunities, and stagnant growth.\n
+         This project is developed specifically to bridge that gap.\n
+         By combining customer segmentation, pricing analysis, competition study, lifetime value modeling, and campaign performance — all in one comprehensive dashboard — 
+                decision-makers gain a clear, actionable view of what’s really happening. Whether launching a new product, expanding to new markets, or aiming to optimize marketing spend, 
+                this tool empowers to make faster, more confident, data-driven decisions.
+                That’s what makes this project an actual need. It’s a response to a real problem new businesses face.\n
+         Now, with this tool, they won’t have to...
+            </p>
+        </div>
+    """, unsafe_allow_html=True)
+
+    # Clean feature list with spacing
+    st.markdown("""
+        <div style="font-size:20px; font-weight:600; margin-bottom:10px;">📊 Key Features</div>
+        <ul style="font-size:16px; line-height:1.8; margin-left:20px;">
+            <li>📈 <b>Sales Forecasting</b> (30-day)</li>
+            <li>🧠 <b>Customer Segmentation</b></li>
+            <li>🥊 <b>Competitor Analysis</b></li>
+            <li>💸 <b>Price Sensitivity</b></li>
+            <li>💰 <b>Customer Lifetime Value (CLV)</b></li>
+            <li>📢 <b>Ad Campaign Effectiveness</b></li>
+            <li>💡 <b>Extra Insights</b></li>
+        </ul>
+    """, unsafe_allow_html=True)
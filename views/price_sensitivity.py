@@ -0,0 +1,49 @@
+import streamlit as st
+import matplotlib.pyplot as plt
+import os
+from backend.data_loader import load_dataset
+from views.common import download_button, show_chart
+
+
+def _group_elasticity_chart(groups):
+    fig, ax = plt.subplots(figsize=(8, 10))
+    ax.errorbar(groups['elasticity'], groups['Pgroup'],
+                xerr=[groups['elasticity'] - groups['ci_low'], groups['ci_high'] - groups['elasticity']],
+                fmt='o', capsize=3)
+    ax.axvline(0, color='grey', linewidth=1)
+    ax.axvline(-1, color='red', linestyle='--', linewidth=1, label='unit elastic')
+    ax.set_xlabel('Elasticity (% change in units per 1% price change)')
+    ax.legend()
+    ax.grid(True)
+    return fig
+
+
+# ========== PRICE SENSITIVITY ==========
+def render():
+    st.header("💸 Price Sensitivity Analysis")
+    with st.spinner("Loading price elasticity data..."):
+        try:
+            if not os.path.exists("data/processed/price_elasticity.csv"):
+                st.info("ℹ️ Run `python scripts/price_sensitivity.py` to build the elasticity table.")
+            else:
+                df = load_dataset("data/processed/price_elasticity.csv")
+                groups = df[df['scope'] == 'group'].sort_values('elasticity')
+                products = df[df['scope'] == 'product']
+
+                st.subheader("Price elasticity by product group")
+                show_chart("data/processed/price_elasticity.csv", "group_elasticity", lambda: _group_elasticity_chart(groups))
+
+                st.markdown("""
+                <div style="font-size:16px; line-height:1.5; margin-bottom:20px;">
+                Each dot is how much units sold move when a group's prices move by 1%, measured from real price changes of the products in that group, with its 95% confidence interval.  
+                Below -1 (the red line) demand is elastic: a discount grows revenue. Between -1 and 0 customers barely react, so there is room to raise prices without losing volume. Intervals that cross 0 mean the data can't tell yet.
+                </div>
+                """, unsafe_allow_html=True)
+
+                st.subheader("Product elasticities")
+                group = st.selectbox("Product group", ["All"] + groups['Pgroup'].tolist())
+                shown = products if group == "All" else products[products['Pgroup'] == group]
+                st.dataframe(shown.drop(columns=['scope', 'n_products']).sort_values('elasticity'))
+                download_button("data/processed/price_elasticity.csv", "price_elasticity.csv")
+        except Exception as e:
+            st.error(f"❌ Failed to load data: {e}")
@@ -0,0 +1,85 @@
+import streamlit as st
+import matplotlib.pyplot as plt
+from backend.data_loader import load_dataset
+from backend.downsample import plot_line, point_budget
+from views.common import download_button, paged_table, show_chart, show_figure
+
+
+def _forecast_line(df, column, budget):
+    fig, ax = plt.subplots(figsize=(10, 4))
+    plot_line(ax, df.index, df[column], budget, label=column, color='teal')
+    ax.set_title(f"30-Day Forecast: {column.upper()}")
+    ax.grid(True)
+    return fig
+
+
+# ========== SALES FORECAST ==========
+def render():
+    st.header("📈 Sales Forecast")
+    with st.spinner("Loading sales forecast data..."):
+        try:
+            df = load_dataset('data/final_output.csv')
+            paged_table("data/final_output.csv", "sales_forecast")
+            download_button("data/final_output.csv", "sales_forecast.csv")
+
+            selected_columns = ['ZN', 'SB', 'TAX', 'MARZA', 'total_sales']
+            for column in selected_columns:
+                if column in df.columns:
+                    st.subheader(f"📊 Forecast for {column.upper()}")
+                    budget = point_budget("forecast_line")
+                    show_chart("data/final_output.csv", ("forecast_line", column, budget), lambda: _forecast_line(df, column, budget))
+
+                    st.markdown(f"""
+                    <div style="font-size:16px; line-height:1.5; margin-bottom:20px;">
+                    This line graph shows the predicted sales trend for <b>{column.upper()}</b> over the next 30 days.  
+                    For businesses in India, especially small and medium enterprises, understanding these trends helps in managing stock, planning promotions, and avoiding overproduction.  
+                    Accurate forecasting ensures better cash flow and customer satisfaction by meeting demand without delay.
+                    </div>
+                    """, unsafe_allow_html=True)
+        except Exception as e:
+            st.error(f"❌ Failed to load data: {e}")
+
+    st.subheader("30-Day Forecast for ZN")
+    show_figure("Figure_3.png", "ZN: 30-Day Forecast")
+    st.markdown("""
+    <div style="font-size:16px; line-height:1.5; margin-bottom:20px;">
+    This chart visualizes the 30-day sales forecast for the ZN product segment.  
+    In the Indian market, where demand can vary due to festivals, seasons, or regional preferences, such forecasts help businesses prepare inventory and marketing strategies effectively. ZN refers to a specific zone or behavioral customer segment, grouped by traits like region, shopping patterns, or engagement level. The 30-day forecast for ZN helps you predict demand, campaign responsiveness, and sales behavior in this distinct cluster. Whether you're planning targeted promotions or adjusting logistics, this gives you the clarity to act fast and profit smart.
+    </div>
+    """, unsafe_allow_html=True)
+
+    st.subheader("30-Day Forecast for SB")
+    show_figure("Figure_4.png", "SB: 30-Day Forecast")
+    st.markdown("""
+    <div style="font-size:16px; line-height:1.5; margin-bottom:20px;">
+    The SB forecast graph indicates how this product line’s sales are expected to change soon.  
+    Retailers in India often face challenges from sudden market shifts; reliable predictions aid in keeping products available when customers want them most. SB stands for Small Business customers, one of the most crucial buyer groups in many industries. This forecast offers a forward-looking view into how sales from this group are likely to shift. Use it to tailor B2B outreach, improve service cycles, or plan capacity based on demand. Predict small biz momentum — and serve them better before they even ask.
+    </div>
+    """, unsafe_allow_html=True)
+
+    st.subheader("30-Day Forecast for TAX") 
+    show_figure("Figure_5.png", "TAX: 30-Day Forecast")
+    st.markdown("""
+    <div style="font-size:16px; line-height:1.5; margin-bottom:20px;">
+    This forecast highlights the sales projection for TAX, crucial for budgeting and resource allocation.  
+    Indian businesses can use these insights to optimize their supply chain and improve operational efficiency. This module anticipates how tax-driven sales (e.g., seasonal purchases around tax deadlines or filings) might trend over the next month. It’s ideal for businesses dealing in finance, consultancy, or software tools. Stay ahead of cyclical surges, align marketing with demand spikes, and plan for peak revenue windows without scrambling last-minute.
+    </div>
+    """, unsafe_allow_html=True)
+
+    st.subheader("30-Day Forecast for MARZA")
+    show_figure("Figure_6.png", "MARZA: 30-Day Forecast")
+    st.markdown("""
+    <div style="font-size:16px; line-height:1.5; margin-bottom:20px;">
+    The MARZA product’s predicted sales pattern is shown here, offering a window into future customer demand.  
+    This assists Indian entrepreneurs in making smarter decisions about promotions and stock replenishment, especially during peak shopping periods. MARZA reflects a high-margin product category or a profitable customer cluster you’ve defined. With this forecast, you get predictive insights on how sales in this juicy segment will perform — helping you focus on the most lucrative areas. Great for inventory decisions, premium campaigns, and high-ROI planning.
+    </div>
+    """, unsafe_allow_html=True)
+
+    st.subheader("Total Sales Over Time")
+    show_figure("Figure_7.png", "Total Sales Over Time")
+    st.markdown("""
+    <div style="font-size:16px; line-height:1.5; margin-bottom:20px;">
+    This figure displays the overall sales trend combining all products.  
+    Monitoring total sales helps Indian business owners see bigger market movements, spot growth opportunities, and plan long-term strategies to stay competitive. It lets you trace your sales evolution month-by-month or week-by-week. Instantly spot patterns, dips, and peaks to shape better decisions. Use it to evaluate past campaigns, budget effectively, or boost your pitch decks with real numbers. It's not just a chart — it's a growth compass.
+    </div>
+    """, unsafe_allow_html=True)